@@ -12,7 +12,7 @@
 ║  • Highscore-System                                              ║
 ║  • Speichern/Laden                                               ║
 ║  • Animationen & Partikeleffekte                                 ║
-║  • Forschungs-Baum                                               ║
+║  • Forschungs-Baum mit Warteschlange & mehreren Laboren          ║
 ║  • Zufallsereignisse                                             ║
 ╚══════════════════════════════════════════════════════════════════╝
 
@@ -26,6 +26,10 @@ Steuerung:
     R      - Forschung
     ESC    - Menü / Zurück
     1-5    - Personal einsetzen (wenn ausgewählt)
+    F7     - Rushhour (Stresstest mit Hunderten Kunden)
+
+Balance-Benchmark (ohne Fenster, alle Schwierigkeitsgrade parallel):
+  python Pizza_Imperium.py --benchmark [--stunden 2] [--seed 1] [--seeds 3] [--prozesse 4]
 """
 
 import pygame
@@ -34,11 +38,23 @@ import json
 import os
 import random
 import math
+import multiprocessing
+import queue
+import threading
 import time
 import datetime
+import weakref
+from array import array
+from collections import defaultdict, deque
+from itertools import islice
 from enum import Enum, auto
 from dataclasses import dataclass, field, asdict
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+
+try:
+    import numpy as np          # optional: vektorisiertes Kunden-Update
+except ImportError:
+    np = None
 
 # ═══════════════════════════════════════════════════════════════════
 #  KONSTANTEN & KONFIGURATION
@@ -47,10 +63,24 @@ from typing import Optional, List, Dict, Any
 SCREEN_W = 1280
 SCREEN_H = 720
 FPS = 60
+SIM_DT = 1 / FPS               # fester Zeitschritt der Headless-Simulation
 SAVE_FILE = "pizzeria_save.json"
-SCORES_FILE = "pizzeria_scores.json"
+SAVE_BACKUPS = 3               # pizzeria_save.json.1 … .3 (ältere Stände)
+AUTOSAVE_INTERVALL = 60.0      # Sekunden Spielzeit zwischen Autosaves
+SCORES_FILE = "pizzeria_scores.json"          # kompakter Top-N-Index
+SCORES_LOG = "pizzeria_scores.log"            # alle Ergebnisse, nur angehängt
+HIGHSCORE_TOP_N = 20                          # Einträge pro Rangliste
 TITLE = "Pizzeria Imperium"
 
+KUNDEN_SPEED = 120             # Pixel pro Sekunde
+RUSHHOUR_KUNDEN = 400          # Kundenlimit im Rushhour-Modus
+RUSHHOUR_INTERVALL = 0.05      # Sekunden zwischen zwei Kunden
+MAX_PARTIKEL = 1200            # feste Puffergröße des Partikelsystems
+PARTIKEL_LEBEN = 1.5           # maximale Lebensdauer eines Partikels (s)
+ALPHA_STUFEN = 16              # Helligkeitsstufen für gecachte Text-Sprites
+FORSCHUNG_PAUSE_ZUSTAENDE = ("pause", "highscore", "achievement",
+                             "forschung", "level_up", "ereignis")   # Labor läuft weiter
+
 # ─── Farben ───────────────────────────────────────────────────────
 C_BG         = (18,  18,  28)
 C_PANEL      = (28,  28,  45)
@@ -91,7 +121,7 @@ LEVELS = [
         "id": 0, "name": "Straßenstand",
         "ziel_geld": 500,
         "max_kunden": 3, "max_personal": 1,
-        "max_tische": 2, "ofen_slots": 1,
+        "max_tische": 2, "ofen_slots": 1, "labor_slots": 1,
         "unlock_text": "Starte dein Imperium!",
         "hintergrund": (25, 20, 15),
         "beschreibung": "Dein erster kleiner Pizzastand am Straßenrand."
@@ -100,7 +130,7 @@ LEVELS = [
         "id": 1, "name": "Kiosk",
         "ziel_geld": 2000,
         "max_kunden": 5, "max_personal": 2,
-        "max_tische": 4, "ofen_slots": 2,
+        "max_tische": 4, "ofen_slots": 2, "labor_slots": 1,
         "unlock_text": "Du hast deinen ersten Kiosk!",
         "hintergrund": (20, 25, 20),
         "beschreibung": "Ein kleiner Kiosk mit etwas mehr Platz."
@@ -109,7 +139,7 @@ LEVELS = [
         "id": 2, "name": "Imbiss",
         "ziel_geld": 6000,
         "max_kunden": 8, "max_personal": 3,
-        "max_tische": 6, "ofen_slots": 2,
+        "max_tische": 6, "ofen_slots": 2, "labor_slots": 1,
         "unlock_text": "Willkommen im Imbiss-Geschäft!",
         "hintergrund": (20, 20, 28),
         "beschreibung": "Ein richtiger Imbiss mit Sitzplätzen."
@@ -118,7 +148,7 @@ LEVELS = [
         "id": 3, "name": "Pizzeria",
         "ziel_geld": 20000,
         "max_kunden": 12, "max_personal": 4,
-        "max_tische": 10, "ofen_slots": 3,
+        "max_tische": 10, "ofen_slots": 3, "labor_slots": 2,
         "unlock_text": "Eine echte Pizzeria! Fantastisch!",
         "hintergrund": (28, 20, 20),
         "beschreibung": "Deine eigene Pizzeria mit vollem Betrieb."
@@ -127,7 +157,7 @@ LEVELS = [
         "id": 4, "name": "Restaurant",
         "ziel_geld": 60000,
         "max_kunden": 18, "max_personal": 5,
-        "max_tische": 15, "ofen_slots": 4,
+        "max_tische": 15, "ofen_slots": 4, "labor_slots": 2,
         "unlock_text": "Ein echtes Restaurant — beeindruckend!",
         "hintergrund": (15, 25, 25),
         "beschreibung": "Ein elegantes Restaurant der Spitzenklasse."
@@ -136,7 +166,7 @@ LEVELS = [
         "id": 5, "name": "Kette",
         "ziel_geld": 200000,
         "max_kunden": 25, "max_personal": 7,
-        "max_tische": 20, "ofen_slots": 5,
+        "max_tische": 20, "ofen_slots": 5, "labor_slots": 2,
         "unlock_text": "Deine eigene Restaurantkette!",
         "hintergrund": (25, 15, 28),
         "beschreibung": "Mehrere Filialen unter deiner Führung."
@@ -145,7 +175,7 @@ LEVELS = [
         "id": 6, "name": "Imperium",
         "ziel_geld": 1000000,
         "max_kunden": 35, "max_personal": 9,
-        "max_tische": 30, "ofen_slots": 7,
+        "max_tische": 30, "ofen_slots": 7, "labor_slots": 3,
         "unlock_text": "Das Pizzeria-Imperium ist deins!",
         "hintergrund": (25, 25, 15),
         "beschreibung": "Ein weltweites Pizza-Imperium!"
@@ -154,7 +184,7 @@ LEVELS = [
         "id": 7, "name": "Weltkonzern",
         "ziel_geld": 5000000,
         "max_kunden": 50, "max_personal": 12,
-        "max_tische": 50, "ofen_slots": 10,
+        "max_tische": 50, "ofen_slots": 10, "labor_slots": 3,
         "unlock_text": "Du bist der Pizza-König der Welt!",
         "hintergrund": (20, 20, 20),
         "beschreibung": "Der größte Pizzakonzern aller Zeiten!"
@@ -365,6 +395,10 @@ ACHIEVEMENTS = [
     {"id": "erste_krise",    "name": "Krisenprofi",          "beschreibung": "Dein erstes Ereignis überleben",         "icon": "💪", "xp": 25},
 ]
 
+# Multiplikatoren, die Power-Ups und Forschung gemeinsam beeinflussen
+EFFEKTE = ("backzeit_mult", "kunden_mult", "preis_mult", "geduld_mult",
+           "zutat_rabatt", "vip_mult", "personal_speed", "auto")
+
 # ─── Forschungs-Baum ──────────────────────────────────────────────
 FORSCHUNGEN = [
     {"id": "ofen1",        "name": "Schnellbackofen",    "kosten": 300,  "dauer": 30,  "voraus": [],
@@ -406,24 +440,6 @@ class Pizza:
     bestellt_von: int = -1   # Kunden-ID
     backzeit: float = 0.0
 
-@dataclass
-class Kunde:
-    id: int
-    pizza_name: str
-    geduld: float = 100.0
-    max_geduld: float = 100.0
-    bezahlt: bool = False
-    vip: bool = False
-    x: float = 0.0
-    y: float = 0.0
-    ziel_x: float = 0.0
-    ziel_y: float = 0.0
-    tisch_id: int = -1
-    animation_timer: float = 0.0
-    animation_phase: int = 0
-    ungeduldig: bool = False
-    emoji: str = "😊"
-
 @dataclass
 class Personal:
     id: int
@@ -437,18 +453,6 @@ class Personal:
     erfahrung: int = 0
     erschoepft: bool = False
 
-@dataclass
-class Partikel:
-    x: float
-    y: float
-    vx: float
-    vy: float
-    leben: float
-    max_leben: float
-    farbe: tuple
-    groesse: float
-    text: str = ""
-
 @dataclass
 class Benachrichtigung:
     text: str
@@ -468,6 +472,232 @@ class ForschungsFortschritt:
     verbleibend: float
     gesamt: float
 
+# ═══════════════════════════════════════════════════════════════════
+#  KUNDEN (STRUCT-OF-ARRAYS)
+# ═══════════════════════════════════════════════════════════════════
+
+STIMMUNG_EMOJI = (None, "😕", "😠")   # 0 = eigenes Emoji des Kunden
+
+def _spalte(typ: str, n: int):
+    if np is not None:
+        return np.zeros(n, dtype=np.float64 if typ == "d" else np.int64)
+    return array(typ, bytes(n * array(typ).itemsize))
+
+def _kunden_feld(spalte: str, conv):
+    return property(lambda self: conv(getattr(self._p, spalte)[self._i]))
+
+class Kunde:
+    """Sicht auf eine Zeile im KundenPuffer (nur lesend).
+
+    Die Sicht bleibt gültig, auch wenn der Kunde durch Swap-Remove den Index
+    wechselt oder den Laden verlässt (dann hält sie eine eigene Kopie).
+    """
+    __slots__ = ("_p", "_i")
+
+    def __init__(self, puffer: "KundenPuffer", index: int):
+        self._p = puffer
+        self._i = index
+
+    id = _kunden_feld("id", int)
+    tisch_id = _kunden_feld("tisch_id", int)
+    vip = _kunden_feld("vip", bool)
+    x = _kunden_feld("x", float)
+    y = _kunden_feld("y", float)
+    ziel_x = _kunden_feld("ziel_x", float)
+    ziel_y = _kunden_feld("ziel_y", float)
+    geduld = _kunden_feld("geduld", float)
+    max_geduld = _kunden_feld("max_geduld", float)
+    animation_timer = _kunden_feld("animation_timer", float)
+
+    @property
+    def pizza_name(self) -> str:
+        return self._p.pizza_name[self._i]
+
+    @property
+    def ungeduldig(self) -> bool:
+        return self._p.stimmung[self._i] == 2
+
+    @property
+    def emoji(self) -> str:
+        return STIMMUNG_EMOJI[self._p.stimmung[self._i]] or self._p.emoji[self._i]
+
+    def _abkoppeln(self):
+        """Zeile in einen eigenen Mini-Puffer kopieren (vor dem Entfernen)."""
+        kopie = KundenPuffer(1)
+        kopie._zeile_anhaengen(self._p, self._i, self)
+        self._p, self._i = kopie, 0
+
+class KundenPuffer:
+    """Alle Kunden als parallele Arrays (Position, Ziel, Geduld, Flags).
+
+    ``update`` bewegt alle Kunden und zieht Geduld in einem Schritt ab – mit
+    NumPy vektorisiert, sonst als einfache Schleife über ``array``-Spalten.
+    Abgänge werden per Swap-Remove entfernt: der letzte Kunde rückt in die
+    Lücke. Nach außen verhält sich der Puffer wie eine Liste von Kunde-Sichten.
+    """
+    FLOAT_SPALTEN = ("x", "y", "ziel_x", "ziel_y", "geduld", "max_geduld", "animation_timer")
+    INT_SPALTEN = ("id", "tisch_id", "vip", "stimmung")
+
+    def __init__(self, kapazitaet: int = 64):
+        self.n = 0
+        self.kapazitaet = 0
+        for name in self.FLOAT_SPALTEN:
+            setattr(self, name, _spalte("d", 0))
+        for name in self.INT_SPALTEN:
+            setattr(self, name, _spalte("q", 0))
+        self.pizza_name: List[str] = []
+        self.emoji: List[str] = []
+        self.sichten: List[Kunde] = []
+        self._wachsen(kapazitaet)
+
+    def _wachsen(self, kapazitaet: int):
+        extra = kapazitaet - self.kapazitaet
+        for name in self.FLOAT_SPALTEN + self.INT_SPALTEN:
+            alt = getattr(self, name)
+            neu = _spalte("d" if name in self.FLOAT_SPALTEN else "q", extra)
+            setattr(self, name, np.concatenate((alt, neu)) if np is not None else alt + neu)
+        self.kapazitaet = kapazitaet
+
+    # ── Listen-Verhalten für UI & Klicks ──
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        return iter(self.sichten)
+
+    def __getitem__(self, idx):
+        return self.sichten[idx]
+
+    def __contains__(self, kunde):
+        return isinstance(kunde, Kunde) and kunde._p is self
+
+    def tische(self) -> set:
+        """Menge der belegten Tisch-IDs."""
+        return {t for t in self.tisch_id[:self.n].tolist() if t >= 0}
+
+    # ── Spielstand ──
+    def zeilen(self) -> dict:
+        """Alle Spalten als frische Listen (für den Spielstand)."""
+        n = self.n
+        daten = {name: getattr(self, name)[:n].tolist()
+                 for name in self.FLOAT_SPALTEN + self.INT_SPALTEN}
+        daten["pizza_name"] = list(self.pizza_name)
+        daten["emoji"] = list(self.emoji)
+        return daten
+
+    @classmethod
+    def aus_zeilen(cls, daten: dict) -> "KundenPuffer":
+        n = len(daten["id"])
+        puffer = cls(max(64, n))
+        for name in cls.FLOAT_SPALTEN + cls.INT_SPALTEN:
+            spalte = getattr(puffer, name)
+            for i, wert in enumerate(daten[name]):
+                spalte[i] = wert
+        puffer.pizza_name = list(daten["pizza_name"])
+        puffer.emoji = list(daten["emoji"])
+        puffer.sichten = [Kunde(puffer, i) for i in range(n)]
+        puffer.n = n
+        return puffer
+
+    # ── Hinzufügen / Entfernen ──
+    def hinzufuegen(self, id: int, pizza_name: str, geduld: float, vip: bool,
+                    x: float, y: float, ziel_x: float, ziel_y: float,
+                    tisch_id: int, emoji: str) -> Kunde:
+        if self.n == self.kapazitaet:
+            self._wachsen(self.kapazitaet * 2)
+        i = self.n
+        self.x[i], self.y[i] = x, y
+        self.ziel_x[i], self.ziel_y[i] = ziel_x, ziel_y
+        self.geduld[i] = self.max_geduld[i] = geduld
+        self.animation_timer[i] = 0.0
+        self.id[i], self.tisch_id[i], self.vip[i], self.stimmung[i] = id, tisch_id, vip, 0
+        self.pizza_name.append(pizza_name)
+        self.emoji.append(emoji)
+        kunde = Kunde(self, i)
+        self.sichten.append(kunde)
+        self.n += 1
+        return kunde
+
+    def _zeile_anhaengen(self, quelle: "KundenPuffer", j: int, sicht: Kunde):
+        i = self.n
+        for name in self.FLOAT_SPALTEN + self.INT_SPALTEN:
+            getattr(self, name)[i] = getattr(quelle, name)[j]
+        self.pizza_name.append(quelle.pizza_name[j])
+        self.emoji.append(quelle.emoji[j])
+        self.sichten.append(sicht)
+        self.n += 1
+
+    def entfernen(self, kunde: Kunde):
+        """Kunden per Swap-Remove entfernen (O(1))."""
+        if kunde not in self:
+            return
+        i, last = kunde._i, self.n - 1
+        kunde._abkoppeln()
+        if i != last:
+            for name in self.FLOAT_SPALTEN + self.INT_SPALTEN:
+                spalte = getattr(self, name)
+                spalte[i] = spalte[last]
+            self.pizza_name[i] = self.pizza_name[last]
+            self.emoji[i] = self.emoji[last]
+            self.sichten[i] = self.sichten[last]
+            self.sichten[i]._i = i
+        self.pizza_name.pop()
+        self.emoji.pop()
+        self.sichten.pop()
+        self.n -= 1
+
+    # ── Simulation ──
+    def update(self, dt: float, geduld_abbau: float) -> List[Kunde]:
+        """Alle Kunden bewegen, Geduld abziehen; liefert die, die gehen wollen."""
+        n = self.n
+        if n == 0:
+            return []
+        if np is None:
+            return self._update_schleife(dt, geduld_abbau)
+
+        x, y = self.x[:n], self.y[:n]
+        dx = self.ziel_x[:n] - x
+        dy = self.ziel_y[:n] - y
+        d = np.hypot(dx, dy)
+        schritt = np.where(d > 2, KUNDEN_SPEED * dt / np.maximum(d, 1e-9), 0.0)
+        x += dx * schritt
+        y += dy * schritt
+
+        # Geduld nimmt nur am Tisch ab
+        geduld = self.geduld[:n]
+        geduld -= np.where(d < 10, dt * geduld_abbau, 0.0)
+        anteil = geduld / self.max_geduld[:n]
+        stimmung = np.where(anteil < 0.3, 2, np.where(anteil < 0.6, 1, 0))
+        np.maximum(self.stimmung[:n], stimmung, out=self.stimmung[:n])
+        self.animation_timer[:n] += dt
+
+        return [self.sichten[i] for i in np.flatnonzero(geduld <= 0).tolist()]
+
+    def _update_schleife(self, dt: float, geduld_abbau: float) -> List[Kunde]:
+        gehen = []
+        x, y, zx, zy = self.x, self.y, self.ziel_x, self.ziel_y
+        geduld, max_geduld, stimmung = self.geduld, self.max_geduld, self.stimmung
+        abbau = dt * geduld_abbau
+        for i in range(self.n):
+            dx = zx[i] - x[i]
+            dy = zy[i] - y[i]
+            d = math.sqrt(dx * dx + dy * dy)
+            if d > 2:
+                f = KUNDEN_SPEED * dt / d
+                x[i] += dx * f
+                y[i] += dy * f
+            if d < 10:
+                geduld[i] -= abbau
+            anteil = geduld[i] / max_geduld[i]
+            if anteil < 0.3:
+                stimmung[i] = 2
+            elif anteil < 0.6 and stimmung[i] < 1:
+                stimmung[i] = 1
+            self.animation_timer[i] += dt
+            if geduld[i] <= 0:
+                gehen.append(self.sichten[i])
+        return gehen
+
 # ═══════════════════════════════════════════════════════════════════
 #  SPIELZUSTAND
 # ═══════════════════════════════════════════════════════════════════
@@ -480,6 +710,8 @@ class GameState:
         self.geld: float = 100.0
         self.level: int = 0
         self.gesamt_verdient: float = 0.0
+        self.pizza_umsatz: float = 0.0           # davon Verkäufe
+        self.ereignis_einnahmen: float = 0.0     # davon Zufallsereignisse
         self.pizzen_gebacken: int = 0
         self.kunden_bedient: int = 0
         self.kunden_verloren: int = 0
@@ -488,6 +720,9 @@ class GameState:
         self.schwierigkeit: str = "Normal"
         self.achievements_erhalten: list = []
         self.forschungen_abgeschlossen: list = []
+        self.forschung_labor: list = []          # [id, verbleibend, gesamt] je Labor
+        self.forschung_warteschlange: list = []
+        self.gespeichert_um: float = 0.0         # time.time() beim Speichern
         self.freigeschaltete_pizzen: list = ["Margherita", "Salami"]
         self.powerups_benutzt: int = 0
         self.ereignisse_erlebt: int = 0
@@ -509,6 +744,8 @@ class GameState:
             "geld": self.geld,
             "level": self.level,
             "gesamt_verdient": self.gesamt_verdient,
+            "pizza_umsatz": self.pizza_umsatz,
+            "ereignis_einnahmen": self.ereignis_einnahmen,
             "pizzen_gebacken": self.pizzen_gebacken,
             "kunden_bedient": self.kunden_bedient,
             "kunden_verloren": self.kunden_verloren,
@@ -517,16 +754,23 @@ class GameState:
             "schwierigkeit": self.schwierigkeit,
             "achievements_erhalten": self.achievements_erhalten,
             "forschungen_abgeschlossen": self.forschungen_abgeschlossen,
+            "forschung_labor": self.forschung_labor,
+            "forschung_warteschlange": self.forschung_warteschlange,
+            "gespeichert_um": self.gespeichert_um,
             "freigeschaltete_pizzen": self.freigeschaltete_pizzen,
             "powerups_benutzt": self.powerups_benutzt,
             "ereignisse_erlebt": self.ereignisse_erlebt,
             "vip_kunden_bedient": self.vip_kunden_bedient,
+            "fehler_serie": self.fehler_serie,
             "perfekte_serie": self.perfekte_serie,
             "combo": self.combo,
             "max_combo": self.max_combo,
             "xp": self.xp,
             "spieltage": self.spieltage,
             "rabatt_kaeufe": self.rabatt_kaeufe,
+            "minuten_umsatz": self.minuten_umsatz,
+            "minuten_timer": self.minuten_timer,
+            "max_minuten_umsatz": self.max_minuten_umsatz,
             "datum_gestartet": self.datum_gestartet,
         }
 
@@ -535,6 +779,235 @@ class GameState:
             if hasattr(self, k):
                 setattr(self, k, v)
 
+# ═══════════════════════════════════════════════════════════════════
+#  SPEICHERSTAND (ATOMAR, HINTERGRUND-THREAD)
+# ═══════════════════════════════════════════════════════════════════
+
+SPEICHER_FORMAT = 2   # 1 = nur GameState.zu_dict(), 2 = kompletter Snapshot
+
+def schreibe_atomar(pfad: str, daten: bytes, backups: int = 0):
+    """Über Temp-Datei + fsync + rename schreiben (nie halb geschrieben).
+
+    Die bisherige Datei rückt vorher in die Backup-Kette ``pfad.1`` …
+    ``pfad.N``; der älteste Stand fällt heraus.
+    """
+    tmp = f"{pfad}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(daten)
+        f.flush()
+        os.fsync(f.fileno())
+    if backups > 0 and os.path.exists(pfad):
+        for nr in range(backups - 1, 0, -1):
+            if os.path.exists(f"{pfad}.{nr}"):
+                os.replace(f"{pfad}.{nr}", f"{pfad}.{nr + 1}")
+        os.replace(pfad, f"{pfad}.1")
+    os.replace(tmp, pfad)
+
+def spielstand_pfade(pfad: str = SAVE_FILE, backups: int = SAVE_BACKUPS) -> list:
+    return [pfad] + [f"{pfad}.{nr}" for nr in range(1, backups + 1)]
+
+def spielstand_vorhanden(pfad: str = SAVE_FILE) -> bool:
+    return any(os.path.exists(p) for p in spielstand_pfade(pfad))
+
+# Was ein kaputter oder unvollständiger Snapshot beim Einlesen werfen kann
+SNAPSHOT_FEHLER = (KeyError, IndexError, TypeError, ValueError, AttributeError)
+
+def lade_spielstand(pfad: str = SAVE_FILE, pruefen=None):
+    """Neuesten lesbaren Spielstand laden: (Daten, Pfad) oder (None, Fehler).
+
+    ``pruefen`` bekommt eine eigene Kopie der Daten; wirft es, ist das
+    nächste Backup dran.
+    """
+    fehler = None
+    for kandidat in spielstand_pfade(pfad):
+        try:
+            with open(kandidat, "r", encoding="utf-8") as f:
+                text = f.read()
+            daten = json.loads(text)
+            if pruefen is not None:
+                pruefen(json.loads(text))
+            return daten, kandidat
+        except FileNotFoundError:
+            continue
+        except (OSError, *SNAPSHOT_FEHLER) as e:
+            fehler = e   # defekt → nächstes Backup versuchen
+    return None, fehler
+
+class SpeicherSchreiber(threading.Thread):
+    """Schreibt Snapshots im Hintergrund: JSON kodieren, atomar ersetzen.
+
+    Der Frame-Thread übergibt mit ``auftrag`` nur frisch gebaute Daten (siehe
+    ``PizzeriaSimulation.snapshot``). Liegen für eine Datei mehrere Aufträge
+    an, gewinnt der neueste. Fehler landen in ``letzter_fehler``.
+    """
+
+    def __init__(self, backups: int = SAVE_BACKUPS):
+        super().__init__(daemon=True)
+        self.backups = backups
+        self._auftraege: "queue.Queue[str]" = queue.Queue()
+        self._offen: Dict[str, Tuple[dict, int]] = {}   # Pfad → (Snapshot, Backups)
+        self._lock = threading.Lock()
+        self.letzter_fehler: Optional[Exception] = None
+        self.start()
+
+    def auftrag(self, pfad: str, snapshot: dict, backups: Optional[int] = None):
+        with self._lock:
+            neu = pfad not in self._offen
+            self._offen[pfad] = (snapshot, self.backups if backups is None else backups)
+        if neu:
+            self._auftraege.put(pfad)
+
+    def flush(self):
+        """Warten, bis alle Aufträge geschrieben sind."""
+        self._auftraege.join()
+
+    def run(self):
+        while True:
+            pfad = self._auftraege.get()
+            with self._lock:
+                snapshot, backups = self._offen.pop(pfad, (None, 0))
+            try:
+                if snapshot is not None:
+                    daten = json.dumps(snapshot, ensure_ascii=False, separators=(",", ":"))
+                    schreibe_atomar(pfad, daten.encode("utf-8"), backups)
+            except (OSError, TypeError, ValueError) as e:
+                self.letzter_fehler = e
+            finally:
+                self._auftraege.task_done()
+
+# ═══════════════════════════════════════════════════════════════════
+#  HIGHSCORES (LOG + TOP-N-INDEX)
+# ═══════════════════════════════════════════════════════════════════
+
+HIGHSCORE_ALLE = "Alle"
+
+class HighscoreSpeicher:
+    """Highscores als Append-only-Log mit kompaktem Top-N-Index.
+
+    Jedes Ergebnis wird als eine JSON-Zeile an ``SCORES_LOG`` angehängt.
+    ``SCORES_FILE`` enthält nur die sortierten Ranglisten (gesamt und je
+    Schwierigkeitsgrad) plus die Log-Position, bis zu der sie gelten. Beim
+    Start wird nur der Log-Rest dahinter nachgespielt; ein Eintrag kostet
+    also unabhängig von der Log-Länge O(top_n). Der Index wird über den
+    SpeicherSchreiber (falls vorhanden) im Hintergrund geschrieben.
+    """
+
+    def __init__(self, log_pfad: str = SCORES_LOG, index_pfad: str = SCORES_FILE,
+                 top_n: int = HIGHSCORE_TOP_N,
+                 schreiber: Optional[SpeicherSchreiber] = None):
+        self.log_pfad = log_pfad
+        self.index_pfad = index_pfad
+        self.top_n = top_n
+        self.schreiber = schreiber
+        self.ranglisten: Dict[str, list] = defaultdict(list)
+        self.anzahl = 0
+        self.log_ende = 0
+        self.version = 0
+        self._laden()
+
+    def rangliste(self, schwierigkeit: str = HIGHSCORE_ALLE) -> list:
+        return self.ranglisten.get(schwierigkeit, [])
+
+    def __len__(self):
+        return self.anzahl
+
+    def eintragen(self, eintrag: dict):
+        zeile = (json.dumps(eintrag, ensure_ascii=False) + "\n").encode("utf-8")
+        try:
+            with open(self.log_pfad, "ab") as f:
+                f.write(zeile)
+            self.log_ende += len(zeile)
+        except OSError:
+            pass   # Rangliste im Speicher trotzdem aktualisieren
+        if self._einsortieren(eintrag):
+            self._index_schreiben()
+
+    # ── intern ──
+    def _einsortieren(self, eintrag: dict) -> bool:
+        """In Gesamt- und Schwierigkeits-Rangliste einfügen; True bei Änderung."""
+        self.anzahl += 1
+        geaendert = False
+        geld = eintrag.get("geld", 0)
+        for name in (HIGHSCORE_ALLE, eintrag.get("schwierigkeit", "?")):
+            liste = self.ranglisten[name]
+            if len(liste) >= self.top_n and geld <= liste[-1].get("geld", 0):
+                continue
+            pos = next((i for i, e in enumerate(liste) if e.get("geld", 0) < geld), len(liste))
+            liste.insert(pos, eintrag)
+            del liste[self.top_n:]
+            geaendert = True
+        if geaendert:
+            self.version += 1
+        return geaendert
+
+    def _laden(self):
+        try:
+            with open(self.index_pfad, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = None
+
+        if isinstance(index, list):
+            # Altes Format: nur die Top-20-Liste → als Start des Logs übernehmen
+            if not os.path.exists(self.log_pfad):
+                for eintrag in index:
+                    self.eintragen(eintrag)
+                self._index_schreiben()
+                return
+            index = None
+
+        if isinstance(index, dict) and index.get("top_n") == self.top_n:
+            self.ranglisten.update(index.get("ranglisten", {}))
+            self.anzahl = index.get("anzahl", 0)
+            self.log_ende = index.get("log_ende", 0)
+        nachgespielt = self._log_nachspielen()
+        if nachgespielt:
+            self._index_schreiben()
+
+    def _log_nachspielen(self) -> int:
+        """Log-Einträge hinter ``log_ende`` übernehmen (nach Absturz o. ä.)."""
+        try:
+            with open(self.log_pfad, "rb") as f:
+                f.seek(self.log_ende)
+                rest = f.read()
+        except OSError:
+            self.log_ende = 0
+            return 0
+        vollstaendig = rest[:rest.rfind(b"\n") + 1]
+        if len(vollstaendig) < len(rest):
+            # halb geschriebene letzte Zeile abschneiden, sonst klebt die nächste dran
+            try:
+                with open(self.log_pfad, "r+b") as f:
+                    f.truncate(self.log_ende + len(vollstaendig))
+            except OSError:
+                pass
+        n = 0
+        for zeile in vollstaendig.splitlines():
+            try:
+                self._einsortieren(json.loads(zeile))
+                n += 1
+            except ValueError:
+                continue
+        self.log_ende += len(vollstaendig)
+        return n
+
+    def _index_schreiben(self):
+        index = {
+            "format": 2,
+            "top_n": self.top_n,
+            "anzahl": self.anzahl,
+            "log_ende": self.log_ende,
+            "ranglisten": {name: list(liste) for name, liste in self.ranglisten.items()},
+        }
+        if self.schreiber is not None:
+            self.schreiber.auftrag(self.index_pfad, index, backups=0)
+            return
+        try:
+            schreibe_atomar(self.index_pfad,
+                            json.dumps(index, ensure_ascii=False).encode("utf-8"))
+        except OSError:
+            pass
+
 # ═══════════════════════════════════════════════════════════════════
 #  HILFSFUNKTIONEN
 # ═══════════════════════════════════════════════════════════════════
@@ -560,11 +1033,26 @@ def fmt_zeit(sek: float) -> str:
     s = int(sek) % 60
     return f"{m:02d}:{s:02d}"
 
+_ALPHA_POOL: Dict[tuple, Any] = {}   # (Breite, Höhe, Farbe, Alpha, Radius) → Surface
+
+def alpha_flaeche(breite: int, hoehe: int, farbe, alpha: int, radius: int = 0):
+    """Halbtransparentes (abgerundetes) Rechteck aus dem Pool – einmal gezeichnet,
+    danach nur noch geblittet."""
+    schluessel = (breite, hoehe, tuple(farbe[:3]), alpha, radius)
+    flaeche = _ALPHA_POOL.get(schluessel)
+    if flaeche is None:
+        if len(_ALPHA_POOL) >= 256:
+            _ALPHA_POOL.clear()
+        flaeche = pygame.Surface((breite, hoehe), pygame.SRCALPHA)
+        pygame.draw.rect(flaeche, (*farbe[:3], alpha), (0, 0, breite, hoehe),
+                         border_radius=radius)
+        _ALPHA_POOL[schluessel] = flaeche
+    return flaeche
+
 def zeichne_rect_rund(surf, farbe, rect, radius=8, alpha=255):
     if alpha < 255:
-        s = pygame.Surface((rect[2], rect[3]), pygame.SRCALPHA)
-        pygame.draw.rect(s, (*farbe, alpha), (0, 0, rect[2], rect[3]), border_radius=radius)
-        surf.blit(s, (rect[0], rect[1]))
+        surf.blit(alpha_flaeche(int(rect[2]), int(rect[3]), farbe, alpha, radius),
+                  (rect[0], rect[1]))
     else:
         pygame.draw.rect(surf, farbe, rect, border_radius=radius)
 
@@ -586,6 +1074,183 @@ def zeichne_balken(surf, x, y, w, h, wert, max_wert, farbe_voll, farbe_leer=C_DA
     if border:
         pygame.draw.rect(surf, C_DARKGRAY, (x, y, w, h), 1, border_radius=4)
 
+class Ebenen:
+    """Vorgezeichnete Leinwand-Bereiche und Sprite-Zwischenspeicher für den Compositor."""
+
+    def __init__(self, groesse, max_sprites: int = 1024):
+        self.leinwand = pygame.Surface(groesse)
+        self.voll = True
+        self._bereiche: Dict[Any, tuple] = {}
+        self._neu: List[Any] = []      # seit dem letzten auftragen() neu gezeichnet
+        self._bewegt: List[Any] = []   # bewegliche Teile seit dem letzten auftragen()
+        self.sprites: Dict[Any, Any] = {}   # Schlüssel → Surface (sprite, text) bzw. Tupel (figur)
+        self.max_sprites = max_sprites
+
+    def bereich(self, name, schluessel, rect, zeichnen) -> bool:
+        """Liefert True, wenn der Bereich neu gezeichnet wurde."""
+        eintrag = self._bereiche.get(name)
+        if eintrag is not None and eintrag[0] == schluessel:
+            return False
+        rect = pygame.Rect(rect)
+        zeichnen(self.leinwand.subsurface(rect))
+        for anderer, (_, r) in list(self._bereiche.items()):
+            if anderer != name and rect.contains(r):
+                del self._bereiche[anderer]
+        self._bereiche[name] = (schluessel, rect)
+        self._neu.append(rect)
+        return True
+
+    def auftragen(self, ziel):
+        if self.voll:
+            ziel.blit(self.leinwand, (0, 0))
+        else:
+            # Leere Rechtecke liefert blit() für Figuren außerhalb des Clips
+            rects = [r for r in self._neu + self._bewegt if r]
+            if len(rects) > 64:   # Rush-Hour: ein Blit über alles ist billiger
+                rects = [rects[0].unionall(rects[1:])]
+            for r in rects:
+                ziel.blit(self.leinwand, r, r)
+        self.voll = False
+        self._neu = []
+        self._bewegt = []
+
+    def bewegt(self, *rects):
+        """Bildschirm-Rechtecke merken, die im nächsten Frame zu restaurieren sind."""
+        self._bewegt.extend(rects)
+
+    def neu_gezeichnet(self, *rects):
+        """Leinwand-Rechtecke merken, die außerhalb von ``bereich`` geändert wurden."""
+        self._neu.extend(rects)
+
+    def sprite(self, schluessel, groesse, zeichnen):
+        flaeche = self.sprites.get(schluessel)
+        if flaeche is None:
+            self._platz_machen()
+            flaeche = pygame.Surface(groesse, pygame.SRCALPHA)
+            zeichnen(flaeche)
+            # Sprites ändern sich nach dem Zeichnen nie mehr – RLE überspringt
+            # beim Blitten die transparenten Pixel
+            flaeche.set_alpha(255, pygame.RLEACCEL)
+            self.sprites[schluessel] = flaeche
+        return flaeche
+
+    def figur(self, schluessel, groesse, anker, zeichnen):
+        """Wie ``sprite``, aber zugeschnitten: (Surface, dx, dy), ``anker`` liegt bei (x, y)."""
+        eintrag = self.sprites.get(schluessel)
+        if eintrag is None:
+            self._platz_machen()
+            flaeche = pygame.Surface(groesse, pygame.SRCALPHA)
+            zeichnen(flaeche)
+            sichtbar = flaeche.get_bounding_rect()
+            flaeche = flaeche.subsurface(sichtbar).copy()
+            flaeche.set_alpha(255, pygame.RLEACCEL)
+            eintrag = (flaeche, sichtbar.x - anker[0], sichtbar.y - anker[1])
+            self.sprites[schluessel] = eintrag
+        return eintrag
+
+    def _platz_machen(self):
+        """Bei vollem Speicher das älteste Viertel verwerfen. Alles auf einmal
+        zu leeren hieße, jeden Kunden im selben Frame neu zu rendern."""
+        if len(self.sprites) >= self.max_sprites:
+            for schluessel in list(islice(self.sprites, self.max_sprites // 4)):
+                del self.sprites[schluessel]
+
+    def text(self, surf, text, x, y, font, farbe=C_WHITE, center=False):
+        """Wie zeichne_text, aber mit gecachtem Render."""
+        schluessel = ("text", font, text, farbe)
+        rendered = self.sprites.get(schluessel)
+        if rendered is None:
+            self._platz_machen()
+            rendered = font.render(text, True, farbe)
+            self.sprites[schluessel] = rendered
+        return surf.blit(rendered, (x - rendered.get_width() // 2 if center else x, y))
+
+class Figurenschicht:
+    """Ruhende Figuren in einen Leinwand-Bereich einbrennen, nur bewegte jeden Frame blitten."""
+
+    # Laufende Kunden bleiben bei hoher Framerate auch mal einen Frame auf
+    # demselben Pixel stehen – erst danach einbrennen
+    ruhe_frames = 4
+
+    def __init__(self, ebenen: Ebenen, rect, aenderung=None):
+        self.ebenen = ebenen
+        self.rect = pygame.Rect(rect)
+        self.aenderung = aenderung
+        self.boden = None                      # der Bereich ohne Figuren
+        self.figuren: Dict[Any, tuple] = {}    # eingebrannt: Schlüssel → ((Sprite, Pos), Rect)
+        self._vorher: Dict[Any, tuple] = {}    # letzter Frame: Schlüssel → (Sprite, Pos)
+        self._ruhe: Dict[Any, int] = {}        # Schlüssel → Frames unverändert, noch nicht eingebrannt
+
+    def neuer_boden(self):
+        """Nach dem Neuzeichnen des Bereichs: Boden sichern, Figuren wieder einbrennen."""
+        leinwand = self.ebenen.leinwand
+        self.boden = leinwand.subsurface(self.rect).copy()
+        leinwand.blits([stand for stand, _ in self.figuren.values()], doreturn=False)
+
+    def aktualisieren(self, figuren) -> List[tuple]:
+        """``figuren``: (Schlüssel, (Sprite, Pos)) in Zeichenreihenfolge.
+
+        Liefert die beweglichen Figuren als (Sprite, Pos) für ``blits``."""
+        eingebrannt, vorher = self.figuren, self._vorher
+        beweglich = []
+        neu = []
+        flicken = []
+        bereich = self.rect
+        eingebrannt_get, vorher_get, bewegen = eingebrannt.get, vorher.get, beweglich.append
+        ruhe, ruhe_get = {}, self._ruhe.get
+        for schluessel, stand in figuren:
+            alt = eingebrannt_get(schluessel)
+            if alt is not None:
+                if alt[0] == stand:
+                    continue
+                rect = alt[1]
+                if alt[0][1] == stand[1]:   # neues Bild an derselben Stelle
+                    teil = self.aenderung and self.aenderung(alt[0][0], stand[0])
+                    if teil:
+                        eingebrannt[schluessel] = (stand, rect)
+                        flicken.append(teil.move(rect.topleft))
+                        continue
+                    neu_rect = stand[0].get_rect(topleft=stand[1])
+                    if bereich.contains(neu_rect):
+                        eingebrannt[schluessel] = (stand, neu_rect)
+                        flicken.append(rect.union(neu_rect))
+                        continue
+                del eingebrannt[schluessel]
+                flicken.append(rect)
+            elif vorher_get(schluessel) == stand:
+                frames = ruhe_get(schluessel, 1) + 1
+                if frames >= self.ruhe_frames:
+                    rect = stand[0].get_rect(topleft=stand[1])
+                    if bereich.contains(rect):
+                        neu.append((schluessel, stand, rect))
+                        continue
+                ruhe[schluessel] = frames
+            bewegen(stand)
+        self._vorher = jetzt = dict(figuren)
+        self._ruhe = ruhe
+        if len(jetzt) < len(eingebrannt) + len(neu) + len(beweglich):
+            for schluessel in eingebrannt.keys() - jetzt.keys():
+                flicken.append(eingebrannt.pop(schluessel)[1])
+
+        leinwand = self.ebenen.leinwand
+        if flicken:
+            stapel = [stand for stand, _ in eingebrannt.values()]
+            rects = [r for _, r in eingebrannt.values()]
+            versatz = (-bereich.x, -bereich.y)
+            for r in flicken:
+                leinwand.set_clip(r)
+                leinwand.blit(self.boden, r, r.move(versatz))
+                leinwand.blits([stapel[i] for i in r.collidelistall(rects)], doreturn=False)
+            leinwand.set_clip(None)
+            self.ebenen.neu_gezeichnet(*flicken)
+        if neu:
+            # Neue ruhende Figuren liegen oben auf dem Stapel
+            for schluessel, stand, rect in neu:
+                eingebrannt[schluessel] = (stand, rect)
+            leinwand.blits([stand for _, stand, _ in neu], doreturn=False)
+            self.ebenen.neu_gezeichnet(*[rect for *_, rect in neu])
+        return beweglich
+
 # ═══════════════════════════════════════════════════════════════════
 #  BUTTON-KLASSE
 # ═══════════════════════════════════════════════════════════════════
@@ -604,6 +1269,7 @@ class Button:
         self.hover = False
         self.press_anim = 0.0
         self.glow = 0.0
+        self._bild: Optional[tuple] = None   # (Schlüssel, Surface, Versatz)
 
     def update(self, dt):
         if self.hover:
@@ -621,16 +1287,37 @@ class Button:
         r = pygame.Rect(self.rect.x, self.rect.y + offset,
                         self.rect.w, self.rect.h)
 
-        zeichne_rect_rund(surf, glow_farbe, r, radius=8)
-        if self.hover and self.aktiv:
-            zeichne_rect_rund(surf, C_WHITE, r, radius=8)
-            pygame.draw.rect(surf, C_WHITE, r, 2, border_radius=8)
-
         content = f"{self.icon} {self.text}" if self.icon else self.text
+        schluessel = (glow_farbe, self.hover and self.aktiv, content, font, self.aktiv, r.size)
+        if self._bild is None or self._bild[0] != schluessel:
+            self._bild = (schluessel, *self._rendern(font, content, glow_farbe))
+        _, bild, (ox, oy) = self._bild
+        return surf.blit(bild, (r.x - ox, r.y - oy))
+
+    def _rendern(self, font, content, glow_farbe):
+        """Button-Bild einmal vorzeichnen; der Text darf über den Rand ragen."""
         txt_surf = font.render(content, True, C_WHITE if self.aktiv else C_GRAY)
+        w = max(self.rect.w, txt_surf.get_width())
+        h = max(self.rect.h, txt_surf.get_height())
+        ox, oy = (w - self.rect.w) // 2, (h - self.rect.h) // 2
+        bild = pygame.Surface((w, h), pygame.SRCALPHA)
+        r = pygame.Rect(ox, oy, self.rect.w, self.rect.h)
+
+        zeichne_rect_rund(bild, glow_farbe, r, radius=8)
+        if self.hover and self.aktiv:
+            zeichne_rect_rund(bild, C_WHITE, r, radius=8)
+            pygame.draw.rect(bild, C_WHITE, r, 2, border_radius=8)
+
         tx = r.centerx - txt_surf.get_width() // 2
         ty = r.centery - txt_surf.get_height() // 2
-        surf.blit(txt_surf, (tx, ty))
+        bild.blit(txt_surf, (tx, ty))
+        bild.set_alpha(255, pygame.RLEACCEL)
+        return bild, (ox, oy)
+
+    def ansicht(self) -> tuple:
+        """Alles, wovon das gezeichnete Bild abhängt (für Ebenen-Schlüssel)."""
+        return (self.text, self.icon, self.farbe, self.aktiv, self.hover,
+                int(40 * self.glow), int(self.press_anim * 3))
 
     def check_hover(self, mpos):
         self.hover = self.rect.collidepoint(mpos)
@@ -646,57 +1333,362 @@ class Button:
 # ═══════════════════════════════════════════════════════════════════
 
 class PartikelSystem:
-    def __init__(self):
-        self.partikel: list[Partikel] = []
+    """Partikel in einem festen Puffer paralleler Arrays.
+
+    Lebende Partikel liegen in den Indizes 0..n-1. ``update`` bewegt alle in
+    einem Schritt (mit NumPy vektorisiert) und schiebt die überlebenden nach
+    vorne; ist der Puffer voll, werden neue Partikel verworfen. Texte werden
+    pro (Text, Farbe, Helligkeitsstufe) nur einmal gerendert.
+    """
+    FLOAT_SPALTEN = ("x", "y", "vx", "vy", "leben", "groesse")
+
+    def __init__(self, kapazitaet: int = MAX_PARTIKEL):
+        self.kapazitaet = kapazitaet
+        self.n = 0
+        for name in self.FLOAT_SPALTEN:
+            setattr(self, name, _spalte("d", kapazitaet))
+        self.farbe: list = [None] * kapazitaet
+        self.text: list = [""] * kapazitaet
+        self.sprites: Dict[tuple, Any] = {}
+        self.farbstufen: Dict[tuple, tuple] = {}
+
+    def __len__(self):
+        return self.n
+
+    def _neu(self, x, y, vx, vy, leben, farbe, groesse, text=""):
+        i = self.n
+        if i >= self.kapazitaet:
+            return
+        self.x[i], self.y[i], self.vx[i], self.vy[i] = x, y, vx, vy
+        self.leben[i], self.groesse[i] = leben, groesse
+        self.farbe[i] = farbe
+        self.text[i] = text
+        self.n = i + 1
 
     def add(self, x, y, farbe, anzahl=8, text="", geschwindigkeit=80):
         for _ in range(anzahl):
             winkel = random.uniform(0, math.tau)
             speed = random.uniform(20, geschwindigkeit)
-            self.partikel.append(Partikel(
-                x=x, y=y,
-                vx=math.cos(winkel) * speed,
-                vy=math.sin(winkel) * speed,
-                leben=random.uniform(0.5, 1.5),
-                max_leben=1.5,
-                farbe=farbe,
-                groesse=random.uniform(2, 6),
-            ))
+            self._neu(x, y, math.cos(winkel) * speed, math.sin(winkel) * speed,
+                      random.uniform(0.5, 1.5), farbe, random.uniform(2, 6))
         if text:
-            self.partikel.append(Partikel(
-                x=x, y=y - 10,
-                vx=random.uniform(-20, 20),
-                vy=-60,
-                leben=1.5,
-                max_leben=1.5,
-                farbe=farbe,
-                groesse=0,
-                text=text,
-            ))
+            self._neu(x, y - 10, random.uniform(-20, 20), -60,
+                      PARTIKEL_LEBEN, farbe, 0, text)
+
+    def add_fallend(self, x, y, farbe, vy=80):
+        """Einzelnes Partikel, das nach unten fällt (Pizza-Regen im Intro)."""
+        self._neu(x, y, random.uniform(-20, 20), vy,
+                  random.uniform(0.5, 1.5), farbe, random.uniform(2, 6))
 
     def update(self, dt):
-        lebend = []
-        for p in self.partikel:
-            p.x += p.vx * dt
-            p.y += p.vy * dt
-            p.vy += 40 * dt
-            p.leben -= dt
-            if p.leben > 0:
-                lebend.append(p)
-        self.partikel = lebend
+        n = self.n
+        if n == 0:
+            return
+        if np is None:
+            self._update_schleife(dt)
+            return
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.vy[:n] += 40 * dt
+        self.leben[:n] -= dt
+
+        lebend = self.leben[:n] > 0
+        if lebend.all():
+            return
+        idx = np.flatnonzero(lebend)
+        k = len(idx)
+        for name in self.FLOAT_SPALTEN:
+            spalte = getattr(self, name)
+            spalte[:k] = spalte[idx]
+        idx = idx.tolist()
+        self.farbe[:k] = [self.farbe[i] for i in idx]
+        self.text[:k] = [self.text[i] for i in idx]
+        self.n = k
+
+    def _update_schleife(self, dt):
+        x, y, vx, vy, leben = self.x, self.y, self.vx, self.vy, self.leben
+        i = 0
+        while i < self.n:
+            leben[i] -= dt
+            if leben[i] <= 0:
+                self._entfernen(i)
+                continue
+            x[i] += vx[i] * dt
+            y[i] += vy[i] * dt
+            vy[i] += 40 * dt
+            i += 1
+
+    def _entfernen(self, i):
+        """Partikel i durch den letzten lebenden ersetzen."""
+        last = self.n - 1
+        if i != last:
+            for spalte in [getattr(self, name) for name in self.FLOAT_SPALTEN] + [self.farbe, self.text]:
+                spalte[i] = spalte[last]
+        self.n = last
+
+    def _farbe(self, farbe, stufe):
+        key = (farbe, stufe)
+        gedimmt = self.farbstufen.get(key)
+        if gedimmt is None:
+            gedimmt = tuple(c * stufe // ALPHA_STUFEN for c in farbe)
+            self.farbstufen[key] = gedimmt
+        return gedimmt
+
+    def sprite(self, font, text, farbe, stufe):
+        """Gerenderter, abgedunkelter Text aus dem Cache."""
+        key = (text, farbe, stufe)
+        surf = self.sprites.get(key)
+        if surf is None:
+            if len(self.sprites) > 512:   # viele verschiedene Geldbeträge
+                self.sprites.clear()
+            surf = font.render(text, True, self._farbe(farbe, stufe))
+            self.sprites[key] = surf
+        return surf
 
     def zeichne(self, surf, font_klein):
-        for p in self.partikel:
-            alpha = p.leben / p.max_leben
-            if p.text:
-                surf_txt = font_klein.render(p.text, True,
-                    tuple(int(c * alpha) for c in p.farbe))
-                surf.blit(surf_txt, (int(p.x), int(p.y)))
-            else:
-                groesse = int(p.groesse * alpha)
-                if groesse > 0:
-                    farbe = tuple(int(c * alpha) for c in p.farbe)
-                    pygame.draw.circle(surf, farbe, (int(p.x), int(p.y)), groesse)
+        n = self.n
+        if n == 0:
+            return
+        if np is not None:
+            anteil = self.leben[:n] / PARTIKEL_LEBEN
+            stufen = np.ceil(anteil * ALPHA_STUFEN).astype(np.int64).tolist()
+            groessen = (self.groesse[:n] * anteil).astype(np.int64).tolist()
+            xs = self.x[:n].astype(np.int64).tolist()
+            ys = self.y[:n].astype(np.int64).tolist()
+        else:
+            stufen = [math.ceil(self.leben[i] / PARTIKEL_LEBEN * ALPHA_STUFEN) for i in range(n)]
+            groessen = [int(self.groesse[i] * self.leben[i] / PARTIKEL_LEBEN) for i in range(n)]
+            xs = [int(v) for v in self.x[:n]]
+            ys = [int(v) for v in self.y[:n]]
+
+        texte = []
+        for i in range(n):
+            text = self.text[i]
+            if text:
+                texte.append(surf.blit(self.sprite(font_klein, text, self.farbe[i], stufen[i]),
+                                       (xs[i], ys[i])))
+            elif groessen[i] > 0:
+                pygame.draw.circle(surf, self._farbe(self.farbe[i], stufen[i]),
+                                   (xs[i], ys[i]), groessen[i])
+        # Umriss aller Partikel (Kreise haben höchstens Radius 6)
+        x1, y1 = min(xs) - 7, min(ys) - 7
+        return pygame.Rect(x1, y1, max(xs) + 7 - x1, max(ys) + 7 - y1).unionall(texte)
+
+# ═══════════════════════════════════════════════════════════════════
+#  KÜCHEN-SCHEDULER
+# ═══════════════════════════════════════════════════════════════════
+
+class Kuechenplan:
+    """Ereignisgesteuerte Arbeitswarteschlangen für Öfen und Personal.
+
+    Statt dass jeder Mitarbeiter pro Frame Öfen × Kunden × fertige Pizzen
+    durchsucht, melden Kunden, Öfen und Pizzen ihre Zustandswechsel hier an.
+    Das Personal holt sich dann Aufträge per popleft:
+
+    * ``zu_backen``      – Pizzanamen, von denen mehr bestellt als gebacken wird
+    * ``freie_oefen``    – freie Ofen-Slots
+    * ``ofen_fertig``    – Slots mit fertiger Pizza (zum Herausholen)
+    * ``servierbereit``  – Pizzanamen, für die Pizza *und* Kunde bereitstehen
+
+    Pro Pizzasorte gibt es je eine FIFO-Schlange wartender Kunden und fertiger
+    Pizzen. Veraltete Einträge (gegangene Kunden, manuell belegte Öfen …)
+    werden beim Entnehmen übersprungen, jeder Einzelschritt ist also O(1)
+    amortisiert.
+    """
+
+    def __init__(self, ofen_slots: int = 0):
+        self.reset(ofen_slots)
+
+    def reset(self, ofen_slots: int):
+        self.wartende: Dict[str, deque] = defaultdict(deque)   # Pizza → Kunden
+        self.fertig: Dict[str, deque] = defaultdict(deque)     # Pizza → Pizzen
+        self.n_wartend: Dict[str, int] = defaultdict(int)
+        self.n_angebot: Dict[str, int] = defaultdict(int)      # im Ofen + fertig
+        self.kunden_ids: set = set()
+        self.pizza_ids: set = set()
+        self.zu_backen: deque = deque()
+        self.freie_oefen: deque = deque(range(ofen_slots))
+        self.ofen_fertig: deque = deque()
+        self.servierbereit: deque = deque()
+
+    def bedarf(self, name: str) -> int:
+        return self.n_wartend[name] - self.n_angebot[name]
+
+    def _bedarf_pruefen(self, name: str):
+        if self.bedarf(name) > 0:
+            self.zu_backen.append(name)
+
+    def _match_pruefen(self, name: str):
+        if self.n_wartend[name] > 0 and self.fertig[name]:
+            self.servierbereit.append(name)
+
+    # ── Ereignisse ──
+    def kunde_neu(self, kunde: Kunde):
+        self.kunden_ids.add(kunde.id)
+        self.wartende[kunde.pizza_name].append(kunde)
+        self.n_wartend[kunde.pizza_name] += 1
+        self._bedarf_pruefen(kunde.pizza_name)
+        self._match_pruefen(kunde.pizza_name)
+
+    def kunde_weg(self, kunde: Kunde):
+        if kunde.id in self.kunden_ids:
+            self.kunden_ids.discard(kunde.id)
+            self.n_wartend[kunde.pizza_name] -= 1
+
+    def ofen_belegt(self, pizza: Pizza):
+        self.n_angebot[pizza.name] += 1
+
+    def ofen_frei(self, slot: int):
+        self.freie_oefen.append(slot)
+
+    def pizza_gebacken(self, slot: int):
+        self.ofen_fertig.append(slot)
+
+    def pizza_weg(self, pizza: Pizza):
+        """Pizza ist verbrannt oder falsch serviert worden."""
+        self.pizza_ids.discard(id(pizza))
+        self.n_angebot[pizza.name] -= 1
+        self._bedarf_pruefen(pizza.name)
+
+    def pizza_fertig(self, pizza: Pizza):
+        self.pizza_ids.add(id(pizza))
+        self.fertig[pizza.name].append(pizza)
+        self._match_pruefen(pizza.name)
+
+    def serviert(self, pizza: Pizza, kunde: Kunde):
+        self.pizza_ids.discard(id(pizza))
+        self.n_angebot[pizza.name] -= 1
+        self.kunde_weg(kunde)
+        self._match_pruefen(pizza.name)
+
+    # ── Aufträge abholen ──
+    def naechste_bestellung(self) -> Optional[str]:
+        while self.zu_backen:
+            name = self.zu_backen.popleft()
+            if self.bedarf(name) > 0:
+                return name
+        return None
+
+    def naechster_ofen(self, oefen: list, frei: bool = True) -> int:
+        """Nächsten freien (bzw. mit fertiger Pizza belegten) Slot liefern, sonst -1."""
+        schlange = self.freie_oefen if frei else self.ofen_fertig
+        while schlange:
+            slot = schlange.popleft()
+            if slot >= len(oefen):
+                continue
+            pizza = oefen[slot]
+            if frei and pizza is None:
+                return slot
+            if not frei and pizza is not None and pizza.fertig:
+                return slot
+        return -1
+
+    def _kopf(self, schlange: deque, ids: set, key):
+        while schlange and key(schlange[0]) not in ids:
+            schlange.popleft()
+        return schlange[0] if schlange else None
+
+    def naechstes_paar(self):
+        """(Pizza, Kunde) für den Kellner, oder None."""
+        while self.servierbereit:
+            name = self.servierbereit.popleft()
+            pizza = self._kopf(self.fertig[name], self.pizza_ids, id)
+            kunde = self._kopf(self.wartende[name], self.kunden_ids, lambda k: k.id)
+            if pizza is not None and kunde is not None:
+                return pizza, kunde
+        return None
+
+# ═══════════════════════════════════════════════════════════════════
+#  FORSCHUNGS-INDEX
+# ═══════════════════════════════════════════════════════════════════
+
+class ForschungsIndex:
+    """Kompilierter Forschungs-Baum (DAG) mit Voraussetzungs-Auflösung.
+
+    * ``knoten``         – id → Eintrag aus FORSCHUNGEN
+    * ``reihenfolge``    – topologisch sortierte ids (Voraussetzungen zuerst,
+                           sonst Reihenfolge der Liste)
+    * ``abgeschlossen``  – Menge der erforschten ids
+    * ``verfuegbar``     – jetzt startbare ids in topologischer Reihenfolge
+
+    ``verfuegbar`` wird nur bei ``reset`` und ``abschliessen`` neu berechnet;
+    ``version`` zählt dabei hoch, damit die Oberfläche ihren Cache verwerfen
+    kann.
+    """
+
+    def __init__(self, forschungen: list = FORSCHUNGEN):
+        self.knoten: Dict[str, dict] = {}
+        for f in forschungen:
+            if f["id"] in self.knoten:
+                raise ValueError(f"Forschung {f['id']!r} doppelt definiert")
+            self.knoten[f["id"]] = f
+        self.kinder: Dict[str, list] = {fid: [] for fid in self.knoten}
+        for f in forschungen:
+            for v in f["voraus"]:
+                if v not in self.knoten:
+                    raise ValueError(f"{f['id']}: unbekannte Voraussetzung {v!r}")
+                self.kinder[v].append(f["id"])
+        self.reihenfolge = self._topologisch()
+        self.version = 0
+        self.reset()
+
+    def _topologisch(self) -> list:
+        # Tiefensuche in Listenreihenfolge: ein bereits gültiger Baum behält
+        # seine Anordnung (wichtig für das Raster im Forschungs-Screen).
+        reihenfolge, fertig, besucht = [], set(), set()
+        for start in self.knoten:
+            stapel = [(start, iter(self.knoten[start]["voraus"]))]
+            besucht.add(start)
+            while stapel:
+                fid, offen = stapel[-1]
+                v = next(offen, None)
+                if v is None:
+                    stapel.pop()
+                    if fid not in fertig:
+                        fertig.add(fid)
+                        reihenfolge.append(fid)
+                elif v not in fertig:
+                    if v in besucht:
+                        raise ValueError(f"Zyklus im Forschungs-Baum bei {v!r}")
+                    besucht.add(v)
+                    stapel.append((v, iter(self.knoten[v]["voraus"])))
+        return reihenfolge
+
+    def reset(self, abgeschlossen=()):
+        self.abgeschlossen: set = set()
+        self.fehlend: Dict[str, int] = {fid: len(set(f["voraus"]))
+                                        for fid, f in self.knoten.items()}
+        for fid in abgeschlossen:
+            self._eintragen(fid)
+        self._verfuegbar_neu()
+
+    def _eintragen(self, fid: str):
+        if fid in self.abgeschlossen or fid not in self.knoten:
+            return
+        self.abgeschlossen.add(fid)
+        for kind in self.kinder[fid]:
+            self.fehlend[kind] -= 1
+
+    def _verfuegbar_neu(self):
+        self.verfuegbar = [fid for fid in self.reihenfolge
+                           if self.fehlend[fid] <= 0 and fid not in self.abgeschlossen]
+        self.version += 1
+
+    def abschliessen(self, fid: str):
+        self._eintragen(fid)
+        self._verfuegbar_neu()
+
+    def get(self, fid: str) -> Optional[dict]:
+        return self.knoten.get(fid)
+
+    def __getitem__(self, fid: str) -> dict:
+        return self.knoten[fid]
+
+    def voraus_ok(self, fid: str) -> bool:
+        return self.fehlend.get(fid, 1) <= 0
+
+    def erforscht(self, fid: str) -> bool:
+        return fid in self.abgeschlossen
 
 # ═══════════════════════════════════════════════════════════════════
 #  NAMEN-GENERATOR FÜR PERSONAL
@@ -710,173 +1702,224 @@ NACHNAMEN = ["Rossi", "Ferrari", "Esposito", "Romano", "Colombo",
              "Ricci", "Marino", "Greco", "Bruno", "Gallo",
              "Conti", "De Luca", "Costa", "Giordano", "Mancini"]
 
-def zufalls_name():
-    return f"{random.choice(VORNAMEN)} {random.choice(NACHNAMEN)}"
+def zufalls_name(rng=random):
+    return f"{rng.choice(VORNAMEN)} {rng.choice(NACHNAMEN)}"
 
 # ═══════════════════════════════════════════════════════════════════
-#  HAUPT-SPIEL
+#  SIMULATIONS-KERN
 # ═══════════════════════════════════════════════════════════════════
 
-class PizzeriaImperium:
-    def __init__(self):
-        pygame.init()
-        pygame.display.set_caption(TITLE)
-        self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
-        self.clock = pygame.time.Clock()
+class PizzeriaSimulation:
+    """Spiellogik ohne Fenster: Kunden, Öfen, Personal, Forschung, Ereignisse, Gehalt.
 
-        # Fonts
-        self.font_titel  = pygame.font.SysFont("arial", 42, bold=True)
-        self.font_gross   = pygame.font.SysFont("arial", 28, bold=True)
-        self.font_normal  = pygame.font.SysFont("arial", 20)
-        self.font_klein   = pygame.font.SysFont("arial", 15)
-        self.font_winzig  = pygame.font.SysFont("arial", 12)
-        self.font_emoji   = pygame.font.SysFont("segoeui", 20)
+    Alle Zufallszahlen kommen aus ``self.rng`` – mit festem ``seed`` läuft eine
+    Simulation reproduzierbar ab. ``schritt`` rechnet einen festen Zeitschritt.
+    Benachrichtigungen, Partikel und Speichern sind nur Hooks; erst
+    PizzeriaImperium füllt sie mit Oberfläche.
+    """
 
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
         self.state = GameState()
-        self.partikel = PartikelSystem()
-        self.benachrichtigungen: list[Benachrichtigung] = []
+        self.screen_state = "spiel"
 
         # Spielobjekte
-        self.kunden: list[Kunde] = []
+        self.kunden = KundenPuffer()
         self.personal: list[Personal] = []
         self.pizzen_im_ofen: list[Optional[Pizza]] = []
         self.fertige_pizzen: list[Pizza] = []
         self.active_powerups: list[ActivePowerup] = []
-        self.aktive_forschung: Optional[ForschungsFortschritt] = None
+        self.labor: list[ForschungsFortschritt] = []
+        self.forschung_warteschlange: list[str] = []
+        self.forschung = ForschungsIndex()
+        self.kueche = Kuechenplan()
+        self.rushhour = False
+        self.ausgewaehlte_pizza = "Margherita"
+        self.tisch_positionen: list[tuple] = []
 
         # Zähler
         self.naechste_kunden_id = 0
         self.naechstes_personal_id = 0
         self.kunden_timer = 0.0
         self.gehalt_timer = 0.0
-        self.ereignis_timer = random.uniform(60, 120)
+        self.ereignis_timer = self.rng.uniform(60, 120)
+        self.stats_timer = 0.0
 
-        # Multiplier (Forschung)
-        self.mult_backzeit = 1.0
-        self.mult_geduld = 1.0
-        self.mult_kunden = 1.0
-        self.mult_preis = 1.0
+        # Multiplikatoren: Forschung × Power-Ups → modifikatoren
+        self.forschung_mod: Dict[str, float] = dict.fromkeys(EFFEKTE, 1.0)
+        self.powerup_mod: Dict[str, float] = dict.fromkeys(EFFEKTE, 1.0)
+        self.modifikatoren: Dict[str, float] = dict.fromkeys(EFFEKTE, 1.0)
         self.auto_system = False
 
-        # UI-Zustände
-        self.screen_state = "menu"   # menu, schwierigkeit, spiel, pause, highscore,
-                                     # achievement, forschung, game_over, level_up, ereignis
-        self.ausgewaehlter_personal = -1
-        self.ausgewaehlte_pizza = "Margherita"
-        self.hover_tooltip = ""
-
-        # Aktives Ereignis
+        # Aktives Ereignis / Level-Up
         self.aktuelles_ereignis: Optional[dict] = None
         self.ereignis_timer2 = 0.0
-
-        # Level-Up Animation
         self.level_up_timer = 0.0
-        self.level_up_partikel_timer = 0.0
-
-        # Hintergrund-Animation
-        self.bg_anim = 0.0
-        self.sterne = [(random.randint(0, SCREEN_W), random.randint(0, SCREEN_H),
-                        random.uniform(0.5, 2.0)) for _ in range(80)]
 
-        # Menu Buttons
-        self._init_menu_buttons()
+    # Skalare Laufzeit-Felder, die ein Snapshot 1:1 übernimmt
+    LAUFZEIT_FELDER = ("naechste_kunden_id", "naechstes_personal_id", "kunden_timer",
+                       "gehalt_timer", "ereignis_timer", "stats_timer", "ereignis_timer2",
+                       "level_up_timer", "rushhour", "ausgewaehlte_pizza")
 
-        # Highscores laden
-        self.highscores = self._lade_highscores()
-
-        # Speicherstand prüfen
-        self.speicherstand_vorhanden = os.path.exists(SAVE_FILE)
-
-        # Combo-Anzeige
-        self.combo_display_timer = 0.0
+    def neues_spiel(self, schwierigkeit: str = "Normal"):
+        self.state.reset()
+        self.state.schwierigkeit = schwierigkeit
+        self.labor = []
+        self.forschung_warteschlange = []
+        self._init_spiel()
+        self.screen_state = "spiel"
 
-        # Tisch-Positionen
-        self.tisch_positionen: list[tuple] = []
+    def schritt(self, dt: float = SIM_DT):
+        """Einen festen Simulationsschritt rechnen.
 
-        # Nachrichten-Queue
-        self.nachrichten_queue: list[tuple] = []
+        Level-Up- und Ereignis-Einblendungen pausieren headless nicht.
+        """
+        if self.screen_state in ("level_up", "ereignis"):
+            self.screen_state = "spiel"
+        if self.screen_state == "spiel":
+            self._update_spiel(dt)
 
-        # Statistik
-        self.stats_minute_geld = 0.0
-        self.stats_timer = 0.0
+    # ─── Spielstand-Snapshot ──────────────────────────────────────
+
+    def snapshot(self) -> dict:
+        """Kompletter Spielstand mitten in der Schicht als JSON-fähige Daten.
+
+        Alles wird frisch kopiert, der Schreib-Thread kann die Daten also
+        kodieren, während das Spiel weiterläuft. Pizzen und Kunden in den
+        Küchen-Warteschlangen werden als Index bzw. Kunden-ID abgelegt;
+        veraltete Einträge fallen dabei heraus.
+        """
+        self._forschung_sichern()
+        k = self.kueche
+        pizza_index = {id(p): i for i, p in enumerate(self.fertige_pizzen)}
+        rng_version, rng_intern, rng_gauss = self.rng.getstate()
+        state = {key: list(wert) if isinstance(wert, list) else wert
+                 for key, wert in self.state.zu_dict().items()}
+        return {
+            "format": SPEICHER_FORMAT,
+            "state": state,
+            "laufzeit": {
+                "rng": [rng_version, list(rng_intern), rng_gauss],
+                "zaehler": {name: getattr(self, name) for name in self.LAUFZEIT_FELDER},
+                "ereignis": dict(self.aktuelles_ereignis) if self.aktuelles_ereignis else None,
+                "oefen": [asdict(p) if p else None for p in self.pizzen_im_ofen],
+                "fertige_pizzen": [asdict(p) for p in self.fertige_pizzen],
+                "personal": [asdict(p) for p in self.personal],
+                "powerups": [asdict(ap) for ap in self.active_powerups],
+                "kunden": self.kunden.zeilen(),
+                "kueche": {
+                    "wartende": {name: [kd.id for kd in d if kd.id in k.kunden_ids]
+                                 for name, d in k.wartende.items()},
+                    "fertig": {name: [pizza_index[id(p)] for p in d
+                                      if id(p) in k.pizza_ids and id(p) in pizza_index]
+                               for name, d in k.fertig.items()},
+                    "n_wartend": dict(k.n_wartend),
+                    "n_angebot": dict(k.n_angebot),
+                    "zu_backen": list(k.zu_backen),
+                    "freie_oefen": list(k.freie_oefen),
+                    "ofen_fertig": list(k.ofen_fertig),
+                    "servierbereit": list(k.servierbereit),
+                },
+            },
+        }
 
-        # Power-Up Buttons
-        self.powerup_btns: Dict[str, Button] = {}
+    def snapshot_laden(self, daten: dict, offline: bool = True) -> int:
+        """Gegenstück zu ``snapshot``; alte Spielstände (nur ``state``) gehen auch.
 
-        # Personal Menu
-        self.personal_menu = None
-        self.personal_btn = None
+        Mit ``offline`` wird den Laboren die Zeit seit dem Speichern
+        gutgeschrieben. Liefert die Anzahl dabei abgeschlossener Forschungen.
+        """
+        if daten.get("format", 1) < 2:
+            daten = {"state": daten}     # alter Spielstand: nur GameState
+        self.state.reset()
+        self.state.von_dict(daten["state"])
+        self.labor = []
+        self.forschung_warteschlange = []
+        self._init_spiel()
+        if daten.get("laufzeit"):
+            self._laufzeit_laden(daten["laufzeit"])
+        if not offline:
+            self.state.gespeichert_um = 0.0
+        self.screen_state = "spiel"
+        return self._forschung_laden()
+
+    @staticmethod
+    def snapshot_pruefen(daten: dict):
+        """Probeweise in eine frische Simulation laden; wirft bei defekten Daten."""
+        PizzeriaSimulation().snapshot_laden(daten)
+
+    def _laufzeit_laden(self, lz: dict):
+        rng_version, rng_intern, rng_gauss = lz["rng"]
+        self.rng.setstate((rng_version, tuple(rng_intern), rng_gauss))
+        for name in self.LAUFZEIT_FELDER:
+            if name in lz["zaehler"]:
+                setattr(self, name, lz["zaehler"][name])
+        self.aktuelles_ereignis = lz["ereignis"]
+
+        self.pizzen_im_ofen = [Pizza(**p) if p else None for p in lz["oefen"]]
+        self.fertige_pizzen = [Pizza(**p) for p in lz["fertige_pizzen"]]
+        self.personal = [Personal(**p) for p in lz["personal"]]
+        self.active_powerups = [ActivePowerup(**ap) for ap in lz["powerups"]]
+        self._modifikatoren_neu()
+        self.kunden = KundenPuffer.aus_zeilen(lz["kunden"])
+
+        kd = lz["kueche"]
+        k = self.kueche
+        k.reset(0)
+        nach_id = {kunde.id: kunde for kunde in self.kunden}
+        for name, ids in kd["wartende"].items():
+            k.wartende[name] = deque(nach_id[i] for i in ids if i in nach_id)
+            k.kunden_ids.update(kunde.id for kunde in k.wartende[name])
+        for name, indizes in kd["fertig"].items():
+            k.fertig[name] = deque(self.fertige_pizzen[i] for i in indizes)
+            k.pizza_ids.update(id(p) for p in k.fertig[name])
+        k.n_wartend.update(kd["n_wartend"])
+        k.n_angebot.update(kd["n_angebot"])
+        k.zu_backen.extend(kd["zu_backen"])
+        k.freie_oefen.extend(kd["freie_oefen"])
+        k.ofen_fertig.extend(kd["ofen_fertig"])
+        k.servierbereit.extend(kd["servierbereit"])
+
+    # ─── Hooks für die Oberfläche ─────────────────────────────────
 
-    def _init_menu_buttons(self):
-        cx = SCREEN_W // 2
-        self.btn_neues_spiel = Button(cx - 140, 300, 280, 55, "Neues Spiel", C_ACCENT)
-        self.btn_weiterspielen = Button(cx - 140, 370, 280, 55, "Weiterspielen", C_GREEN)
-        self.btn_highscores = Button(cx - 140, 440, 280, 55, "Highscores", C_BLUE)
-        self.btn_beenden = Button(cx - 140, 510, 280, 55, "Beenden", C_RED)
+    def _benachrichtigung(self, text: str, farbe=C_WHITE, kurz=False):
+        pass
 
-        # Schwierigkeit
-        self.btn_schwierig = {}
-        for i, (name, daten) in enumerate(SCHWIERIGKEITSGRADE.items()):
-            self.btn_schwierig[name] = Button(
-                cx - 160, 200 + i * 80, 320, 60, name, daten["farbe"]
-            )
+    def _effekt(self, x, y, farbe, anzahl=8, text=""):
+        pass
 
-        # Spiel-Buttons (Seitenleiste rechts)
-        self.btn_pause     = Button(SCREEN_W - 115, 10, 105, 35, "Pause",   C_GRAY, klein=True)
-        self.btn_speichern = Button(SCREEN_W - 230, 10, 105, 35, "Speichern",C_TEAL, klein=True)
-        self.btn_menu_hs   = Button(SCREEN_W - 345, 10, 105, 35, "Scores",  C_BLUE, klein=True)
-        self.btn_ach       = Button(SCREEN_W - 460, 10, 105, 35, "Trophäen",C_GOLD, klein=True)
-        self.btn_forschung = Button(SCREEN_W - 575, 10, 105, 35, "Forschg", C_PURPLE, klein=True)
+    def _speichern(self):
+        pass
 
-    def _init_powerup_buttons(self):
-        """Initialisiert Power-Up Buttons für das Spiel-UI."""
-        self.powerup_btns = {}
-        for i, (name, daten) in enumerate(POWERUPS.items()):
-            col = i % 4
-            row = i // 4
-            x = 205 + col * 190
-            y = SCREEN_H - 108 + row * 35
-            self.powerup_btns[name] = Button(
-                x, y, 185, 28,
-                f"{daten['icon']} {name}",
-                daten["farbe"], klein=True,
-                tooltip=daten["beschreibung"]
-            )
+    def _speichere_highscore(self):
+        pass
 
-    def _init_personal_ui(self):
-        """Initialisiert Personal-UI-Elemente."""
-        self.personal_btn = Button(
-            SCREEN_W - 195, SCREEN_H // 2 + 30, 185, 35,
-            "👤 Personal +", C_PURPLE, klein=True
-        )
-        self.personal_menu = PersonalMenu(self)
+    # ─── Spielaufbau ──────────────────────────────────────────────
 
     def _init_spiel(self):
         """Setzt Spielobjekte zurück und bereitet ein neues Spiel vor."""
         level_data = LEVELS[self.state.level]
         self.pizzen_im_ofen = [None] * level_data["ofen_slots"]
-        self.kunden = []
+        self.kueche.reset(level_data["ofen_slots"])
+        self.kunden = KundenPuffer()
         self.personal = []
         self.fertige_pizzen = []
         self.active_powerups = []
-        self.aktive_forschung = None
         self.naechste_kunden_id = 0
         self.naechstes_personal_id = 0
         self.kunden_timer = 5.0
         self.gehalt_timer = 30.0
-        self.ereignis_timer = random.uniform(60, 120)
-        self.combo_display_timer = 0.0
+        self.ereignis_timer = self.rng.uniform(60, 120)
 
-        # Multiplier zurücksetzen
-        self.mult_backzeit = 1.0
-        self.mult_geduld = 1.0
-        self.mult_kunden = 1.0
-        self.mult_preis = 1.0
+        # Multiplikatoren zurücksetzen und Forschungs-Effekte erneut anwenden
+        self.forschung_mod = dict.fromkeys(EFFEKTE, 1.0)
         self.auto_system = False
-
-        # Forschungs-Effekte erneut anwenden
-        for fid in self.state.forschungen_abgeschlossen:
-            self._forschung_anwenden(fid)
+        self.forschung.reset(self.state.forschungen_abgeschlossen)
+        for fid in self.forschung.reihenfolge:
+            if fid in self.forschung.abgeschlossen:
+                self._forschung_anwenden(fid)
+        self._modifikatoren_neu()
+        self._labor_fuellen()     # Labore und Warteschlange überleben Level-Ups
 
         # Tisch-Positionen berechnen
         self._berechne_tische()
@@ -926,18 +1969,13 @@ class PizzeriaImperium:
             self.ausgewaehlte_pizza = self.state.freigeschaltete_pizzen[0]
 
         # Zutatenkosten (günstiger mit Power-Up)
-        zutat_rabatt = self._get_powerup_effekt("zutat_rabatt")
-        kosten = 2 * zutat_rabatt
+        kosten = 2 * self.modifikatoren["zutat_rabatt"]
         if self.state.geld < kosten:
             self._benachrichtigung("Nicht genug Geld für Zutaten!", C_RED)
             return
 
         self.state.geld -= kosten
-        p = Pizza(
-            name=self.ausgewaehlte_pizza,
-            backzeit=PIZZEN[self.ausgewaehlte_pizza]["zeit"] * self.mult_backzeit
-        )
-        self.pizzen_im_ofen[slot] = p
+        p = self._ofen_belegen(slot, self.ausgewaehlte_pizza)
         self._benachrichtigung(f"🔥 {p.name} im Ofen!", C_ACCENT, kurz=True)
 
     def pizza_aus_ofen(self, slot: int):
@@ -952,18 +1990,22 @@ class PizzeriaImperium:
 
         if pizza.verbrannt:
             self._benachrichtigung("Verbrannte Pizza weggeworfen!", C_RED)
-            self.partikel.add(SCREEN_W // 2, SCREEN_H // 2, C_RED, 15, "💨")
+            self._effekt(SCREEN_W // 2, SCREEN_H // 2, C_RED, 15, "💨")
             self.pizzen_im_ofen[slot] = None
+            self.kueche.pizza_weg(pizza)
+            self.kueche.ofen_frei(slot)
             self.state.fehler_serie += 1
             self.state.perfekte_serie = 0
             return
 
         self.pizzen_im_ofen[slot] = None
         self.fertige_pizzen.append(pizza)
+        self.kueche.ofen_frei(slot)
+        self.kueche.pizza_fertig(pizza)
         self.state.pizzen_gebacken += 1
         self.state.perfekte_serie += 1
         self._benachrichtigung(f"✅ {pizza.name} fertig!", C_GREEN, kurz=True)
-        self.partikel.add(SCREEN_W // 2, 400, C_GREEN, 10)
+        self._effekt(SCREEN_W // 2, 400, C_GREEN, 10)
         self._check_achievements()
 
     def pizza_servieren(self, pizza: Pizza, kunde: Kunde):
@@ -973,15 +2015,16 @@ class PizzeriaImperium:
             self._benachrichtigung(f"Falsche Pizza! Kunde wollte {kunde.pizza_name}!", C_RED)
             if pizza in self.fertige_pizzen:
                 self.fertige_pizzen.remove(pizza)
+                self.kueche.pizza_weg(pizza)
             self.state.kunden_verloren += 1
             self.state.combo = 0
             return False
 
         # Korrekte Bestellung
-        preis = PIZZEN[pizza.name]["preis"] * self.mult_preis
-        preis *= self._get_powerup_effekt("preis_mult")
+        mod = self.modifikatoren
+        preis = PIZZEN[pizza.name]["preis"] * mod["preis_mult"]
         if kunde.vip:
-            preis *= self._get_powerup_effekt("vip_mult")
+            preis *= mod["vip_mult"]
         schwierig = SCHWIERIGKEITSGRADE[self.state.schwierigkeit]
         preis *= schwierig["preis_mult"]  # KORRIGIERT: Nur einmal anwenden
 
@@ -993,6 +2036,7 @@ class PizzeriaImperium:
 
         self.state.geld += endpreis
         self.state.gesamt_verdient += endpreis
+        self.state.pizza_umsatz += endpreis
         self.state.kunden_bedient += 1
         self.state.zufriedene_kunden += 1
         self.state.minuten_umsatz += endpreis
@@ -1002,16 +2046,16 @@ class PizzeriaImperium:
 
         if pizza in self.fertige_pizzen:
             self.fertige_pizzen.remove(pizza)
-        if kunde in self.kunden:
-            self.kunden.remove(kunde)
+        self.kunden.entfernen(kunde)
+        self.kueche.serviert(pizza, kunde)
         if kunde.tisch_id >= 0:
             pass  # Tisch wird automatisch frei
 
         if kunde.vip:
             self.state.vip_kunden_bedient += 1
-            self.partikel.add(kunde.x, kunde.y, C_GOLD, 20, f"⭐ {fmt_geld(endpreis)}")
+            self._effekt(kunde.x, kunde.y, C_GOLD, 20, f"⭐ {fmt_geld(endpreis)}")
         else:
-            self.partikel.add(kunde.x, kunde.y, C_GREEN, 10, fmt_geld(endpreis))
+            self._effekt(kunde.x, kunde.y, C_GREEN, 10, fmt_geld(endpreis))
 
         self._benachrichtigung(
             f"🎉 +{fmt_geld(endpreis)}" + (" VIP!" if kunde.vip else ""),
@@ -1037,9 +2081,9 @@ class PizzeriaImperium:
         p = Personal(
             id=self.naechstes_personal_id,
             typ=typ,
-            name=zufalls_name(),
-            x=random.uniform(250, SCREEN_W - 250),
-            y=random.uniform(100, SCREEN_H - 200),
+            name=zufalls_name(self.rng),
+            x=self.rng.uniform(250, SCREEN_W - 250),
+            y=self.rng.uniform(100, SCREEN_H - 200),
         )
         self.naechstes_personal_id += 1
         self.personal.append(p)
@@ -1064,73 +2108,142 @@ class PizzeriaImperium:
             verbleibend=daten["dauer"],
             gesamt=daten["dauer"]
         ))
+        self._modifikatoren_neu()
         self.state.powerups_benutzt += 1
         self._benachrichtigung(f"⚡ {name} aktiviert!", daten["farbe"])
-        self.partikel.add(SCREEN_W // 2, SCREEN_H // 2, daten["farbe"], 20, name)
+        self._effekt(SCREEN_W // 2, SCREEN_H // 2, daten["farbe"], 20, name)
         self._check_achievements()
 
     def forschung_starten(self, fid: str):
-        if self.aktive_forschung is not None:
-            self._benachrichtigung("Bereits eine Forschung aktiv!", C_YELLOW)
-            return
-        f = next((x for x in FORSCHUNGEN if x["id"] == fid), None)
+        """Forschung bezahlen und einplanen.
+
+        Voraussetzungen dürfen selbst noch im Labor oder in der Warteschlange
+        stehen – gestartet wird erst, wenn sie abgeschlossen sind.
+        """
+        f = self.forschung.get(fid)
         if f is None:
             return
-        if fid in self.state.forschungen_abgeschlossen:
+        if self.forschung.erforscht(fid):
             self._benachrichtigung("Bereits erforscht!", C_GRAY)
             return
-        # Voraussetzungen prüfen
-        for v in f["voraus"]:
-            if v not in self.state.forschungen_abgeschlossen:
-                self._benachrichtigung("Voraussetzung fehlt!", C_RED)
-                return
+        if self.forschung_eingeplant(fid):
+            self._benachrichtigung("Bereits eingeplant!", C_YELLOW)
+            return
+        if not self.forschung_planbar(fid):
+            self._benachrichtigung("Voraussetzung fehlt!", C_RED)
+            return
         if self.state.geld < f["kosten"]:
             self._benachrichtigung(f"Brauche {fmt_geld(f['kosten'])}!", C_RED)
             return
 
         self.state.geld -= f["kosten"]
-        self.aktive_forschung = ForschungsFortschritt(
-            id=fid,
-            verbleibend=f["dauer"],
-            gesamt=f["dauer"]
-        )
-        self._benachrichtigung(f"🔬 Forschung gestartet: {f['name']}", C_PURPLE)
+        self.forschung_warteschlange.append(fid)
+        self._labor_fuellen()
+        if self.forschung_eingeplant(fid, nur_labor=True):
+            self._benachrichtigung(f"🔬 Forschung gestartet: {f['name']}", C_PURPLE)
+        else:
+            self._benachrichtigung(f"🔬 Eingereiht: {f['name']}", C_PURPLE)
+
+    def labor_slots(self) -> int:
+        return LEVELS[self.state.level]["labor_slots"]
+
+    def forschung_eingeplant(self, fid: str, nur_labor: bool = False) -> bool:
+        if any(p.id == fid for p in self.labor):
+            return True
+        return not nur_labor and fid in self.forschung_warteschlange
+
+    def forschung_planbar(self, fid: str) -> bool:
+        """Alle Voraussetzungen erforscht oder selbst schon eingeplant?"""
+        return all(self.forschung.erforscht(v) or self.forschung_eingeplant(v)
+                   for v in self.forschung[fid]["voraus"])
+
+    def forschung_nachholen(self, sekunden: float) -> int:
+        """Forschung um ``sekunden`` vorantreiben, ohne Frames zu simulieren.
+
+        Es wird von Abschluss zu Abschluss gesprungen: alle Labore laufen bis
+        zur nächsten fertigen Forschung, danach rücken wartende nach. Liefert
+        die Anzahl abgeschlossener Forschungen. Wird auch pro Frame benutzt.
+        """
+        fertig = 0
+        while sekunden > 0 and self.labor:
+            schritt = min(sekunden, min(p.verbleibend for p in self.labor))
+            sekunden -= schritt
+            for p in self.labor:
+                p.verbleibend -= schritt
+            for p in [p for p in self.labor if p.verbleibend <= 0]:
+                self.labor.remove(p)
+                self._forschung_abschliessen(p.id)
+                fertig += 1
+            self._labor_fuellen()
+        return fertig
 
     # ─── Interne Hilfsmethoden ────────────────────────────────────
 
-    def _get_powerup_effekt(self, effekt: str) -> float:
-        for ap in self.active_powerups:
+    def _modifikatoren_neu(self):
+        """Effekt-Tabelle neu berechnen (bei Power-Up-Start/-Ablauf und Forschung).
+
+        Im Spielablauf wird danach nur noch ``self.modifikatoren[effekt]``
+        gelesen, statt die aktiven Power-Ups jedes Mal zu durchsuchen.
+        """
+        powerup = dict.fromkeys(EFFEKTE, 1.0)
+        for ap in reversed(self.active_powerups):   # ältestes Power-Up gewinnt
             daten = POWERUPS[ap.name]
-            if daten["effekt"] == effekt:
-                return daten["wert"]
-        return 1.0
+            powerup[daten["effekt"]] = daten["wert"]
+        self.powerup_mod = powerup
+        self.modifikatoren = {e: self.forschung_mod[e] * powerup[e] for e in EFFEKTE}
+
+    def _labor_fuellen(self):
+        """Freie Labore mit der ersten Forschung belegen, deren Voraussetzungen
+        erfüllt sind (Warteschlange in Einplan-Reihenfolge)."""
+        while len(self.labor) < self.labor_slots():
+            fid = next((x for x in self.forschung_warteschlange
+                        if self.forschung.voraus_ok(x)), None)
+            if fid is None:
+                return
+            self.forschung_warteschlange.remove(fid)
+            dauer = self.forschung[fid]["dauer"]
+            self.labor.append(ForschungsFortschritt(id=fid, verbleibend=dauer, gesamt=dauer))
+
+    def _forschung_abschliessen(self, fid: str):
+        self.state.forschungen_abgeschlossen.append(fid)
+        self.forschung.abschliessen(fid)
+        self._forschung_anwenden(fid)
+        self._modifikatoren_neu()
+        self._benachrichtigung(f"🔬 Forschung abgeschlossen: {self.forschung[fid]['name']}!",
+                               C_PURPLE)
+        self._check_achievements()
+
+    def _forschung_sichern(self):
+        """Labore und Warteschlange für den Spielstand in den GameState schreiben."""
+        self.state.forschung_labor = [[p.id, p.verbleibend, p.gesamt] for p in self.labor]
+        self.state.forschung_warteschlange = list(self.forschung_warteschlange)
+        self.state.gespeichert_um = time.time()
+
+    def _forschung_laden(self) -> int:
+        """Labore aus dem GameState übernehmen und die Zeit seit dem Speichern
+        gutschreiben. Liefert die Anzahl offline abgeschlossener Forschungen."""
+        self.forschung.reset(self.state.forschungen_abgeschlossen)
+        self.labor = [ForschungsFortschritt(id=fid, verbleibend=rest, gesamt=gesamt)
+                      for fid, rest, gesamt in self.state.forschung_labor
+                      if fid in self.forschung.knoten]
+        self.forschung_warteschlange = [fid for fid in self.state.forschung_warteschlange
+                                        if fid in self.forschung.knoten]
+        self._labor_fuellen()
+        if self.state.gespeichert_um <= 0:
+            return 0
+        return self.forschung_nachholen(max(0.0, time.time() - self.state.gespeichert_um))
 
     def _forschung_anwenden(self, fid: str):
-        f = next((x for x in FORSCHUNGEN if x["id"] == fid), None)
+        """Forschungs-Effekt eintragen (danach _modifikatoren_neu aufrufen)."""
+        f = self.forschung.get(fid)
         if f is None:
             return
         eff = f["effekt"]
-        val = f["wert"]
-        if eff == "backzeit_mult":
-            self.mult_backzeit *= val
-        elif eff == "geduld_mult":
-            self.mult_geduld *= val
-        elif eff == "kunden_mult":
-            self.mult_kunden *= val
-        elif eff == "preis_mult":
-            self.mult_preis *= val
+        if eff in self.forschung_mod:
+            self.forschung_mod[eff] *= f["wert"]
         elif eff in ("auto_teil", "auto_voll"):
             self.auto_system = True
 
-    def _benachrichtigung(self, text: str, farbe=C_WHITE, kurz=False):
-        timer = 1.5 if kurz else 3.0
-        # Alte verschieben
-        for b in self.benachrichtigungen:
-            b.y_offset -= 30
-        self.benachrichtigungen.append(Benachrichtigung(text=text, farbe=farbe, timer=timer))
-        if len(self.benachrichtigungen) > 8:
-            self.benachrichtigungen.pop(0)
-
     def _check_achievements(self):
         unlocked = self.state.achievements_erhalten
 
@@ -1140,7 +2253,7 @@ class PizzeriaImperium:
                 ach = next(a for a in ACHIEVEMENTS if a["id"] == aid)
                 self.state.xp += ach["xp"]
                 self._benachrichtigung(f"🏆 Achievement: {ach['name']}! +{ach['xp']}XP", C_GOLD)
-                self.partikel.add(SCREEN_W // 2, 300, C_GOLD, 30, "🏆")
+                self._effekt(SCREEN_W // 2, 300, C_GOLD, 30, "🏆")
 
         check("erste_pizza",    self.state.pizzen_gebacken >= 1)
         check("10_pizzen",      self.state.pizzen_gebacken >= 10)
@@ -1164,13 +2277,13 @@ class PizzeriaImperium:
         check("spielzeit_1h",   self.state.spielzeit >= 3600)
         check("nacht_schicht",  datetime.datetime.now().hour >= 22)
         check("erste_krise",    self.state.ereignisse_erlebt >= 1)
-        check("forschung_5",    len(self.state.forschungen_abgeschlossen) >= 5)
-        check("erste_forschung",len(self.state.forschungen_abgeschlossen) >= 1)
+        check("forschung_5",    len(self.forschung.abgeschlossen) >= 5)
+        check("erste_forschung",len(self.forschung.abgeschlossen) >= 1)
         check("sparfuchs",      self.state.rabatt_kaeufe >= 50)
         check("preisrekord",    self.state.max_minuten_umsatz >= 500)
 
         # Vollhaus
-        besetzt = sum(1 for k in self.kunden if k.tisch_id >= 0)
+        besetzt = len(self.kunden.tische())
         level_data = LEVELS[self.state.level]
         check("vollhaus",       besetzt >= level_data["max_tische"])
 
@@ -1188,41 +2301,44 @@ class PizzeriaImperium:
 
     def _neuer_kunde(self):
         level_data = LEVELS[self.state.level]
-        if len(self.kunden) >= level_data["max_kunden"]:
+        max_kunden = RUSHHOUR_KUNDEN if self.rushhour else level_data["max_kunden"]
+        if len(self.kunden) >= max_kunden:
             return
 
         # VIP-Chance steigt mit Level
-        vip = random.random() < (0.05 + self.state.level * 0.02)
+        vip = self.rng.random() < (0.05 + self.state.level * 0.02)
 
-        # Freien Tisch suchen
-        belegte_tische = {k.tisch_id for k in self.kunden if k.tisch_id >= 0}
+        # Freien Tisch suchen (in der Rushhour dürfen Gäste auch stehen)
+        belegte_tische = self.kunden.tische()
         freie_tische = [i for i in range(len(self.tisch_positionen)) if i not in belegte_tische]
-        if not freie_tische:
+        if freie_tische:
+            tisch_id = self.rng.choice(freie_tische)
+            tx, ty = self.tisch_positionen[tisch_id]
+        elif self.rushhour:
+            tisch_id = -1
+            tx = self.rng.uniform(230, SCREEN_W - 240)
+            ty = self.rng.uniform(80, SCREEN_H - 170)
+        else:
             return
 
-        tisch_id = random.choice(freie_tische)
-        tx, ty = self.tisch_positionen[tisch_id]
-
         # Pizza-Bestellung (bevorzugt beliebte Pizzen)
         verfuegbar = self.state.freigeschaltete_pizzen
         gewichte = [PIZZEN[p]["beliebt"] for p in verfuegbar]
-        pizza = random.choices(verfuegbar, weights=gewichte)[0]
+        pizza = self.rng.choices(verfuegbar, weights=gewichte)[0]
 
         schwierig = SCHWIERIGKEITSGRADE[self.state.schwierigkeit]
-        geduld = 100.0 * schwierig["kunden_geduld_mult"] * self.mult_geduld
-        geduld *= self._get_powerup_effekt("geduld_mult")
+        geduld = 100.0 * schwierig["kunden_geduld_mult"] * self.modifikatoren["geduld_mult"]
 
         emojis_normal = ["😊", "😄", "🙂", "😋", "🤤"]
         emojis_vip    = ["🤵", "👑", "💎", "⭐", "🎩"]
-        emoji = random.choice(emojis_vip if vip else emojis_normal)
+        emoji = self.rng.choice(emojis_vip if vip else emojis_normal)
 
-        kunde = Kunde(
+        kunde = self.kunden.hinzufuegen(
             id=self.naechste_kunden_id,
             pizza_name=pizza,
             geduld=geduld,
-            max_geduld=geduld,
             vip=vip,
-            x=random.choice([-30, SCREEN_W + 30]),
+            x=self.rng.choice([-30, SCREEN_W + 30]),
             y=ty,
             ziel_x=tx,
             ziel_y=ty,
@@ -1230,11 +2346,11 @@ class PizzeriaImperium:
             emoji=emoji,
         )
         self.naechste_kunden_id += 1
-        self.kunden.append(kunde)
+        self.kueche.kunde_neu(kunde)
 
     def _zufallsereignis(self):
-        ereignis = random.choice(EREIGNISSE)
-        wert = random.randint(*ereignis["wert_range"])
+        ereignis = self.rng.choice(EREIGNISSE)
+        wert = self.rng.randint(*ereignis["wert_range"])
         self.state.ereignisse_erlebt += 1
 
         beschreibung = ereignis["beschreibung"].replace("{wert}", str(wert))
@@ -1254,126 +2370,341 @@ class PizzeriaImperium:
         else:
             self.state.geld += wert
             self.state.gesamt_verdient += wert
+            self.state.ereignis_einnahmen += wert
 
         self.screen_state = "ereignis"
         self._check_achievements()
 
+    def _ofen_belegen(self, slot: int, name: str) -> Pizza:
+        p = Pizza(
+            name=name,
+            backzeit=PIZZEN[name]["zeit"] * self.forschung_mod["backzeit_mult"]
+        )
+        self.pizzen_im_ofen[slot] = p
+        self.kueche.ofen_belegt(p)
+        return p
+
+    def _auto_backen(self) -> bool:
+        """Eine offene Bestellung in einen freien Ofen schieben."""
+        if self.state.geld < 2 or not self.kueche.freie_oefen:
+            return False
+        name = self.kueche.naechste_bestellung()
+        if name is None:
+            return False
+        slot = self.kueche.naechster_ofen(self.pizzen_im_ofen)
+        if slot < 0:
+            self.kueche.zu_backen.appendleft(name)
+            return False
+        self.state.geld -= 2 * self.modifikatoren["zutat_rabatt"]
+        self._ofen_belegen(slot, name)
+        return True
+
     def _auto_spielzug(self, dt):
-        """Automatische Aktionen für Personal."""
+        """Automatische Aktionen für Personal (Aufträge kommen aus dem Küchenplan)."""
+        personal_speed = self.modifikatoren["personal_speed"]
         for mitarbeiter in self.personal:
             data = PERSONAL_TYPEN[mitarbeiter.typ]
-            speed = data["geschwindigkeit"] * self._get_powerup_effekt("personal_speed")
+            speed = data["geschwindigkeit"] * personal_speed
             mitarbeiter.task_timer -= dt * speed
 
             if mitarbeiter.task_timer > 0:
                 continue
 
             if mitarbeiter.typ == "Manager":
-                # Manager bucht automatisch Pizzen
-                for i, slot in enumerate(self.pizzen_im_ofen):
-                    if slot is None and self.state.geld >= 2:
-                        # Welche Pizza braucht ein wartender Kunde?
-                        for k in self.kunden:
-                            if any(fp.name == k.pizza_name for fp in self.fertige_pizzen):
-                                continue
-                            if k.pizza_name in self.state.freigeschaltete_pizzen:
-                                kosten = 2 * self._get_powerup_effekt("zutat_rabatt")
-                                self.state.geld -= kosten
-                                p = Pizza(
-                                    name=k.pizza_name,
-                                    backzeit=PIZZEN[k.pizza_name]["zeit"] * self.mult_backzeit,
-                                    bestellt_von=k.id
-                                )
-                                self.pizzen_im_ofen[i] = p
-                                mitarbeiter.task_timer = 5.0
-                                break
+                # Manager bucht offene Bestellungen in alle freien Öfen
+                while self._auto_backen():
+                    mitarbeiter.task_timer = 5.0
 
             elif mitarbeiter.typ in ("Koch", "Chefkoch", "Lehrling", "Superstar"):
-                # Koch backt automatisch
-                for i, slot in enumerate(self.pizzen_im_ofen):
-                    if slot is not None and slot.fertig:
-                        self.pizza_aus_ofen(i)
-                        mitarbeiter.task_timer = 3.0 / speed
-                        break
-                    elif slot is None and self.kunden and self.state.geld >= 2:
-                        # Passende Pizza für Kunden
-                        for k in self.kunden:
-                            if k.pizza_name in self.state.freigeschaltete_pizzen:
-                                kosten = 2 * self._get_powerup_effekt("zutat_rabatt")
-                                self.state.geld -= kosten
-                                p = Pizza(
-                                    name=k.pizza_name,
-                                    backzeit=PIZZEN[k.pizza_name]["zeit"] * self.mult_backzeit,
-                                    bestellt_von=k.id
-                                )
-                                self.pizzen_im_ofen[i] = p
-                                mitarbeiter.task_timer = 8.0 / speed
-                                break
-                        break
+                # Koch holt fertige Pizzen heraus, sonst backt er die nächste Bestellung
+                slot = self.kueche.naechster_ofen(self.pizzen_im_ofen, frei=False)
+                if slot >= 0:
+                    self.pizza_aus_ofen(slot)
+                    mitarbeiter.task_timer = 3.0 / speed
+                elif self._auto_backen():
+                    mitarbeiter.task_timer = 8.0 / speed
+
+            elif mitarbeiter.typ in ("Kellner",):
+                # Kellner serviert das nächste passende Paar
+                paar = self.kueche.naechstes_paar()
+                if paar is not None:
+                    self.pizza_servieren(*paar)
+                    mitarbeiter.task_timer = 4.0 / speed
+
+            if mitarbeiter.task_timer <= 0:
+                mitarbeiter.task_timer = self.rng.uniform(2, 5)
+
+            # Animations-Update
+            mitarbeiter.animation += dt * 2
+            mitarbeiter.x += math.sin(mitarbeiter.animation) * 0.3
+            mitarbeiter.y += math.cos(mitarbeiter.animation * 0.7) * 0.2
+
+    # ─── Simulationsschritt ───────────────────────────────────────
+
+    def _update_spiel(self, dt: float):
+        self.state.spielzeit += dt
+
+        # Minuten-Umsatz tracken
+        if not hasattr(self.state, 'minuten_timer'):
+            self.state.minuten_timer = 0
+        self.state.minuten_timer += dt
+        if self.state.minuten_timer >= 60:
+            self.state.minuten_timer -= 60
+            if self.state.minuten_umsatz > self.state.max_minuten_umsatz:
+                self.state.max_minuten_umsatz = self.state.minuten_umsatz
+            self.state.minuten_umsatz = 0
+
+        # Statistik-Timer
+        self.stats_timer += dt
+
+        # Kunden spawnen
+        schwierig = SCHWIERIGKEITSGRADE[self.state.schwierigkeit]
+        kunden_intervall = max(3.0, 12.0 / self.modifikatoren["kunden_mult"])
+        # KORRIGIERT: Kein Zugriff auf nicht-existierenden Schlüssel 'kunden_mult'
+        self.kunden_timer -= dt
+        if self.kunden_timer <= 0:
+            self._neuer_kunde()
+            self.kunden_timer = kunden_intervall / max(0.1, self.powerup_mod["kunden_mult"])
+            if self.rushhour:
+                self.kunden_timer = RUSHHOUR_INTERVALL
+            if self.rng.random() < 0.3:
+                self._neuer_kunde()
+
+        # Kunden updaten
+        geduld_abbau = 8 / schwierig["kunden_geduld_mult"] + 8 / self.forschung_mod["geduld_mult"]
+        for k in self.kunden.update(dt, geduld_abbau):
+            # Kunde geht
+            self.kunden.entfernen(k)
+            self.kueche.kunde_weg(k)
+            self.state.kunden_verloren += 1
+            self.state.combo = 0
+            self._benachrichtigung("😢 Kunde gegangen!", C_RED, kurz=True)
+            self._effekt(k.x, k.y, C_RED, 5, "😠")
+
+        # Pizzen im Ofen backen
+        backzeit_mult = self.modifikatoren["backzeit_mult"]
+        for slot, pizza in enumerate(self.pizzen_im_ofen):
+            if pizza is None or pizza.fertig or pizza.verbrannt:
+                continue
+            pizza.fortschritt += dt * (1.0 / pizza.backzeit) * (1.0 / backzeit_mult)
+            if pizza.fortschritt >= 1.0:
+                pizza.fertig = True
+                pizza.fortschritt = 1.0
+                self.kueche.pizza_gebacken(slot)
+                self._benachrichtigung(f"🍕 {pizza.name} fertig!", C_ACCENT, kurz=True)
+            elif pizza.fortschritt >= 1.3:
+                pizza.verbrannt = True
+                pizza.fertig = False
+
+        # Gehalt bezahlen
+        self.gehalt_timer -= dt
+        if self.gehalt_timer <= 0:
+            self.gehalt_timer = 30.0
+            gesamt_gehalt = 0
+            schwierig_kosten = SCHWIERIGKEITSGRADE[self.state.schwierigkeit]["kosten_mult"]
+            for p in self.personal:
+                gehalt = PERSONAL_TYPEN[p.typ]["gehalt"] * schwierig_kosten
+                gesamt_gehalt += gehalt
+            if gesamt_gehalt > 0:
+                self.state.geld -= gesamt_gehalt
+                self._benachrichtigung(f"💸 Gehalt: -{fmt_geld(gesamt_gehalt)}", C_GRAY, kurz=True)
+                if self.state.geld < 0:
+                    self.state.geld = 0
+                    self.screen_state = "game_over"
+                    self._speichere_highscore()
+
+        # Power-Ups ablaufen lassen
+        for ap in list(self.active_powerups):
+            ap.verbleibend -= dt
+            if ap.verbleibend <= 0:
+                self.active_powerups.remove(ap)
+                self._modifikatoren_neu()
+                self._benachrichtigung(f"Power-Up {ap.name} abgelaufen", C_GRAY, kurz=True)
+
+        # Forschung vorantreiben
+        self.forschung_nachholen(dt)
+
+        # Zufallsereignis
+        self.ereignis_timer -= dt
+        if self.ereignis_timer <= 0:
+            self.ereignis_timer = self.rng.uniform(60, 180)
+            chance = SCHWIERIGKEITSGRADE[self.state.schwierigkeit]["ereignis_chance"]
+            if self.rng.random() < chance * 100:
+                self._zufallsereignis()
+
+        # Auto-Spielzug (Personal)
+        self._auto_spielzug(dt)
+
+        # Achievements regelmäßig prüfen
+        if int(self.state.spielzeit * 10) % 50 == 0:
+            self._check_achievements()
+
+# ═══════════════════════════════════════════════════════════════════
+#  HAUPT-SPIEL
+# ═══════════════════════════════════════════════════════════════════
+
+class PizzeriaImperium(PizzeriaSimulation):
+    def __init__(self):
+        super().__init__()
+        pygame.init()
+        pygame.display.set_caption(TITLE)
+        self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+        self.clock = pygame.time.Clock()
+
+        # Fonts
+        self.font_titel  = pygame.font.SysFont("arial", 42, bold=True)
+        self.font_gross   = pygame.font.SysFont("arial", 28, bold=True)
+        self.font_normal  = pygame.font.SysFont("arial", 20)
+        self.font_klein   = pygame.font.SysFont("arial", 15)
+        self.font_winzig  = pygame.font.SysFont("arial", 12)
+        self.font_emoji   = pygame.font.SysFont("segoeui", 20)
+
+        self.partikel = PartikelSystem()
+        self.benachrichtigungen: list[Benachrichtigung] = []
+
+        # UI-Zustände
+        self.screen_state = "menu"   # menu, schwierigkeit, spiel, pause, highscore,
+                                     # achievement, forschung, game_over, level_up, ereignis
+        self.ausgewaehlter_personal = -1
+        self.hover_tooltip = ""
+
+        # Level-Up Animation
+        self.level_up_partikel_timer = 0.0
+
+        # Hintergrund-Animation
+        self.bg_anim = 0.0
+        self.sterne = [(random.randint(0, SCREEN_W), random.randint(0, SCREEN_H),
+                        random.uniform(0.5, 2.0)) for _ in range(80)]
+
+        # Menu Buttons
+        self._init_menu_buttons()
+
+        # Speicherstand prüfen; geschrieben wird im Hintergrund
+        self.speicherstand_vorhanden = spielstand_vorhanden()
+        self.schreiber = SpeicherSchreiber()
+        self.autosave_timer = AUTOSAVE_INTERVALL
+
+        # Highscores laden (Ranglisten-Ansicht wird gecacht)
+        self.highscores = HighscoreSpeicher(schreiber=self.schreiber)
+        self.highscore_filter = HIGHSCORE_ALLE
+        self._highscore_cache: Optional[tuple] = None
+
+        # Combo-Anzeige
+        self.combo_display_timer = 0.0
+
+        # Nachrichten-Queue
+        self.nachrichten_queue: list[tuple] = []
+
+        # Statistik
+        self.stats_minute_geld = 0.0
+
+        # Power-Up Buttons
+        self.powerup_btns: Dict[str, Button] = {}
+
+        # Compositor: Leinwand mit Leisten und Spielfeld-Boden, Sprite-Cache
+        self.ebenen = Ebenen((SCREEN_W, SCREEN_H))
+        self._kunden_bilder = weakref.WeakKeyDictionary()   # Sprite → (Bild-Schlüssel, Balken-Rect)
+        self.kundenschicht = Figurenschicht(self.ebenen, (200, 50, SCREEN_W - 400, SCREEN_H - 160),
+                                            self._kunden_aenderung)
+
+        # Forschungs-Screen: Raster und vorgezeichnete Karten-Ebene
+        self._forschung_rects: Optional[list] = None
+        self._forschung_cache: Optional[tuple] = None
+
+        # Personal Menu
+        self.personal_menu = None
+        self.personal_btn = None
+
+    def _init_menu_buttons(self):
+        cx = SCREEN_W // 2
+        self.btn_neues_spiel = Button(cx - 140, 300, 280, 55, "Neues Spiel", C_ACCENT)
+        self.btn_weiterspielen = Button(cx - 140, 370, 280, 55, "Weiterspielen", C_GREEN)
+        self.btn_highscores = Button(cx - 140, 440, 280, 55, "Highscores", C_BLUE)
+        self.btn_beenden = Button(cx - 140, 510, 280, 55, "Beenden", C_RED)
+
+        # Schwierigkeit
+        self.btn_schwierig = {}
+        for i, (name, daten) in enumerate(SCHWIERIGKEITSGRADE.items()):
+            self.btn_schwierig[name] = Button(
+                cx - 160, 200 + i * 80, 320, 60, name, daten["farbe"]
+            )
+
+        # Spiel-Buttons (Seitenleiste rechts)
+        self.btn_pause     = Button(SCREEN_W - 115, 10, 105, 35, "Pause",   C_GRAY, klein=True)
+        self.btn_speichern = Button(SCREEN_W - 230, 10, 105, 35, "Speichern",C_TEAL, klein=True)
+        self.btn_menu_hs   = Button(SCREEN_W - 345, 10, 105, 35, "Scores",  C_BLUE, klein=True)
+        self.btn_ach       = Button(SCREEN_W - 460, 10, 105, 35, "Trophäen",C_GOLD, klein=True)
+        self.btn_forschung = Button(SCREEN_W - 575, 10, 105, 35, "Forschg", C_PURPLE, klein=True)
+
+    def _init_powerup_buttons(self):
+        """Initialisiert Power-Up Buttons für das Spiel-UI."""
+        self.powerup_btns = {}
+        for i, (name, daten) in enumerate(POWERUPS.items()):
+            col = i % 4
+            row = i // 4
+            x = 205 + col * 190
+            y = SCREEN_H - 108 + row * 35
+            self.powerup_btns[name] = Button(
+                x, y, 185, 28,
+                f"{daten['icon']} {name}",
+                daten["farbe"], klein=True,
+                tooltip=daten["beschreibung"]
+            )
 
-            elif mitarbeiter.typ in ("Kellner",):
-                # Kellner serviert automatisch
-                for fp in list(self.fertige_pizzen):
-                    for k in list(self.kunden):
-                        if fp.name == k.pizza_name:
-                            self.pizza_servieren(fp, k)
-                            mitarbeiter.task_timer = 4.0 / speed
-                            break
-                    break
+    def _init_personal_ui(self):
+        """Initialisiert Personal-UI-Elemente."""
+        self.personal_btn = Button(
+            SCREEN_W - 195, SCREEN_H // 2 + 30, 185, 35,
+            "👤 Personal +", C_PURPLE, klein=True
+        )
+        self.personal_menu = PersonalMenu(self)
 
-            if mitarbeiter.task_timer <= 0:
-                mitarbeiter.task_timer = random.uniform(2, 5)
+    def _effekt(self, x, y, farbe, anzahl=8, text=""):
+        self.partikel.add(x, y, farbe, anzahl, text)
 
-            # Animations-Update
-            mitarbeiter.animation += dt * 2
-            mitarbeiter.x += math.sin(mitarbeiter.animation) * 0.3
-            mitarbeiter.y += math.cos(mitarbeiter.animation * 0.7) * 0.2
+    def _benachrichtigung(self, text: str, farbe=C_WHITE, kurz=False):
+        timer = 1.5 if kurz else 3.0
+        # Alte verschieben
+        for b in self.benachrichtigungen:
+            b.y_offset -= 30
+        self.benachrichtigungen.append(Benachrichtigung(text=text, farbe=farbe, timer=timer))
+        if len(self.benachrichtigungen) > 8:
+            self.benachrichtigungen.pop(0)
 
     # ─── Speichern / Laden ────────────────────────────────────────
 
-    def _speichern(self):
-        try:
-            with open(SAVE_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.state.zu_dict(), f, indent=2, ensure_ascii=False)
+    def _speichern(self, automatisch: bool = False):
+        """Snapshot im Frame-Thread ziehen, schreiben lässt den SpeicherSchreiber."""
+        self.schreiber.auftrag(SAVE_FILE, self.snapshot())
+        self.speicherstand_vorhanden = True
+        self.autosave_timer = AUTOSAVE_INTERVALL
+        if not automatisch:
             self._benachrichtigung("💾 Gespeichert!", C_TEAL, kurz=True)
-        except Exception as e:
-            self._benachrichtigung(f"Speichern fehlgeschlagen: {e}", C_RED)
 
     def _laden(self):
-        try:
-            with open(SAVE_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            self.state.von_dict(data)
-            self._benachrichtigung("📂 Spielstand geladen!", C_TEAL)
-            return True
-        except Exception as e:
-            self._benachrichtigung(f"Laden fehlgeschlagen: {e}", C_RED)
+        self.schreiber.flush()
+        # Erst geprüft, dann geladen: ein defekter Stand lässt das laufende Spiel stehen
+        daten, quelle = lade_spielstand(SAVE_FILE, PizzeriaSimulation.snapshot_pruefen)
+        if daten is None:
+            self._benachrichtigung(f"Laden fehlgeschlagen: {quelle or 'kein Spielstand'}", C_RED)
             return False
-
-    def _lade_highscores(self) -> list:
-        try:
-            with open(SCORES_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return []
+        offline = self.snapshot_laden(daten)
+        self._benachrichtigung("📂 Spielstand geladen!", C_TEAL)
+        if quelle != SAVE_FILE:
+            self._benachrichtigung(f"⚠ Aus Backup geladen ({os.path.basename(quelle)})", C_YELLOW)
+        if offline:
+            self._benachrichtigung(f"🔬 {offline} Forschung(en) offline abgeschlossen", C_PURPLE)
+        return True
 
     def _speichere_highscore(self):
-        entry = {
+        self.highscores.eintragen({
             "name": "Spieler",
             "geld": self.state.gesamt_verdient,
             "level": self.state.level,
             "pizzen": self.state.pizzen_gebacken,
             "schwierigkeit": self.state.schwierigkeit,
             "datum": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
-        }
-        self.highscores.append(entry)
-        self.highscores.sort(key=lambda x: x["geld"], reverse=True)
-        self.highscores = self.highscores[:20]
-        try:
-            with open(SCORES_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.highscores, f, indent=2, ensure_ascii=False)
-        except Exception:
-            pass
+        })
 
     # ═══════════════════════════════════════════════════════════════
     #  UPDATE-LOGIK
@@ -1389,8 +2720,24 @@ class PizzeriaImperium:
             if b.timer <= 0:
                 self.benachrichtigungen.remove(b)
 
+        if self.screen_state in FORSCHUNG_PAUSE_ZUSTAENDE:
+            # Das Labor arbeitet auch in Pause und Menü-Overlays weiter
+            self.forschung_nachholen(dt)
+
+        if self.schreiber.letzter_fehler is not None:
+            fehler, self.schreiber.letzter_fehler = self.schreiber.letzter_fehler, None
+            self._benachrichtigung(f"Speichern fehlgeschlagen: {fehler}", C_RED)
+
         if self.screen_state == "spiel":
             self._update_spiel(dt)
+            self.autosave_timer -= dt
+            if self.autosave_timer <= 0 and self.screen_state == "spiel":
+                self._speichern(automatisch=True)
+            # Combo Display
+            if self.state.combo > 0:
+                self.combo_display_timer = 2.0
+            else:
+                self.combo_display_timer = max(0, self.combo_display_timer - dt)
         elif self.screen_state == "level_up":
             self.level_up_timer -= dt
             self.level_up_partikel_timer -= dt
@@ -1411,139 +2758,6 @@ class PizzeriaImperium:
                 self.screen_state = "spiel"
                 self.aktuelles_ereignis = None
 
-    def _update_spiel(self, dt: float):
-        self.state.spielzeit += dt
-
-        # Minuten-Umsatz tracken
-        if not hasattr(self.state, 'minuten_timer'):
-            self.state.minuten_timer = 0
-        self.state.minuten_timer += dt
-        if self.state.minuten_timer >= 60:
-            self.state.minuten_timer -= 60
-            if self.state.minuten_umsatz > self.state.max_minuten_umsatz:
-                self.state.max_minuten_umsatz = self.state.minuten_umsatz
-            self.state.minuten_umsatz = 0
-
-        # Statistik-Timer
-        self.stats_timer += dt
-
-        # Kunden spawnen
-        schwierig = SCHWIERIGKEITSGRADE[self.state.schwierigkeit]
-        kunden_intervall = max(3.0, 12.0 / self.mult_kunden / self._get_powerup_effekt("kunden_mult"))
-        # KORRIGIERT: Kein Zugriff auf nicht-existierenden Schlüssel 'kunden_mult'
-        self.kunden_timer -= dt
-        if self.kunden_timer <= 0:
-            self._neuer_kunde()
-            self.kunden_timer = kunden_intervall / max(0.1, self._get_powerup_effekt("kunden_mult"))
-            if random.random() < 0.3:
-                self._neuer_kunde()
-
-        # Kunden updaten
-        for k in list(self.kunden):
-            # Bewegung zum Tisch
-            dx = k.ziel_x - k.x
-            dy = k.ziel_y - k.y
-            d = math.sqrt(dx**2 + dy**2)
-            if d > 2:
-                speed = 120
-                k.x += (dx / d) * speed * dt
-                k.y += (dy / d) * speed * dt
-
-            # Geduld abnehmen (nur wenn am Tisch)
-            if d < 10:
-                k.geduld -= dt * (8 / schwierig["kunden_geduld_mult"])
-                k.geduld -= dt * (8 / self.mult_geduld)
-
-            # Ungedulds-Emoji
-            geduld_anteil = k.geduld / k.max_geduld
-            if geduld_anteil < 0.3 and not k.ungeduldig:
-                k.ungeduldig = True
-                k.emoji = "😠"
-            elif geduld_anteil < 0.6:
-                k.emoji = "😕"
-
-            # Kunde geht
-            if k.geduld <= 0:
-                self.kunden.remove(k)
-                self.state.kunden_verloren += 1
-                self.state.combo = 0
-                self._benachrichtigung("😢 Kunde gegangen!", C_RED, kurz=True)
-                self.partikel.add(k.x, k.y, C_RED, 5, "😠")
-
-            # Animation
-            k.animation_timer += dt
-
-        # Pizzen im Ofen backen
-        backzeit_mult = self.mult_backzeit * self._get_powerup_effekt("backzeit_mult")
-        for pizza in self.pizzen_im_ofen:
-            if pizza is None or pizza.fertig or pizza.verbrannt:
-                continue
-            pizza.fortschritt += dt * (1.0 / pizza.backzeit) * (1.0 / backzeit_mult)
-            if pizza.fortschritt >= 1.0:
-                pizza.fertig = True
-                pizza.fortschritt = 1.0
-                self._benachrichtigung(f"🍕 {pizza.name} fertig!", C_ACCENT, kurz=True)
-            elif pizza.fortschritt >= 1.3:
-                pizza.verbrannt = True
-                pizza.fertig = False
-
-        # Gehalt bezahlen
-        self.gehalt_timer -= dt
-        if self.gehalt_timer <= 0:
-            self.gehalt_timer = 30.0
-            gesamt_gehalt = 0
-            schwierig_kosten = SCHWIERIGKEITSGRADE[self.state.schwierigkeit]["kosten_mult"]
-            for p in self.personal:
-                gehalt = PERSONAL_TYPEN[p.typ]["gehalt"] * schwierig_kosten
-                gesamt_gehalt += gehalt
-            if gesamt_gehalt > 0:
-                self.state.geld -= gesamt_gehalt
-                self._benachrichtigung(f"💸 Gehalt: -{fmt_geld(gesamt_gehalt)}", C_GRAY, kurz=True)
-                if self.state.geld < 0:
-                    self.state.geld = 0
-                    self.screen_state = "game_over"
-                    self._speichere_highscore()
-
-        # Power-Ups ablaufen lassen
-        for ap in list(self.active_powerups):
-            ap.verbleibend -= dt
-            if ap.verbleibend <= 0:
-                self.active_powerups.remove(ap)
-                self._benachrichtigung(f"Power-Up {ap.name} abgelaufen", C_GRAY, kurz=True)
-
-        # Forschung vorantreiben
-        if self.aktive_forschung is not None:
-            self.aktive_forschung.verbleibend -= dt
-            if self.aktive_forschung.verbleibend <= 0:
-                fid = self.aktive_forschung.id
-                self.state.forschungen_abgeschlossen.append(fid)
-                f = next(x for x in FORSCHUNGEN if x["id"] == fid)
-                self._forschung_anwenden(fid)
-                self._benachrichtigung(f"🔬 Forschung abgeschlossen: {f['name']}!", C_PURPLE)
-                self.aktive_forschung = None
-                self._check_achievements()
-
-        # Zufallsereignis
-        self.ereignis_timer -= dt
-        if self.ereignis_timer <= 0:
-            self.ereignis_timer = random.uniform(60, 180)
-            chance = SCHWIERIGKEITSGRADE[self.state.schwierigkeit]["ereignis_chance"]
-            if random.random() < chance * 100:
-                self._zufallsereignis()
-
-        # Auto-Spielzug (Personal)
-        self._auto_spielzug(dt)
-
-        # Combo Display
-        if self.state.combo > 0:
-            self.combo_display_timer = 2.0
-        else:
-            self.combo_display_timer = max(0, self.combo_display_timer - dt)
-
-        # Achievements regelmäßig prüfen
-        if int(self.state.spielzeit * 10) % 50 == 0:
-            self._check_achievements()
-
     # ═══════════════════════════════════════════════════════════════
     #  ZEICHNEN
     # ═══════════════════════════════════════════════════════════════
@@ -1572,6 +2786,9 @@ class PizzeriaImperium:
         elif self.screen_state == "game_over":
             self._draw_game_over()
 
+        if self.screen_state != "spiel":
+            # Overlay oder anderer Screen → nächster Spiel-Frame braucht die ganze Leinwand
+            self.ebenen.voll = True
         pygame.display.flip()
 
     def _draw_hintergrund(self):
@@ -1629,24 +2846,32 @@ class PizzeriaImperium:
                      SCREEN_W // 2, SCREEN_H - 40, self.font_klein, C_GRAY, center=True)
 
     def _draw_spiel(self):
-        level_data = LEVELS[self.state.level]
-        bg = level_data["hintergrund"]
-        self.screen.fill(bg)
-
-        # Sterne
-        for (sx, sy, sz) in self.sterne[:40]:
-            hell = int(60 + 30 * math.sin(self.bg_anim + sx * 0.05))
-            pygame.draw.circle(self.screen, (hell, hell, hell + 20), (sx, sy), max(1, int(sz)))
-
-        # Hauptbereiche
+        # Leisten und Spielfeld-Boden liegen auf der Leinwand und decken den
+        # Bildschirm lückenlos ab – neu gezeichnet wird nur, was sich geändert
+        # hat, und nur das kommt wieder auf den Bildschirm
+        besetzt = frozenset(self.kunden.tische())
+        if self.ebenen.bereich("spielfeld", (self.state.level, len(self.tisch_positionen), besetzt),
+                               self.kundenschicht.rect,
+                               lambda surf: self._zeichne_spielfeld(surf, besetzt)):
+            self.kundenschicht.neuer_boden()
+        kunden = self.kundenschicht.aktualisieren(self._kunden_figuren())
         self._draw_linke_seitenleiste()
-        self._draw_spielfeld()
         self._draw_rechte_seitenleiste()
         self._draw_top_leiste()
         self._draw_bottom_leiste()
+        self.ebenen.auftragen(self.screen)
+
+        # Bewegliche Teile darüber – jedes meldet sein Rechteck an die Ebenen,
+        # damit der nächste Frame genau diese Stellen wiederherstellt. Rechte
+        # Leiste, Top- und Bottom-Leiste verdecken die Spielfiguren wie bisher
+        self.screen.set_clip((0, 50, SCREEN_W - 200, SCREEN_H - 160))
+        self._draw_spielfeld(kunden)
+        self.screen.set_clip(None)
 
         # Partikel
-        self.partikel.zeichne(self.screen, self.font_klein)
+        umriss = self.partikel.zeichne(self.screen, self.font_klein)
+        if umriss is not None:
+            self.ebenen.bewegt(umriss)
 
         # Benachrichtigungen
         self._draw_benachrichtigungen()
@@ -1659,54 +2884,74 @@ class PizzeriaImperium:
         self._draw_powerup_leiste()
 
     def _draw_top_leiste(self):
-        zeichne_rect_rund(self.screen, C_PANEL, (0, 0, SCREEN_W, 50), radius=0)
+        level_data = LEVELS[self.state.level]
+        fortschritt = min(1.0, self.state.gesamt_verdient / level_data["ziel_geld"])
+        # Die Buttons liegen mit auf der Leiste: neu gezeichnet wird nur,
+        # solange ein Hover- oder Klick-Effekt läuft
+        knoepfe = [self.btn_pause, self.btn_speichern, self.btn_menu_hs,
+                   self.btn_ach, self.btn_forschung]
+        schluessel = (fmt_geld(self.state.geld), fmt_geld(self.state.gesamt_verdient),
+                      self.state.level, int(fortschritt * 300), f"{fortschritt*100:.0f}",
+                      fmt_zeit(self.state.spielzeit), tuple(btn.ansicht() for btn in knoepfe))
+        self.ebenen.bereich("oben", schluessel, (0, 0, SCREEN_W, 50),
+                            lambda surf: self._zeichne_top_leiste(surf, knoepfe))
+
+    def _zeichne_top_leiste(self, surf, knoepfe):
+        surf.fill(C_PANEL)
 
         # Geld
-        zeichne_text(self.screen, fmt_geld(self.state.geld),
+        zeichne_text(surf, fmt_geld(self.state.geld),
                      160, 15, self.font_gross, C_GOLD)
-        zeichne_text(self.screen, "💰",  10, 15, self.font_normal)
-        zeichne_text(self.screen, "Gesamt: " + fmt_geld(self.state.gesamt_verdient),
+        zeichne_text(surf, "💰",  10, 15, self.font_normal)
+        zeichne_text(surf, "Gesamt: " + fmt_geld(self.state.gesamt_verdient),
                      10, 35, self.font_winzig, C_GRAY)
 
         # Level + Ziel
         level_data = LEVELS[self.state.level]
         fortschritt = min(1.0, self.state.gesamt_verdient / level_data["ziel_geld"])
-        zeichne_text(self.screen, f"Level {self.state.level}: {level_data['name']}",
+        zeichne_text(surf, f"Level {self.state.level}: {level_data['name']}",
                      SCREEN_W // 2, 8, self.font_normal, C_ACCENT, center=True)
-        zeichne_balken(self.screen, SCREEN_W // 2 - 150, 30, 300, 12,
+        zeichne_balken(surf, SCREEN_W // 2 - 150, 30, 300, 12,
                        self.state.gesamt_verdient, level_data["ziel_geld"],
                        C_ACCENT, C_DARKGRAY)
-        zeichne_text(self.screen,
+        zeichne_text(surf,
                      f"Ziel: {fmt_geld(level_data['ziel_geld'])} ({fortschritt*100:.0f}%)",
                      SCREEN_W // 2, 32, self.font_winzig, C_WHITE, center=True)
 
-        # Zeit + Buttons
-        zeichne_text(self.screen, f"⏱ {fmt_zeit(self.state.spielzeit)}",
+        # Zeit
+        zeichne_text(surf, f"⏱ {fmt_zeit(self.state.spielzeit)}",
                      SCREEN_W - 620, 15, self.font_klein, C_GRAY)
 
-        for btn in [self.btn_pause, self.btn_speichern, self.btn_menu_hs,
-                    self.btn_ach, self.btn_forschung]:
-            btn.zeichne(self.screen, self.font_normal, self.font_klein)
+        for btn in knoepfe:
+            btn.zeichne(surf, self.font_normal, self.font_klein)
 
     def _draw_bottom_leiste(self):
-        y = SCREEN_H - 110
-        zeichne_rect_rund(self.screen, C_PANEL, (0, y, SCREEN_W, 110), radius=0)
+        st = self.state
+        schluessel = (tuple(st.freigeschaltete_pizzen), self.ausgewaehlte_pizza,
+                      st.pizzen_gebacken, st.kunden_bedient, st.kunden_verloren, st.xp,
+                      st.schwierigkeit, sum(1 for o in self.pizzen_im_ofen if o is not None),
+                      len(self.pizzen_im_ofen))
+        self.ebenen.bereich("unten", schluessel, (0, SCREEN_H - 110, SCREEN_W, 110),
+                            self._zeichne_bottom_leiste)
+
+    def _zeichne_bottom_leiste(self, surf):
+        y = 0
+        surf.fill(C_PANEL)
 
         # Pizza-Auswahl
-        zeichne_text(self.screen, "Pizza wählen:", 10, y + 5, self.font_klein, C_GRAY)
+        zeichne_text(surf, "Pizza wählen:", 10, y + 5, self.font_klein, C_GRAY)
         pizza_x = 10
         for i, pname in enumerate(self.state.freigeschaltete_pizzen):
             farbe = C_PIZZAS.get(pname, C_ACCENT)
             ausgewaehlt = pname == self.ausgewaehlte_pizza
             pbreite = 90
             pr = pygame.Rect(pizza_x, y + 18, pbreite, 36)
-            rand_farbe = C_WHITE if ausgewaehlt else farbe
-            pygame.draw.rect(self.screen, farbe, pr, border_radius=6)
+            pygame.draw.rect(surf, farbe, pr, border_radius=6)
             if ausgewaehlt:
-                pygame.draw.rect(self.screen, C_WHITE, pr, 2, border_radius=6)
-            zeichne_text(self.screen, pname[:9], pr.centerx, pr.centery - 7,
+                pygame.draw.rect(surf, C_WHITE, pr, 2, border_radius=6)
+            zeichne_text(surf, pname[:9], pr.centerx, pr.centery - 7,
                          self.font_winzig, C_WHITE, center=True)
-            zeichne_text(self.screen, fmt_geld(PIZZEN[pname]["preis"]),
+            zeichne_text(surf, fmt_geld(PIZZEN[pname]["preis"]),
                          pr.centerx, pr.centery + 5,
                          self.font_winzig, C_GOLD, center=True)
             pizza_x += pbreite + 4
@@ -1721,245 +2966,346 @@ class PizzeriaImperium:
             f"⭐ XP: {self.state.xp}",
         ]
         for i, s in enumerate(stats):
-            zeichne_text(self.screen, s,
+            zeichne_text(surf, s,
                          SCREEN_W - 380 + i * 95, y + 8,
                          self.font_winzig, C_GRAY)
 
         # Schwierigkeit
-        zeichne_text(self.screen,
+        zeichne_text(surf,
                      f"Modus: {self.state.schwierigkeit}",
                      SCREEN_W - 200, y + 8, self.font_winzig,
                      SCHWIERIGKEITSGRADE[self.state.schwierigkeit]["farbe"])
 
         # Ofen-Slots Kurzinfo
         ofen_txt = f"Öfen: {sum(1 for o in self.pizzen_im_ofen if o is not None)}/{len(self.pizzen_im_ofen)}"
-        zeichne_text(self.screen, ofen_txt, SCREEN_W - 120, y + 30, self.font_winzig, C_ACCENT)
+        zeichne_text(surf, ofen_txt, SCREEN_W - 120, y + 30, self.font_winzig, C_ACCENT)
 
     def _draw_linke_seitenleiste(self):
-        """Linke Leiste: Öfen"""
-        zeichne_rect_rund(self.screen, C_PANEL, (0, 50, 200, SCREEN_H - 160), radius=0)
-        zeichne_text(self.screen, "🔥 Öfen", 100, 58, self.font_normal, C_ACCENT, center=True)
-
+        """Linke Leiste: Öfen (Hintergrund statisch, je Ofen eine Karten-Ebene)"""
+        self.ebenen.bereich("links", len(self.pizzen_im_ofen), (0, 50, 200, SCREEN_H - 160),
+                            self._zeichne_linke_leiste)
         for i, pizza in enumerate(self.pizzen_im_ofen):
-            oy = 85 + i * 80
-            ofen_rect = pygame.Rect(10, oy, 180, 70)
-
             if pizza is None:
-                zeichne_rect_rund(self.screen, C_DARKGRAY, ofen_rect, radius=8)
-                zeichne_text(self.screen, f"Ofen {i+1}: Leer",
-                             100, oy + 12, self.font_klein, C_GRAY, center=True)
-                zeichne_text(self.screen, "Klicken = Pizza rein",
-                             100, oy + 32, self.font_winzig, C_DARKGRAY, center=True)
-                zeichne_text(self.screen, "[LEERTASTE + Zahl]",
-                             100, oy + 47, self.font_winzig, C_DARKGRAY, center=True)
+                schluessel = None
             else:
-                # Farbe nach Zustand
-                if pizza.verbrannt:
-                    farbe = C_RED
-                    status = "VERBRANNT! Klicken"
-                elif pizza.fertig:
-                    farbe = C_GREEN
-                    status = "Fertig! Klicken"
-                else:
-                    anteil = pizza.fortschritt
-                    r = int(lerp(C_DARKGRAY[0], C_PIZZAS.get(pizza.name, C_ACCENT)[0], anteil))
-                    g = int(lerp(C_DARKGRAY[1], C_PIZZAS.get(pizza.name, C_ACCENT)[1], anteil))
-                    b = int(lerp(C_DARKGRAY[2], C_PIZZAS.get(pizza.name, C_ACCENT)[2], anteil))
-                    farbe = (r, g, b)
-                    status = f"{pizza.fortschritt*100:.0f}%"
-
-                zeichne_rect_rund(self.screen, farbe, ofen_rect, radius=8)
-                zeichne_text(self.screen, pizza.name,
-                             100, oy + 5, self.font_klein, C_WHITE, center=True)
-
-                if not pizza.fertig and not pizza.verbrannt:
-                    zeichne_balken(self.screen, 15, oy + 25, 170, 10,
-                                   pizza.fortschritt, 1.0, C_ACCENT2, C_DARKGRAY)
-
-                zeichne_text(self.screen, status,
-                             100, oy + 40, self.font_klein, C_WHITE, center=True)
-
-                backzeit_verbleibend = max(0,
-                    pizza.backzeit * (1 - pizza.fortschritt) * self.mult_backzeit)
-                zeichne_text(self.screen, f"Noch: {backzeit_verbleibend:.0f}s",
-                             100, oy + 55, self.font_winzig, C_GRAY, center=True)
+                # Neu zeichnen, sobald sich Balken (Pixel) oder Texte ändern
+                noch = max(0, pizza.backzeit * (1 - pizza.fortschritt)
+                           * self.forschung_mod["backzeit_mult"])
+                schluessel = (pizza.name, pizza.verbrannt, pizza.fertig,
+                              int(170 * clamp(pizza.fortschritt, 0, 1)),
+                              f"{pizza.fortschritt*100:.0f}%", f"Noch: {noch:.0f}s")
+            self.ebenen.bereich(("ofen", i), schluessel, (10, 85 + i * 80, 180, 70),
+                                lambda surf: self._zeichne_ofen(surf, i, pizza, schluessel))
+
+    def _zeichne_linke_leiste(self, surf):
+        surf.fill(C_PANEL)
+        zeichne_text(surf, "🔥 Öfen", 100, 8, self.font_normal, C_ACCENT, center=True)
+
+    def _zeichne_ofen(self, surf, i, pizza, schluessel):
+        # Die abgerundete Karte deckt alles bis auf die Ecken ab. Ein fill()
+        # über die ganze Karte kostet hier ein Vielfaches (SDL füllt breite
+        # Zeilen mit Streaming-Stores am Cache vorbei)
+        for ecke in ((0, 0), (172, 0), (0, 62), (172, 62)):
+            surf.fill(C_PANEL, (*ecke, 8, 8))
+        ofen_rect = pygame.Rect(0, 0, 180, 70)
+        x, oy = 90, 0
 
-    def _draw_rechte_seitenleiste(self):
-        """Rechte Leiste: Kunden & Personal"""
-        x0 = SCREEN_W - 200
-        zeichne_rect_rund(self.screen, C_PANEL, (x0, 50, 200, SCREEN_H - 160), radius=0)
+        if pizza is None:
+            zeichne_rect_rund(surf, C_DARKGRAY, ofen_rect, radius=8)
+            zeichne_text(surf, f"Ofen {i+1}: Leer",
+                         x, oy + 12, self.font_klein, C_GRAY, center=True)
+            zeichne_text(surf, "Klicken = Pizza rein",
+                         x, oy + 32, self.font_winzig, C_DARKGRAY, center=True)
+            zeichne_text(surf, "[LEERTASTE + Zahl]",
+                         x, oy + 47, self.font_winzig, C_DARKGRAY, center=True)
+            return
 
-        # Kunden-Anzeige
-        zeichne_text(self.screen, f"👥 Kunden ({len(self.kunden)})",
-                     x0 + 100, 58, self.font_normal, C_BLUE, center=True)
+        name, verbrannt, fertig, _, status, noch = schluessel
+        anteil = pizza.fortschritt
+        # Farbe nach Zustand
+        if verbrannt:
+            farbe = C_RED
+            status = "VERBRANNT! Klicken"
+        elif fertig:
+            farbe = C_GREEN
+            status = "Fertig! Klicken"
+        else:
+            ziel = C_PIZZAS.get(name, C_ACCENT)
+            farbe = tuple(int(lerp(C_DARKGRAY[c], ziel[c], anteil)) for c in range(3))
 
-        for i, k in enumerate(self.kunden[:6]):
-            ky = 85 + i * 48
-            kr = pygame.Rect(x0 + 5, ky, 190, 42)
-            bg = (40, 40, 80) if k.vip else C_DARKGRAY
-            zeichne_rect_rund(self.screen, bg, kr, radius=6)
-
-            # Emoji + Name
-            zeichne_text(self.screen, k.emoji, x0 + 10, ky + 5, self.font_normal)
-            zeichne_text(self.screen, f"{k.pizza_name[:10]}",
-                         x0 + 35, ky + 5, self.font_klein,
-                         C_GOLD if k.vip else C_WHITE)
-            if k.vip:
-                zeichne_text(self.screen, "VIP", x0 + 155, ky + 5,
-                             self.font_winzig, C_GOLD)
-
-            # Gedulds-Balken
-            farbe_geduld = (
-                C_GREEN if k.geduld / k.max_geduld > 0.6 else
-                C_YELLOW if k.geduld / k.max_geduld > 0.3 else
-                C_RED
-            )
-            zeichne_balken(self.screen, x0 + 35, ky + 28, 155, 8,
-                           k.geduld, k.max_geduld, farbe_geduld)
+        # Die Karte wird bei jedem Balken-Pixel neu gezeichnet, die Texte
+        # wechseln viel seltener – deshalb aus dem Text-Cache
+        zeichne_rect_rund(surf, farbe, ofen_rect, radius=8)
+        self.ebenen.text(surf, name, x, oy + 5, self.font_klein, C_WHITE, center=True)
+
+        if not fertig and not verbrannt:
+            zeichne_balken(surf, 5, oy + 25, 170, 10,
+                           anteil, 1.0, C_ACCENT2, C_DARKGRAY)
 
-        if len(self.kunden) > 6:
-            zeichne_text(self.screen, f"... +{len(self.kunden) - 6} weitere",
-                         x0 + 100, 85 + 6 * 48 + 5, self.font_winzig, C_GRAY, center=True)
+        self.ebenen.text(surf, status, x, oy + 40, self.font_klein, C_WHITE, center=True)
+        self.ebenen.text(surf, noch, x, oy + 55, self.font_winzig, C_GRAY, center=True)
 
-        # Personal-Anzeige
-        personal_y = 85 + 6 * 48 + 30
-        zeichne_text(self.screen, f"👤 Personal ({len(self.personal)})",
+    def _draw_rechte_seitenleiste(self):
+        """Rechte Leiste: Kunden & Personal"""
+        x0 = SCREEN_W - 200
+        schluessel = (tuple((p.name, p.typ) for p in self.personal[:4]),
+                      len(self.personal), tuple(fp.name for fp in self.fertige_pizzen[:4]))
+        self.ebenen.bereich("rechts", schluessel, (x0, 50, 200, SCREEN_H - 160),
+                            self._zeichne_rechte_leiste)
+
+        # Kundenzahl und Karten wechseln in der Rush-Hour ständig – eigene
+        # kleine Bereiche, damit nicht jedes Mal die ganze Leiste neu entsteht
+        n = len(self.kunden)
+        self.ebenen.bereich("kunden_kopf", n, (x0, 50, 200, 34),
+                            lambda surf: self._zeichne_kunden_kopf(surf, n))
+        for i in range(6):
+            karte_schluessel = None
+            if i < n:
+                k = self.kunden[i]
+                karte_schluessel = (k.emoji, k.pizza_name, k.vip)
+            ky = 85 + i * 48
+            self.ebenen.bereich(("kunde", i), karte_schluessel, (x0 + 5, ky, 190, 42),
+                                lambda surf: self._zeichne_kunden_karte(surf, karte_schluessel))
+            if karte_schluessel is not None:
+                # Gedulds-Balken als Unterbereich der Karte
+                anteil = k.geduld / k.max_geduld
+                farbe_geduld = C_GREEN if anteil > 0.6 else C_YELLOW if anteil > 0.3 else C_RED
+                balken_schluessel = (k.vip, int(155 * clamp(anteil, 0, 1)), farbe_geduld)
+                self.ebenen.bereich(("geduld", i), balken_schluessel, (x0 + 35, ky + 28, 155, 8),
+                                    lambda surf: self._zeichne_geduld(surf, balken_schluessel))
+        self.ebenen.bereich("kunden_rest", max(0, n - 6), (x0, 370, 200, 30),
+                            lambda surf: self._zeichne_kunden_rest(surf, n - 6))
+
+    def _zeichne_rechte_leiste(self, surf):
+        x0 = 0
+        surf.fill(C_PANEL)
+        dy = -50   # Leisten-Koordinaten → Ebenen-Koordinaten
+
+        # Personal-Anzeige (Kunden-Anzeige: eigene Bereiche)
+        personal_y = 85 + 6 * 48 + 30 + dy
+        zeichne_text(surf, f"👤 Personal ({len(self.personal)})",
                      x0 + 100, personal_y, self.font_normal, C_PURPLE, center=True)
 
         for i, p in enumerate(self.personal[:4]):
             py = personal_y + 25 + i * 38
             pr = pygame.Rect(x0 + 5, py, 190, 32)
-            zeichne_rect_rund(self.screen, C_PANEL2, pr, radius=6)
+            zeichne_rect_rund(surf, C_PANEL2, pr, radius=6)
             typ_farbe = PERSONAL_TYPEN[p.typ]["farbe"]
-            pygame.draw.rect(self.screen, typ_farbe, (x0 + 5, py, 4, 32))
-            zeichne_text(self.screen, p.name[:14], x0 + 14, py + 4, self.font_winzig, C_WHITE)
-            zeichne_text(self.screen, p.typ, x0 + 14, py + 16, self.font_winzig, typ_farbe)
+            pygame.draw.rect(surf, typ_farbe, (x0 + 5, py, 4, 32))
+            zeichne_text(surf, p.name[:14], x0 + 14, py + 4, self.font_winzig, C_WHITE)
+            zeichne_text(surf, p.typ, x0 + 14, py + 16, self.font_winzig, typ_farbe)
 
         # Fertige Pizzen
         fertig_y = personal_y + 25 + len(self.personal) * 38 + 15
         if self.fertige_pizzen:
-            zeichne_text(self.screen, "🍕 Fertige Pizzen:",
+            zeichne_text(surf, "🍕 Fertige Pizzen:",
                          x0 + 100, fertig_y, self.font_klein, C_GREEN, center=True)
             for i, fp in enumerate(self.fertige_pizzen[:4]):
                 py = fertig_y + 20 + i * 24
-                zeichne_text(self.screen, f"• {fp.name}",
+                zeichne_text(surf, f"• {fp.name}",
                              x0 + 10, py, self.font_winzig,
                              C_PIZZAS.get(fp.name, C_WHITE))
 
-    def _draw_spielfeld(self):
-        """Mittleres Spielfeld: Tische, Kunden"""
+    def _zeichne_kunden_kopf(self, surf, n):
+        surf.fill(C_PANEL)
+        zeichne_text(surf, f"👥 Kunden ({n})", 100, 8, self.font_normal, C_BLUE, center=True)
+
+    def _zeichne_kunden_rest(self, surf, rest):
+        surf.fill(C_PANEL)
+        if rest > 0:
+            zeichne_text(surf, f"... +{rest} weitere",
+                         100, 85 + 6 * 48 + 5 - 370, self.font_winzig, C_GRAY, center=True)
+
+    def _zeichne_kunden_karte(self, surf, schluessel):
+        surf.fill(C_PANEL)
+        if schluessel is None:
+            return
+        emoji, pizza_name, vip = schluessel
+        zeichne_rect_rund(surf, (40, 40, 80) if vip else C_DARKGRAY, (0, 0, 190, 42), radius=6)
+
+        # Emoji + Name
+        zeichne_text(surf, emoji, 5, 5, self.font_normal)
+        zeichne_text(surf, f"{pizza_name[:10]}", 30, 5, self.font_klein,
+                     C_GOLD if vip else C_WHITE)
+        if vip:
+            zeichne_text(surf, "VIP", 150, 5, self.font_winzig, C_GOLD)
+
+    def _zeichne_geduld(self, surf, schluessel):
+        vip, balken, farbe_geduld = schluessel
+        surf.fill((40, 40, 80) if vip else C_DARKGRAY)
+        # +0.5: int(155 * b/155) landet sonst bei manchen b auf b-1
+        zeichne_balken(surf, 0, 0, 155, 8, balken + 0.5, 155, farbe_geduld)
+
+    def _draw_spielfeld(self, kunden):
+        """Mittleres Spielfeld: laufende Kunden, Personal, Forschung"""
         x0, y0 = 200, 50
         breite = SCREEN_W - 400
         hoehe = SCREEN_H - 160
 
-        # Spielfeld-Hintergrund
-        zeichne_rect_rund(self.screen, (25, 25, 40), (x0, y0, breite, hoehe), radius=0)
-
-        # Boden-Muster
-        for gx in range(x0, x0 + breite, 60):
-            pygame.draw.line(self.screen, (30, 30, 50), (gx, y0), (gx, y0 + hoehe))
-        for gy in range(y0, y0 + hoehe, 60):
-            pygame.draw.line(self.screen, (30, 30, 50), (x0, gy), (x0 + breite, gy))
-
-        # Tische zeichnen
-        for i, (tx, ty) in enumerate(self.tisch_positionen):
-            # Prüfe ob belegt
-            besetzt = any(k.tisch_id == i for k in self.kunden)
-            farbe = C_PANEL2 if not besetzt else C_PANEL
-            pygame.draw.circle(self.screen, farbe, (int(tx), int(ty)), 25)
-            pygame.draw.circle(self.screen, C_DARKGRAY, (int(tx), int(ty)), 25, 2)
-            zeichne_text(self.screen, str(i + 1),
-                         int(tx), int(ty) - 7, self.font_klein, C_GRAY, center=True)
-
-        # Kunden auf dem Spielfeld
-        for k in self.kunden:
-            self._draw_kunde_spielfeld(k)
+        # Boden, Tische und ruhende Kunden liegen auf der Leinwand
+        if kunden:
+            self.ebenen.bewegt(*self.screen.blits(kunden))
 
         # Personal auf dem Spielfeld
         for p in self.personal:
-            self._draw_personal_spielfeld(p)
-
-        # Forschungs-Anzeige
-        if self.aktive_forschung:
-            f = next(x for x in FORSCHUNGEN if x["id"] == self.aktive_forschung.id)
-            fortschritt = 1.0 - self.aktive_forschung.verbleibend / self.aktive_forschung.gesamt
-            fx, fy = x0 + breite // 2, y0 + hoehe - 40
-            zeichne_text(self.screen, f"🔬 {f['name']}",
-                         fx, fy - 15, self.font_klein, C_PURPLE, center=True)
-            zeichne_balken(self.screen, fx - 100, fy, 200, 10,
+            self.ebenen.bewegt(self._draw_personal_spielfeld(p))
+
+        # Forschungs-Anzeige (ein Balken pro belegtem Labor)
+        n = len(self.labor)
+        for i, p in enumerate(self.labor):
+            f = self.forschung[p.id]
+            fortschritt = 1.0 - p.verbleibend / p.gesamt
+            fx, fy = x0 + breite * (2 * i + 1) // (2 * n), y0 + hoehe - 40
+            self.ebenen.bewegt(
+                self.ebenen.text(self.screen, f"🔬 {f['name']}",
+                                 fx, fy - 15, self.font_klein, C_PURPLE, center=True),
+                pygame.Rect(fx - 80, fy, 160, 10))
+            zeichne_balken(self.screen, fx - 80, fy, 160, 10,
                            fortschritt, 1.0, C_PURPLE)
 
-        # Level-Name im Spielfeld
-        zeichne_text(self.screen, LEVELS[self.state.level]["beschreibung"],
-                     x0 + breite // 2, y0 + 10, self.font_winzig, C_DARKGRAY, center=True)
+    def _zeichne_spielfeld(self, surf, besetzt):
+        x0, y0 = 200, 50
+        breite, hoehe = surf.get_size()
+        surf.fill((25, 25, 40))
+
+        # Boden-Muster
+        for gx in range(0, breite, 60):
+            pygame.draw.line(surf, (30, 30, 50), (gx, 0), (gx, hoehe))
+        for gy in range(0, hoehe, 60):
+            pygame.draw.line(surf, (30, 30, 50), (0, gy), (breite, gy))
+
+        # Tische (frei und besetzt)
+        for i, (tx, ty) in enumerate(self.tisch_positionen):
+            if i in besetzt:
+                tisch = self.ebenen.sprite(("tisch", i), (52, 52),
+                                           lambda s: self._zeichne_tisch(s, i, C_PANEL))
+            else:
+                tisch = self.ebenen.sprite(("tisch_frei", i), (52, 52),
+                                           lambda s: self._zeichne_tisch(s, i, C_PANEL2))
+            surf.blit(tisch, (int(tx) - 26 - x0, int(ty) - 26 - y0))
 
-    def _draw_kunde_spielfeld(self, k: Kunde):
-        x, y = int(k.x), int(k.y)
-        geduld_anteil = k.geduld / k.max_geduld
+        # Level-Name im Spielfeld
+        zeichne_text(surf, LEVELS[self.state.level]["beschreibung"],
+                     breite // 2, 10, self.font_winzig, C_DARKGRAY, center=True)
+
+    def _zeichne_tisch(self, surf, i, farbe):
+        pygame.draw.circle(surf, farbe, (26, 26), 25)
+        pygame.draw.circle(surf, C_DARKGRAY, (26, 26), 25, 2)
+        zeichne_text(surf, str(i + 1), 26, 19, self.font_klein, C_GRAY, center=True)
+
+    def _kunden_figuren(self):
+        """Alle Kunden als (ID, (Sprite, Pos)) für die Kundenschicht – direkt aus
+        den Puffer-Spalten statt über die Kunde-Sichten."""
+        puffer = self.kunden
+        n = puffer.n
+        if n == 0:
+            return []
+        vorhanden = self.ebenen.sprites.get
+        figuren = []
+        anhaengen = figuren.append
+        for kid, x, y, geduld, max_geduld, vip, stimmung, emoji, name in zip(
+                puffer.id[:n].tolist(), puffer.x[:n].tolist(), puffer.y[:n].tolist(),
+                puffer.geduld[:n].tolist(), puffer.max_geduld[:n].tolist(), puffer.vip[:n].tolist(),
+                puffer.stimmung[:n].tolist(), puffer.emoji, puffer.pizza_name):
+            # Geduld-Anteil auf 0..1 begrenzt, als Balkenlänge in Pixeln
+            anteil = geduld / max_geduld
+            if anteil > 0.5:
+                farbe = C_GREEN
+                balken = 40 if anteil >= 1.0 else int(40 * anteil)
+            else:
+                farbe = C_YELLOW if anteil > 0.25 else C_RED
+                balken = int(40 * anteil) if anteil > 0.0 else 0
+            schluessel = ("kunde", vip, STIMMUNG_EMOJI[stimmung] or emoji, name[:8], balken, farbe)
+            eintrag = vorhanden(schluessel)
+            if eintrag is None:
+                eintrag = self.ebenen.figur(schluessel, (96, 82), (48, 54),
+                                            lambda surf: self._zeichne_kunde(surf, schluessel))
+                sprite, dx, dy = eintrag
+                # Gedulds-Balken wie in _zeichne_kunde, relativ zum Zuschnitt
+                self._kunden_bilder[sprite] = (schluessel, pygame.Rect(-20 - dx, -28 - dy, 40, 6))
+            sprite, dx, dy = eintrag
+            anhaengen((kid, (sprite, (int(x) + dx, int(y) + dy))))
+        return figuren
+
+    def _kunden_aenderung(self, alt, neu):
+        """Unterscheiden sich zwei Kunden-Sprites nur im Gedulds-Balken, reicht dessen Rechteck."""
+        a, b = self._kunden_bilder.get(alt), self._kunden_bilder.get(neu)
+        if a is not None and b is not None and a[0][:4] == b[0][:4]:
+            return b[1]
+        return None
+
+    def _zeichne_kunde(self, surf, schluessel):
+        _, vip, emoji, name, balken, farbe_geduld = schluessel
+        x, y = 48, 54
 
         # Schatten
-        pygame.draw.ellipse(self.screen, (10, 10, 20), (x - 18, y + 16, 36, 10))
+        pygame.draw.ellipse(surf, (10, 10, 20), (x - 18, y + 16, 36, 10))
 
         # Körper
-        farbe = C_GOLD if k.vip else (100, 150, 255)
-        pygame.draw.circle(self.screen, farbe, (x, y), 16)
-        pygame.draw.circle(self.screen, C_WHITE, (x, y), 16, 2)
+        farbe = C_GOLD if vip else (100, 150, 255)
+        pygame.draw.circle(surf, farbe, (x, y), 16)
+        pygame.draw.circle(surf, C_WHITE, (x, y), 16, 2)
 
         # Emoji
-        emoji_surf = self.font_emoji.render(k.emoji, True, C_WHITE)
-        self.screen.blit(emoji_surf, (x - emoji_surf.get_width() // 2,
-                                      y - emoji_surf.get_height() // 2))
+        emoji_surf = self.font_emoji.render(emoji, True, C_WHITE)
+        surf.blit(emoji_surf, (x - emoji_surf.get_width() // 2,
+                               y - emoji_surf.get_height() // 2))
 
         # Gedulds-Balken über Kopf
-        zeichne_balken(self.screen, x - 20, y - 28, 40, 6,
-                       k.geduld, k.max_geduld,
-                       C_GREEN if geduld_anteil > 0.5 else
-                       C_YELLOW if geduld_anteil > 0.25 else C_RED)
+        zeichne_balken(surf, x - 20, y - 28, 40, 6, balken, 40, farbe_geduld)
 
         # Pizza-Bestellung über Kopf
-        zeichne_text(self.screen, k.pizza_name[:8],
-                     x, y - 38, self.font_winzig, C_WHITE, center=True)
+        zeichne_text(surf, name, x, y - 38, self.font_winzig, C_WHITE, center=True)
 
         # VIP-Krone
-        if k.vip:
-            zeichne_text(self.screen, "👑", x - 8, y - 52, self.font_winzig)
+        if vip:
+            zeichne_text(surf, "👑", x - 8, y - 52, self.font_winzig)
 
     def _draw_personal_spielfeld(self, p: Personal):
-        x, y = int(p.x), int(p.y)
+        schluessel = ("personal", p.typ, p.name.split()[0])
+        sprite = self.ebenen.sprite(schluessel, (96, 60),
+                                    lambda surf: self._zeichne_personal(surf, p))
+        return self.screen.blit(sprite, (int(p.x) - 48, int(p.y) - 32))
+
+    def _zeichne_personal(self, surf, p: Personal):
+        x, y = 48, 32
         farbe = PERSONAL_TYPEN[p.typ]["farbe"]
 
         # Schatten
-        pygame.draw.ellipse(self.screen, (10, 10, 20), (x - 15, y + 14, 30, 8))
+        pygame.draw.ellipse(surf, (10, 10, 20), (x - 15, y + 14, 30, 8))
 
         # Körper (Dreieck = Chef-Hut-Form)
-        pygame.draw.circle(self.screen, farbe, (x, y), 14)
-        pygame.draw.circle(self.screen, C_WHITE, (x, y), 14, 2)
+        pygame.draw.circle(surf, farbe, (x, y), 14)
+        pygame.draw.circle(surf, C_WHITE, (x, y), 14, 2)
 
         # Typ-Buchstabe
         buchstabe = p.typ[0]
-        zeichne_text(self.screen, buchstabe, x, y - 7, self.font_klein, C_BLACK, center=True)
+        zeichne_text(surf, buchstabe, x, y - 7, self.font_klein, C_BLACK, center=True)
 
         # Name über Kopf
-        zeichne_text(self.screen, p.name.split()[0],
+        zeichne_text(surf, p.name.split()[0],
                      x, y - 26, self.font_winzig, farbe, center=True)
 
     def _draw_benachrichtigungen(self):
         bx = SCREEN_W // 2
         by = SCREEN_H - 140
         for i, b in enumerate(reversed(self.benachrichtigungen[-5:])):
-            alpha = min(1.0, b.timer)
-            farbe = tuple(int(c * alpha) for c in b.farbe)
-            zeichne_text(self.screen, b.text,
-                         bx, by - i * 22 + b.y_offset,
-                         self.font_klein, farbe, center=True)
+            # Ausblenden in ALPHA_STUFEN wie bei den Partikeln → Render bleibt im Cache
+            stufe = math.ceil(clamp(b.timer, 0, 1) * ALPHA_STUFEN)
+            farbe = tuple(c * stufe // ALPHA_STUFEN for c in b.farbe)
+            self.ebenen.bewegt(self.ebenen.text(self.screen, b.text,
+                                                bx, by - i * 22 + int(b.y_offset),
+                                                self.font_klein, farbe, center=True))
 
     def _draw_combo(self):
         if self.state.combo < 2:
             return
         anim = abs(math.sin(pygame.time.get_ticks() / 200)) * 0.3 + 0.7
         farbe = tuple(int(c * anim) for c in C_GOLD)
-        zeichne_text(self.screen, f"🔥 COMBO x{self.state.combo}!",
-                     SCREEN_W // 2, 70, self.font_gross, farbe, center=True)
+        breite = zeichne_text(self.screen, f"🔥 COMBO x{self.state.combo}!",
+                              SCREEN_W // 2, 70, self.font_gross, farbe, center=True)
+        self.ebenen.bewegt(pygame.Rect(SCREEN_W // 2 - breite // 2, 70,
+                                       breite, self.font_gross.get_height()))
 
     def _draw_powerup_leiste(self):
         if not self.active_powerups:
@@ -1972,14 +3318,13 @@ class PizzeriaImperium:
             zeichne_rect_rund(self.screen, daten["farbe"], pr, radius=6, alpha=180)
             anteil = ap.verbleibend / ap.gesamt
             zeichne_balken(self.screen, px, py + 22, 150, 6, anteil, 1.0, daten["farbe"])
-            zeichne_text(self.screen, f"{daten['icon']} {ap.name[:10]}",
-                         px + 75, py + 5, self.font_winzig, C_WHITE, center=True)
+            self.ebenen.bewegt(pr, self.ebenen.text(self.screen, f"{daten['icon']} {ap.name[:10]}",
+                                                    px + 75, py + 5, self.font_winzig,
+                                                    C_WHITE, center=True))
             px += 160
 
     def _draw_pause_overlay(self):
-        overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        self.screen.blit(overlay, (0, 0))
+        zeichne_rect_rund(self.screen, C_BLACK, (0, 0, SCREEN_W, SCREEN_H), radius=0, alpha=160)
 
         zeichne_text(self.screen, "⏸ PAUSE", SCREEN_W // 2, SCREEN_H // 2 - 40,
                      self.font_titel, C_WHITE, center=True)
@@ -1989,9 +3334,7 @@ class PizzeriaImperium:
                      SCREEN_W // 2, SCREEN_H // 2 + 55, self.font_normal, C_TEAL, center=True)
 
     def _draw_level_up(self):
-        overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 120))
-        self.screen.blit(overlay, (0, 0))
+        zeichne_rect_rund(self.screen, C_BLACK, (0, 0, SCREEN_W, SCREEN_H), radius=0, alpha=120)
 
         puls = abs(math.sin(pygame.time.get_ticks() / 300)) * 0.2 + 0.8
         level_data = LEVELS[self.state.level]
@@ -2015,9 +3358,7 @@ class PizzeriaImperium:
     def _draw_ereignis(self):
         if not self.aktuelles_ereignis:
             return
-        overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
+        zeichne_rect_rund(self.screen, C_BLACK, (0, 0, SCREEN_W, SCREEN_H), radius=0, alpha=150)
 
         e = self.aktuelles_ereignis
         box_w, box_h = 500, 200
@@ -2038,10 +3379,30 @@ class PizzeriaImperium:
         zeichne_balken(self.screen, bx + 20, by + 180, box_w - 40, 8,
                        self.ereignis_timer2, 5.0, e["farbe"])
 
-    def _draw_highscores(self):
-        self._draw_hintergrund()
-        zeichne_text(self.screen, "🏆 HIGHSCORES",
-                     SCREEN_W // 2, 60, self.font_titel, C_GOLD, center=True)
+    def _highscore_filter_wechseln(self, richtung: int):
+        filter_ = [HIGHSCORE_ALLE] + list(SCHWIERIGKEITSGRADE)
+        i = filter_.index(self.highscore_filter) if self.highscore_filter in filter_ else 0
+        self.highscore_filter = filter_[(i + richtung) % len(filter_)]
+
+    def _highscore_ebene(self):
+        """Tabelle der gewählten Rangliste – neu gezeichnet nur bei neuem Eintrag
+        oder anderem Filter."""
+        schluessel = (self.highscores.version, self.highscore_filter)
+        if self._highscore_cache is not None and self._highscore_cache[0] == schluessel:
+            return self._highscore_cache[1]
+
+        ebene = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        zeichne_text(ebene, "🏆 HIGHSCORES",
+                     SCREEN_W // 2, 40, self.font_titel, C_GOLD, center=True)
+
+        # Filter-Reiter
+        filter_ = [HIGHSCORE_ALLE] + list(SCHWIERIGKEITSGRADE)
+        tab_w = (SCREEN_W - 160) // len(filter_)
+        for i, name in enumerate(filter_):
+            aktiv = name == self.highscore_filter
+            farbe = SCHWIERIGKEITSGRADE[name]["farbe"] if name in SCHWIERIGKEITSGRADE else C_GOLD
+            zeichne_text(ebene, name, 80 + i * tab_w + tab_w // 2, 92,
+                         self.font_klein, farbe if aktiv else C_DARKGRAY, center=True)
 
         headers = ["#", "Verdient", "Level", "Pizzen", "Schwierigkeitsgr.", "Datum"]
         widths   = [40, 150, 80, 80, 160, 180]
@@ -2050,13 +3411,14 @@ class PizzeriaImperium:
             xs.append(xs[-1] + w)
 
         for i, (h, x) in enumerate(zip(headers, xs)):
-            zeichne_text(self.screen, h, x, 120, self.font_normal, C_GRAY)
+            zeichne_text(ebene, h, x, 120, self.font_normal, C_GRAY)
 
-        for i, hs in enumerate(self.highscores[:15]):
+        liste = self.highscores.rangliste(self.highscore_filter)
+        for i, hs in enumerate(liste[:15]):
             y = 155 + i * 35
             farbe = C_GOLD if i == 0 else C_SILVER if i == 1 else C_BRONZE if i == 2 else C_WHITE
             if i % 2 == 0:
-                zeichne_rect_rund(self.screen, C_PANEL, (75, y - 3, SCREEN_W - 150, 30), radius=4)
+                zeichne_rect_rund(ebene, C_PANEL, (75, y - 3, SCREEN_W - 150, 30), radius=4)
 
             werte = [
                 str(i + 1),
@@ -2067,14 +3429,22 @@ class PizzeriaImperium:
                 hs.get("datum", "?"),
             ]
             for w, x in zip(werte, xs):
-                zeichne_text(self.screen, w, x, y, self.font_normal, farbe)
+                zeichne_text(ebene, w, x, y, self.font_normal, farbe)
 
-        if not self.highscores:
-            zeichne_text(self.screen, "Noch keine Scores vorhanden!",
+        if not liste:
+            zeichne_text(ebene, "Noch keine Scores vorhanden!",
                          SCREEN_W // 2, 300, self.font_gross, C_GRAY, center=True)
 
-        zeichne_text(self.screen, "ESC = Zurück",
+        zeichne_text(ebene, f"{len(self.highscores)} Ergebnisse insgesamt",
+                     SCREEN_W // 2, SCREEN_H - 70, self.font_klein, C_DARKGRAY, center=True)
+        zeichne_text(ebene, "←/→ = Schwierigkeitsgrad  |  ESC = Zurück",
                      SCREEN_W // 2, SCREEN_H - 40, self.font_normal, C_GRAY, center=True)
+        self._highscore_cache = (schluessel, ebene)
+        return ebene
+
+    def _draw_highscores(self):
+        self._draw_hintergrund()
+        self.screen.blit(self._highscore_ebene(), (0, 0))
 
     def _draw_achievements(self):
         self._draw_hintergrund()
@@ -2115,41 +3485,43 @@ class PizzeriaImperium:
         zeichne_text(self.screen, "ESC = Zurück",
                      SCREEN_W // 2, SCREEN_H - 30, self.font_klein, C_GRAY, center=True)
 
-    def _draw_forschung(self):
-        self._draw_hintergrund()
-        zeichne_text(self.screen, "🔬 FORSCHUNGS-BAUM",
-                     SCREEN_W // 2, 40, self.font_titel, C_PURPLE, center=True)
-
-        if self.aktive_forschung:
-            f = next(x for x in FORSCHUNGEN if x["id"] == self.aktive_forschung.id)
-            fort = 1.0 - self.aktive_forschung.verbleibend / self.aktive_forschung.gesamt
-            zeichne_text(self.screen, f"Aktiv: {f['name']} ({fort*100:.0f}%)",
-                         SCREEN_W // 2, 90, self.font_normal, C_PURPLE, center=True)
-            zeichne_balken(self.screen, SCREEN_W // 2 - 150, 115, 300, 12,
-                           fort, 1.0, C_PURPLE)
-        else:
-            zeichne_text(self.screen, "Keine aktive Forschung — klicke eine an!",
-                         SCREEN_W // 2, 90, self.font_normal, C_GRAY, center=True)
-
-        cols = 3
-        col_w = (SCREEN_W - 60) // cols
-        for i, f in enumerate(FORSCHUNGEN):
-            col = i % cols
-            row = i // cols
-            x = 30 + col * col_w
-            y = 140 + row * 100
-
-            abgeschlossen = f["id"] in self.state.forschungen_abgeschlossen
-            aktiv = self.aktive_forschung and self.aktive_forschung.id == f["id"]
-
-            # Voraussetzungen erfüllt?
-            voraus_ok = all(v in self.state.forschungen_abgeschlossen for v in f["voraus"])
-            verfuegbar = voraus_ok and not abgeschlossen and not aktiv
+    def _forschung_layout(self) -> list:
+        """(id, Rect)-Paare des Forschungs-Rasters – einmal pro Baum berechnet."""
+        if self._forschung_rects is None:
+            cols = 3
+            col_w = (SCREEN_W - 60) // cols
+            self._forschung_rects = [
+                (fid, pygame.Rect(30 + (i % cols) * col_w, 140 + (i // cols) * 100,
+                                  col_w - 20, 85))
+                for i, fid in enumerate(self.forschung.reihenfolge)]
+        return self._forschung_rects
+
+    def _forschung_ebene(self):
+        """Karten aller Forschungen auf eine Surface zeichnen.
+
+        Neu gezeichnet wird nur, wenn sich der Baum-Zustand (``version``),
+        die Labore oder die Warteschlange ändern – sonst wird nur geblittet.
+        """
+        aktiv_ids = tuple(p.id for p in self.labor)
+        warteschlange = tuple(self.forschung_warteschlange)
+        schluessel = (self.forschung.version, aktiv_ids, warteschlange)
+        if self._forschung_cache is not None and self._forschung_cache[0] == schluessel:
+            return self._forschung_cache[1]
+
+        ebene = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        for fid, fr in self._forschung_layout():
+            f = self.forschung[fid]
+            x, y = fr.x, fr.y
+            abgeschlossen = self.forschung.erforscht(fid)
+            aktiv = fid in aktiv_ids
+            wartend = fid in warteschlange
+            voraus_ok = self.forschung_planbar(fid)
+            verfuegbar = voraus_ok and not abgeschlossen and not aktiv and not wartend
 
             if abgeschlossen:
                 bg = (40, 80, 40)
                 rand = C_GREEN
-            elif aktiv:
+            elif aktiv or wartend:
                 bg = (40, 40, 80)
                 rand = C_PURPLE
             elif verfuegbar:
@@ -2159,33 +3531,64 @@ class PizzeriaImperium:
                 bg = (20, 20, 30)
                 rand = (40, 40, 60)
 
-            fr = pygame.Rect(x, y, col_w - 20, 85)
-            zeichne_rect_rund(self.screen, bg, fr, radius=8)
-            pygame.draw.rect(self.screen, rand, fr, 2, border_radius=8)
+            zeichne_rect_rund(ebene, bg, fr, radius=8)
+            pygame.draw.rect(ebene, rand, fr, 2, border_radius=8)
 
-            zeichne_text(self.screen, f"{f['icon']} {f['name']}",
+            zeichne_text(ebene, f"{f['icon']} {f['name']}",
                          x + 10, y + 8, self.font_normal,
                          C_GREEN if abgeschlossen else C_WHITE if verfuegbar else C_GRAY)
-            zeichne_text(self.screen, f["beschreibung"],
+            zeichne_text(ebene, f["beschreibung"],
                          x + 10, y + 32, self.font_klein,
                          C_WHITE if verfuegbar else C_GRAY)
-            zeichne_text(self.screen,
+            zeichne_text(ebene,
                          f"Kosten: {fmt_geld(f['kosten'])}  Zeit: {f['dauer']}s",
                          x + 10, y + 52, self.font_winzig,
                          C_ACCENT if verfuegbar else C_GRAY)
 
             if abgeschlossen:
-                zeichne_text(self.screen, "✅ Abgeschlossen",
+                zeichne_text(ebene, "✅ Abgeschlossen",
                              x + 10, y + 68, self.font_winzig, C_GREEN)
             elif aktiv:
-                zeichne_text(self.screen, "⏳ In Arbeit...",
+                zeichne_text(ebene, "⏳ In Arbeit...",
+                             x + 10, y + 68, self.font_winzig, C_PURPLE)
+            elif wartend:
+                zeichne_text(ebene, f"🕒 Warteschlange #{warteschlange.index(fid) + 1}",
                              x + 10, y + 68, self.font_winzig, C_PURPLE)
             elif not voraus_ok:
-                zeichne_text(self.screen, "🔒 Voraussetzung fehlt",
+                zeichne_text(ebene, "🔒 Voraussetzung fehlt",
                              x + 10, y + 68, self.font_winzig, C_RED)
 
-        zeichne_text(self.screen, "ESC = Zurück  |  Klicke Forschung = Starten",
+        zeichne_text(ebene, "ESC = Zurück  |  Klicke Forschung = Starten",
                      SCREEN_W // 2, SCREEN_H - 30, self.font_klein, C_GRAY, center=True)
+        self._forschung_cache = (schluessel, ebene)
+        return ebene
+
+    def _draw_forschung(self):
+        self._draw_hintergrund()
+        zeichne_text(self.screen, "🔬 FORSCHUNGS-BAUM",
+                     SCREEN_W // 2, 40, self.font_titel, C_PURPLE, center=True)
+
+        slots = self.labor_slots()
+        if self.labor:
+            spalte = min(320, (SCREEN_W - 60) // slots)
+            x_start = SCREEN_W // 2 - spalte * slots // 2
+            for i, p in enumerate(self.labor):
+                f = self.forschung[p.id]
+                fort = 1.0 - p.verbleibend / p.gesamt
+                cx = x_start + i * spalte + spalte // 2
+                zeichne_text(self.screen, f"{f['name']} ({fort*100:.0f}%)",
+                             cx, 90, self.font_klein, C_PURPLE, center=True)
+                zeichne_balken(self.screen, cx - spalte // 2 + 10, 112, spalte - 20, 12,
+                               fort, 1.0, C_PURPLE)
+        else:
+            zeichne_text(self.screen, "Keine aktive Forschung — klicke eine an!",
+                         SCREEN_W // 2, 90, self.font_normal, C_GRAY, center=True)
+        zeichne_text(self.screen,
+                     f"Labore: {len(self.labor)}/{slots}  •  Warteschlange: "
+                     f"{len(self.forschung_warteschlange)}",
+                     SCREEN_W - 30, 60, self.font_winzig, C_GRAY, right=True)
+
+        self.screen.blit(self._forschung_ebene(), (0, 0))
 
     def _draw_game_over(self):
         self._draw_hintergrund()
@@ -2243,6 +3646,7 @@ class PizzeriaImperium:
             if event.type == pygame.QUIT:
                 if self.screen_state == "spiel":
                     self._speichern()
+                self.schreiber.flush()
                 pygame.quit()
                 sys.exit()
 
@@ -2289,9 +3693,19 @@ class PizzeriaImperium:
         elif key == pygame.K_r:
             if self.screen_state in ("spiel", "pause"):
                 self.screen_state = "forschung"
+        elif key in (pygame.K_LEFT, pygame.K_RIGHT):
+            if self.screen_state == "highscore":
+                self._highscore_filter_wechseln(1 if key == pygame.K_RIGHT else -1)
         elif key == pygame.K_RETURN:
             if self.screen_state == "game_over":
                 self._neues_spiel()
+        elif key == pygame.K_F7:
+            if self.screen_state == "spiel":
+                self.rushhour = not self.rushhour
+                self.kunden_timer = 0.0
+                self._benachrichtigung(
+                    "🚨 Rushhour!" if self.rushhour else "Rushhour vorbei",
+                    C_RED if self.rushhour else C_GRAY)
         elif key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5):
             # Schnell-Ofen-Slots
             slot = key - pygame.K_1
@@ -2339,11 +3753,11 @@ class PizzeriaImperium:
             self.screen_state = "schwierigkeit"
         elif self.btn_weiterspielen.clicked(mpos) and self.speicherstand_vorhanden:
             if self._laden():
-                self._init_spiel()
                 self.screen_state = "spiel"
         elif self.btn_highscores.clicked(mpos):
             self.screen_state = "highscore"
         elif self.btn_beenden.clicked(mpos):
+            self.schreiber.flush()
             pygame.quit()
             sys.exit()
 
@@ -2354,12 +3768,10 @@ class PizzeriaImperium:
                 self._neues_spiel()
 
     def _neues_spiel(self):
-        self.state.reset()
-        self._init_spiel()
-        self.screen_state = "spiel"
+        self.neues_spiel(self.state.schwierigkeit)
         self._benachrichtigung("🍕 Willkommen bei Pizzeria Imperium!", C_ACCENT)
         self._benachrichtigung("Klicke auf Öfen um Pizzen zu backen!", C_GRAY)
-        self.speicherstand_vorhanden = os.path.exists(SAVE_FILE)
+        self.speicherstand_vorhanden = spielstand_vorhanden()
 
     def _click_spiel(self, mpos):
         mx, my = mpos
@@ -2464,16 +3876,9 @@ class PizzeriaImperium:
             self.screen_state = "spiel"
             return
 
-        cols = 3
-        col_w = (SCREEN_W - 60) // cols
-        for i, f in enumerate(FORSCHUNGEN):
-            col = i % cols
-            row = i // cols
-            x = 30 + col * col_w
-            y = 140 + row * 100
-            fr = pygame.Rect(x, y, col_w - 20, 85)
+        for fid, fr in self._forschung_layout():
             if fr.collidepoint(mpos):
-                self.forschung_starten(f["id"])
+                self.forschung_starten(fid)
                 return
 
         if my > SCREEN_H - 60:
@@ -2626,16 +4031,12 @@ def zeige_intro(screen, font_titel, font_normal, font_klein):
 
         # Pizza-Regen
         if random.random() < 0.3:
-            partikel.add(
+            partikel.add_fallend(
                 random.randint(0, SCREEN_W),
                 -10,
                 random.choice(list(C_PIZZAS.values())),
-                anzahl=1,
-                geschwindigkeit=30
+                vy=80
             )
-            for p in partikel.partikel[-1:]:
-                p.vy = 80
-                p.vx = random.uniform(-20, 20)
 
         partikel.update(dt)
         partikel.zeichne(screen, font_klein)
@@ -2937,6 +4338,144 @@ class PizzaWurf:
                 self.punkte += 1
 
 
+# ═══════════════════════════════════════════════════════════════════
+#  BALANCE-BENCHMARK (HEADLESS)
+# ═══════════════════════════════════════════════════════════════════
+
+class SkriptSpieler:
+    """Einfacher Spieler für die Headless-Simulation.
+
+    Macht alle ``reaktionszeit`` Sekunden genau eine Aktion: fertige Pizza
+    herausholen, servieren, offene Bestellung backen, beliebte Sorten auf
+    Vorrat backen – sonst investieren (günstigste verfügbare Forschung,
+    Personal nach EINSTELL_PLAN), solange Gehalt für fünf Minuten als
+    Reserve übrig bleibt.
+    """
+    EINSTELL_PLAN = ("Koch", "Kellner", "Manager", "Chefkoch",
+                     "Kellner", "Koch", "Superstar", "Kellner")
+
+    def __init__(self, sim: PizzeriaSimulation, reaktionszeit: float = 0.5):
+        self.sim = sim
+        self.reaktionszeit = reaktionszeit
+        self.timer = 0.0
+
+    def update(self, dt: float):
+        self.timer -= dt
+        if self.timer > 0:
+            return
+        self.timer = self.reaktionszeit
+        self.zug()
+
+    def zug(self):
+        sim = self.sim
+        slot = sim.kueche.naechster_ofen(sim.pizzen_im_ofen, frei=False)
+        if slot >= 0:
+            sim.pizza_aus_ofen(slot)
+            return
+        paar = sim.kueche.naechstes_paar()
+        if paar is not None:
+            sim.pizza_servieren(*paar)
+            return
+        if sim._auto_backen() or self._vorbacken():
+            return
+        self._investieren()
+
+    def _reserve(self) -> float:
+        sim = self.sim
+        kosten_mult = SCHWIERIGKEITSGRADE[sim.state.schwierigkeit]["kosten_mult"]
+        return 10 * sum(PERSONAL_TYPEN[p.typ]["gehalt"] for p in sim.personal) * kosten_mult + 50
+
+    def _vorbacken(self) -> bool:
+        sim = self.sim
+        vorrat = sum(sim.kueche.n_angebot.values())
+        if vorrat >= 2 * len(sim.pizzen_im_ofen) or sim.state.geld < self._reserve():
+            return False
+        slot = sim.kueche.naechster_ofen(sim.pizzen_im_ofen)
+        if slot < 0:
+            return False
+        sim.ausgewaehlte_pizza = max(
+            sim.state.freigeschaltete_pizzen,
+            key=lambda p: PIZZEN[p]["beliebt"] / (1 + sim.kueche.n_angebot[p]))
+        sim.pizza_in_ofen(slot)
+        return True
+
+    def _investieren(self):
+        sim, state = self.sim, self.sim.state
+        kosten_mult = SCHWIERIGKEITSGRADE[state.schwierigkeit]["kosten_mult"]
+        reserve = self._reserve()
+
+        if not sim.forschung_warteschlange and len(sim.labor) < sim.labor_slots():
+            offen = [fid for fid in sim.forschung.verfuegbar
+                     if not sim.forschung_eingeplant(fid)]
+            if offen:
+                f = min((sim.forschung[fid] for fid in offen), key=lambda f: f["kosten"])
+                if state.geld - f["kosten"] > reserve:
+                    sim.forschung_starten(f["id"])
+                    return
+
+        if len(sim.personal) < LEVELS[state.level]["max_personal"]:
+            typ = self.EINSTELL_PLAN[len(sim.personal) % len(self.EINSTELL_PLAN)]
+            lohn = PERSONAL_TYPEN[typ]["gehalt"]
+            if state.geld - lohn * 5 > reserve + 10 * lohn * kosten_mult:
+                sim.personal_einstellen(typ)
+
+def simuliere_schicht(schwierigkeit: str, stunden: float, seed: int) -> dict:
+    """``stunden`` Spielzeit mit dem SkriptSpieler durchrechnen."""
+    sim = PizzeriaSimulation(seed)
+    sim.neues_spiel(schwierigkeit)
+    spieler = SkriptSpieler(sim)
+    schritte = 0
+    start = time.perf_counter()
+    for _ in range(int(stunden * 3600 / SIM_DT)):
+        spieler.update(SIM_DT)
+        sim.schritt()
+        schritte += 1
+        if sim.screen_state == "game_over":
+            break
+    dauer = time.perf_counter() - start
+    minuten = max(sim.state.spielzeit / 60, 1e-9)
+    return {
+        "schwierigkeit": schwierigkeit,
+        "seed": seed,
+        "umsatz_pro_minute": sim.state.pizza_umsatz / minuten,
+        "ereignisse_pro_minute": sim.state.ereignis_einnahmen / minuten,
+        "kunden_bedient": sim.state.kunden_bedient,
+        "kunden_verloren": sim.state.kunden_verloren,
+        "level": sim.state.level,
+        "pleite": sim.screen_state == "game_over",
+        "spielzeit": sim.state.spielzeit,
+        "schritte_pro_sekunde": schritte / max(dauer, 1e-9),
+    }
+
+def balance_benchmark(stunden: float = 1.0, seed: int = 1, seeds: int = 3,
+                      prozesse: Optional[int] = None) -> list:
+    """Alle Schwierigkeitsgrade mit ``seeds`` Seeds parallel simulieren und
+    je Schwierigkeitsgrad gemittelt als Tabelle ausgeben."""
+    auftraege = [(name, stunden, s) for name in SCHWIERIGKEITSGRADE
+                 for s in range(seed, seed + seeds)]
+    with multiprocessing.Pool(prozesse or min(len(auftraege), os.cpu_count() or 1)) as pool:
+        laeufe = pool.starmap(simuliere_schicht, auftraege)
+
+    ergebnisse = []
+    for name in SCHWIERIGKEITSGRADE:
+        rs = [r for r in laeufe if r["schwierigkeit"] == name]
+        mittel = {key: sum(r[key] for r in rs) / len(rs)
+                  for key in ("umsatz_pro_minute", "ereignisse_pro_minute", "kunden_bedient",
+                              "kunden_verloren", "level", "schritte_pro_sekunde")}
+        mittel.update(schwierigkeit=name, pleite=sum(r["pleite"] for r in rs), laeufe=rs)
+        ergebnisse.append(mittel)
+
+    print(f"Balance-Benchmark: {stunden:g} h Spielzeit, Mittel über Seeds {seed}–{seed + seeds - 1}")
+    print(f"{'Schwierigkeit':<14}{'Pizza €/min':>12}{'Ereig. €/min':>13}{'bedient':>9}"
+          f"{'verloren':>10}{'Level':>7}{'pleite':>8}{'Schritte/s':>12}")
+    for r in ergebnisse:
+        print(f"{r['schwierigkeit']:<14}{r['umsatz_pro_minute']:>12.2f}"
+              f"{r['ereignisse_pro_minute']:>13.2f}{r['kunden_bedient']:>9.0f}"
+              f"{r['kunden_verloren']:>10.0f}{r['level']:>7.1f}{r['pleite']:>5}/{seeds:<2}"
+              f"{r['schritte_pro_sekunde']:>12,.0f}")
+    return ergebnisse
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  HAUPT-EINSTIEGSPUNKT
 # ═══════════════════════════════════════════════════════════════════
@@ -2969,7 +4508,7 @@ def main():
     # Erster Start: Tutorial anzeigen
     einst = Einstellungen()
     einst.laden()
-    if einst.zeige_tutorial and not os.path.exists(SAVE_FILE):
+    if einst.zeige_tutorial and not spielstand_vorhanden():
         zeige_tutorial(screen, (font_gross, font_normal, font_klein))
         einst.zeige_tutorial = False
         einst.speichern()
@@ -2977,5 +4516,17 @@ def main():
     spiel.run()
 
 
+def _cli_wert(name: str, standard, typ=float):
+    if name in sys.argv:
+        return typ(sys.argv[sys.argv.index(name) + 1])
+    return standard
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--benchmark" in sys.argv:
+        balance_benchmark(stunden=_cli_wert("--stunden", 1.0),
+                          seed=_cli_wert("--seed", 1, int),
+                          seeds=_cli_wert("--seeds", 3, int),
+                          prozesse=_cli_wert("--prozesse", None, int))
+    else:
+        main()
\ No newline at end of file
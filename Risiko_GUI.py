@@ -22,25 +22,31 @@ EXTRAS:
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
-import json
 import os
+import queue
 import random
-import time
 import threading
-from collections import defaultdict, Counter
+from collections import Counter
 from copy import deepcopy
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Callable
 import math
 
+from Risiko_Karte import (DEFAULT_MAP, FortifyComponents, MapError, load_map, map_ref,
+                          resolve_map)
+from Risiko_Speicher import (SAVE_EXT, SaveWriter, SnapshotRing, decode_snapshot,
+                             encode_snapshot, read_state, write_atomic)
+
 # ───────────────────────────── KONFIGURATION ─────────────────────────────
 CONFIG = {
     "window_size": (1400, 900),
     "map_scale": 1.0,
     "animation_speed": 0.3,
+    "skip_ai_animations": False,
     "sound_enabled": True,
     "theme": "dark",  # "dark" or "light"
     "auto_save_interval": 5,
+    "history_size": 200,
     "tutorial_mode": False,
 }
 
@@ -64,67 +70,30 @@ THEMES = {
     }
 }
 
-# ───────────────────────────── SPIELDATEN (aus Original) ─────────────────────────────
-TERRITORIES = {
-    # Nordamerika
-    "Alaska": {"continent": "Nordamerika", "neighbors": ["Nordwest-Territorium", "Alberta", "Kamtschatka"], "pos": (150, 180)},
-    "Nordwest-Territorium": {"continent": "Nordamerika", "neighbors": ["Alaska", "Alberta", "Ontario", "Grönland"], "pos": (280, 150)},
-    "Grönland": {"continent": "Nordamerika", "neighbors": ["Nordwest-Territorium", "Ontario", "Quebec", "Island"], "pos": (420, 100)},
-    "Alberta": {"continent": "Nordamerika", "neighbors": ["Alaska", "Nordwest-Territorium", "Ontario", "Weststaaten"], "pos": (240, 240)},
-    "Ontario": {"continent": "Nordamerika", "neighbors": ["Nordwest-Territorium", "Grönland", "Alberta", "Weststaaten", "Quebec", "Oststaaten"], "pos": (340, 220)},
-    "Quebec": {"continent": "Nordamerika", "neighbors": ["Ontario", "Grönland", "Oststaaten"], "pos": (400, 260)},
-    "Weststaaten": {"continent": "Nordamerika", "neighbors": ["Alberta", "Ontario", "Oststaaten", "Mittelamerika"], "pos": (280, 320)},
-    "Oststaaten": {"continent": "Nordamerika", "neighbors": ["Weststaaten", "Ontario", "Quebec", "Mittelamerika"], "pos": (380, 320)},
-    "Mittelamerika": {"continent": "Nordamerika", "neighbors": ["Weststaaten", "Oststaaten", "Venezuela"], "pos": (320, 400)},
-    # Südamerika
-    "Venezuela": {"continent": "Südamerika", "neighbors": ["Mittelamerika", "Peru", "Brasilien"], "pos": (340, 480)},
-    "Peru": {"continent": "Südamerika", "neighbors": ["Venezuela", "Brasilien", "Argentinien"], "pos": (280, 560)},
-    "Brasilien": {"continent": "Südamerika", "neighbors": ["Venezuela", "Peru", "Argentinien", "Nordafrika"], "pos": (400, 580)},
-    "Argentinien": {"continent": "Südamerika", "neighbors": ["Peru", "Brasilien"], "pos": (320, 680)},
-    # Europa
-    "Island": {"continent": "Europa", "neighbors": ["Grönland", "Großbritannien", "Skandinavien"], "pos": (520, 140)},
-    "Großbritannien": {"continent": "Europa", "neighbors": ["Island", "Skandinavien", "Nordeuropa", "Westeuropa"], "pos": (540, 220)},
-    "Skandinavien": {"continent": "Europa", "neighbors": ["Island", "Großbritannien", "Nordeuropa", "Ukraine"], "pos": (620, 180)},
-    "Nordeuropa": {"continent": "Europa", "neighbors": ["Großbritannien", "Skandinavien", "Westeuropa", "Mitteleuropa", "Ukraine"], "pos": (600, 260)},
-    "Westeuropa": {"continent": "Europa", "neighbors": ["Großbritannien", "Nordeuropa", "Mitteleuropa", "Nordafrika"], "pos": (560, 300)},
-    "Mitteleuropa": {"continent": "Europa", "neighbors": ["Nordeuropa", "Westeuropa", "Ukraine", "Südeuropa"], "pos": (640, 300)},
-    "Ukraine": {"continent": "Europa", "neighbors": ["Skandinavien", "Nordeuropa", "Mitteleuropa", "Südeuropa", "Ural", "Afghanistan", "Mittlerer Osten"], "pos": (720, 260)},
-    "Südeuropa": {"continent": "Europa", "neighbors": ["Westeuropa", "Mitteleuropa", "Ukraine", "Nordafrika", "Ägypten", "Mittlerer Osten"], "pos": (660, 360)},
-    # Afrika
-    "Nordafrika": {"continent": "Afrika", "neighbors": ["Brasilien", "Westeuropa", "Südeuropa", "Ägypten", "Ostafrika", "Zentralafrika"], "pos": (600, 440)},
-    "Ägypten": {"continent": "Afrika", "neighbors": ["Nordafrika", "Südeuropa", "Mittlerer Osten", "Ostafrika"], "pos": (700, 400)},
-    "Zentralafrika": {"continent": "Afrika", "neighbors": ["Nordafrika", "Ostafrika", "Südafrika"], "pos": (640, 520)},
-    "Ostafrika": {"continent": "Afrika", "neighbors": ["Nordafrika", "Ägypten", "Zentralafrika", "Südafrika", "Madagaskar", "Mittlerer Osten"], "pos": (720, 500)},
-    "Südafrika": {"continent": "Afrika", "neighbors": ["Zentralafrika", "Ostafrika", "Madagaskar"], "pos": (680, 640)},
-    "Madagaskar": {"continent": "Afrika", "neighbors": ["Ostafrika", "Südafrika"], "pos": (780, 620)},
-    # Asien
-    "Ural": {"continent": "Asien", "neighbors": ["Ukraine", "Sibirien", "Afghanistan", "China"], "pos": (780, 240)},
-    "Sibirien": {"continent": "Asien", "neighbors": ["Ural", "Jakutien", "Irkutsk", "Mongolei", "China"], "pos": (880, 200)},
-    "Jakutien": {"continent": "Asien", "neighbors": ["Sibirien", "Kamtschatka", "Irkutsk"], "pos": (980, 160)},
-    "Kamtschatka": {"continent": "Asien", "neighbors": ["Jakutien", "Irkutsk", "Mongolei", "Japan", "Alaska"], "pos": (1080, 180)},
-    "Irkutsk": {"continent": "Asien", "neighbors": ["Sibirien", "Jakutien", "Kamtschatka", "Mongolei"], "pos": (960, 240)},
-    "Mongolei": {"continent": "Asien", "neighbors": ["Sibirien", "Kamtschatka", "Irkutsk", "China", "Japan"], "pos": (940, 300)},
-    "Japan": {"continent": "Asien", "neighbors": ["Kamtschatka", "Mongolei"], "pos": (1120, 280)},
-    "Afghanistan": {"continent": "Asien", "neighbors": ["Ukraine", "Ural", "China", "Indien", "Mittlerer Osten"], "pos": (820, 340)},
-    "China": {"continent": "Asien", "neighbors": ["Ural", "Sibirien", "Mongolei", "Afghanistan", "Indien", "Siam"], "pos": (900, 380)},
-    "Mittlerer Osten": {"continent": "Asien", "neighbors": ["Ukraine", "Südeuropa", "Ägypten", "Ostafrika", "Afghanistan", "Indien"], "pos": (780, 420)},
-    "Indien": {"continent": "Asien", "neighbors": ["Mittlerer Osten", "Afghanistan", "China", "Siam"], "pos": (860, 460)},
-    "Siam": {"continent": "Asien", "neighbors": ["China", "Indien", "Indonesien"], "pos": (940, 480)},
-    # Australien/Ozeanien
-    "Indonesien": {"continent": "Australien", "neighbors": ["Siam", "Neuguinea", "Westaustralien"], "pos": (980, 560)},
-    "Neuguinea": {"continent": "Australien", "neighbors": ["Indonesien", "Westaustralien", "Ostaustralien"], "pos": (1080, 580)},
-    "Westaustralien": {"continent": "Australien", "neighbors": ["Indonesien", "Neuguinea", "Ostaustralien"], "pos": (1020, 640)},
-    "Ostaustralien": {"continent": "Australien", "neighbors": ["Neuguinea", "Westaustralien"], "pos": (1120, 660)},
-}
+# ───────────────────────────── SPIELDATEN ─────────────────────────────
+# Spielbrett aus maps/*.json (siehe Risiko_Karte.py), eigene Karten mit --map <datei>
+MAP_PATH = DEFAULT_MAP
+WORLD = load_map(MAP_PATH)
+TERRITORIES = WORLD.territories_dict()
+CONTINENTS = WORLD.continents_dict()
 
-CONTINENTS = {
-    "Nordamerika": {"bonus": 5, "color": "#ff6b6b"},
-    "Südamerika": {"bonus": 2, "color": "#4ecdc4"},
-    "Europa": {"bonus": 5, "color": "#ffe66d"},
-    "Afrika": {"bonus": 3, "color": "#95e1d3"},
-    "Asien": {"bonus": 7, "color": "#f38181"},
-    "Australien": {"bonus": 2, "color": "#aa96da"},
-}
+
+def use_map(path: str):
+    """Andere Karte aktivieren (vor dem Aufbau der Karte)"""
+    global MAP_PATH, WORLD, TERRITORIES, CONTINENTS
+    MAP_PATH = os.path.abspath(path)
+    WORLD = load_map(path)
+    TERRITORIES = WORLD.territories_dict()
+    CONTINENTS = WORLD.continents_dict()
+
+
+def map_names(map_path: Optional[str]) -> List[str]:
+    """Gebietsreihenfolge der Karte, mit der ein Snapshot gespeichert wurde"""
+    path = resolve_map(map_path)
+    return WORLD.names if path == MAP_PATH else load_map(path).names
+
+
+AUTOSAVE_FILE = os.path.expanduser(f"~/.risiko_autosave{SAVE_EXT}")
 
 CARD_TYPES = ["Infanterie", "Kavallerie", "Artillerie"]
 CARD_EMOJIS = {"Infanterie": "⚔️", "Kavallerie": "🐎", "Artillerie": "💣", "Wildcard": "🃏"}
@@ -261,6 +230,67 @@ class DiceCanvas(tk.Canvas):
         animate(0)
 
 
+# ───────────────────────────── KI-PLANUNG ─────────────────────────────
+def resolve_battle(board: Dict[str, dict], from_t: str, to_t: str,
+                   atk_rolls: List[int], def_rolls: List[int], attacker: str) -> Tuple[int, int, bool]:
+    """Würfelergebnis auf ein Brett anwenden → (Angreifer-Siege, Verteidiger-Siege, erobert)"""
+    atk_wins = sum(1 for a, d in zip(atk_rolls, def_rolls) if a > d)
+    def_wins = len(def_rolls) - atk_wins
+    
+    board[from_t]["troops"] -= def_wins
+    board[to_t]["troops"] -= atk_wins
+    
+    if board[to_t]["troops"] > 0:
+        return atk_wins, def_wins, False
+    
+    move_troops = min(3, board[from_t]["troops"] - 1)
+    board[to_t]["owner"] = attacker
+    board[to_t]["troops"] = move_troops
+    board[from_t]["troops"] -= move_troops
+    return atk_wins, def_wins, True
+
+
+def plan_ai_turn(board: Dict[str, dict], player_name: str, rng: random.Random) -> List[tuple]:
+    """KI-Zug durchrechnen und als Zugliste zurückgeben.
+    
+    ``board`` wird dabei verändert – der Aufrufer übergibt eine Kopie.
+    Die Würfel werden hier schon geworfen, damit der Tk-Thread die Züge
+    später nur noch abspielen muss und exakt dasselbe Ergebnis erhält.
+    """
+    moves = []
+    
+    # Einfache KI: Zufällige Angriffe wenn Vorteil
+    owned = [t for t, d in board.items() if d["owner"] == player_name]
+    for from_t in owned:
+        if board[from_t]["troops"] >= 3:
+            targets = [n for n in TERRITORIES[from_t]["neighbors"]
+                      if board[n]["owner"] != player_name]
+            if targets and rng.random() < 0.6:  # 60% Angriffs-Chance
+                to_t = min(targets, key=lambda t: board[t]["troops"])
+                if board[from_t]["troops"] > board[to_t]["troops"] * 1.3:
+                    atk_rolls = sorted((rng.randint(1, 6) for _ in range(min(3, board[from_t]["troops"] - 1))),
+                                       reverse=True)
+                    def_rolls = sorted((rng.randint(1, 6) for _ in range(min(2, board[to_t]["troops"]))),
+                                       reverse=True)
+                    resolve_battle(board, from_t, to_t, atk_rolls, def_rolls, player_name)
+                    moves.append(("attack", from_t, to_t, atk_rolls, def_rolls))
+    
+    return moves
+
+
+class AITurnWorker(threading.Thread):
+    """Berechnet einen KI-Zug im Hintergrund, Ergebnis landet in einer Queue"""
+    def __init__(self, board: Dict[str, dict], player_name: str, seed: int):
+        super().__init__(daemon=True)
+        self.board = deepcopy(board)  # Schnappschuss auf dem Tk-Thread
+        self.player_name = player_name
+        self.rng = random.Random(seed)
+        self.result: "queue.Queue[List[tuple]]" = queue.Queue(maxsize=1)
+    
+    def run(self):
+        self.result.put(plan_ai_turn(self.board, self.player_name, self.rng))
+
+
 # ───────────────────────────── SPIELER ─────────────────────────────
 class Player:
     def __init__(self, name: str, color: str, symbol: str, is_ai: bool = False, ai_level: int = 1):
@@ -310,6 +340,14 @@ class RisikoGUI(tk.Tk):
         self.placing_troops = False
         self.troops_to_place = 0
         self.drag_start = None
+        self.ai_running = False
+        self.replay_running = False
+        self.replay_real_board: Optional[Dict[str, dict]] = None  # echtes Brett während der Wiederholung
+        
+        # Speichern im Hintergrund & Zug-Historie (ein Snapshot pro Zugbeginn)
+        self.save_writer = SaveWriter()
+        self.history = SnapshotRing(CONFIG["history_size"])
+        self.turn_rng_state = None  # Würfelzustand zum Zugbeginn (gegen Neuwürfeln per Undo)
         
         self._setup_styles()
         self._create_menu()
@@ -362,6 +400,8 @@ class RisikoGUI(tk.Tk):
         game_menu.add_command(label="⏭️ Zug beenden", command=self.end_turn, accelerator="Space")
         game_menu.add_command(label="⚔️ Angriff", command=self.start_attack, accelerator="A")
         game_menu.add_command(label="🔄 Verschieben", command=self.start_fortify, accelerator="F")
+        game_menu.add_command(label="↩️ Zug neu beginnen", command=self.undo_turn, accelerator="Ctrl+Z")
+        game_menu.add_command(label="▶️ Wiederholung", command=self.show_replay)
         game_menu.add_separator()
         game_menu.add_command(label="📊 Statistiken", command=self.show_stats)
         
@@ -383,6 +423,7 @@ class RisikoGUI(tk.Tk):
         self.bind("<Control-n>", lambda e: self.new_game())
         self.bind("<Control-o>", lambda e: self.load_game())
         self.bind("<Control-s>", lambda e: self.save_game())
+        self.bind("<Control-z>", lambda e: self.undo_turn())
         self.bind("<space>", lambda e: self.end_turn())
         self.bind("a", lambda e: self.start_attack())
         self.bind("f", lambda e: self.start_fortify())
@@ -464,8 +505,10 @@ class RisikoGUI(tk.Tk):
     def _create_map_canvas(self):
         """Weltkarte mit Canvas"""
         # Canvas für Karte
+        max_x, max_y = WORLD.extent()
+        self.map_size = (max(1300, max_x + 150), max(800, max_y + 150))
         self.map_canvas = tk.Canvas(self.map_frame, bg=self.theme["bg_tertiary"], 
-                                   highlightthickness=0, scrollregion=(0, 0, 1300, 800))
+                                   highlightthickness=0, scrollregion=(0, 0, *self.map_size))
         self.map_canvas.pack(fill=tk.BOTH, expand=True)
         
         # Scrollbars
@@ -503,26 +546,22 @@ class RisikoGUI(tk.Tk):
         self._setup_tooltips()
     
     def _draw_map(self):
-        """Weltkarte zeichnen"""
+        """Weltkarte einmalig aufbauen (Items werden danach nur noch aktualisiert)"""
         self.map_canvas.delete("all")
-        scale = CONFIG["map_scale"]
+        scale = 1.0  # Zoom läuft über canvas.scale, siehe _apply_zoom
+        self.map_scale_drawn = 1.0
+        self._territory_state = {}  # Gebiet -> (Füllfarbe, Truppen-Text) wie gezeichnet
+        self._outline_state = {}    # Gebiet -> (Randfarbe, Breite) wie gezeichnet
+        self._highlighted = set(TERRITORIES)  # Gebiete mit Nicht-Standard-Rand
         
         # Hintergrund mit Gitter (optional)
-        self.map_canvas.create_rectangle(0, 0, 1300, 800, fill=self.theme["bg_tertiary"], outline="")
-        
-        # Kontinenten-Regionen Labels (große Schrift)
-        continents_pos = {
-            "Nordamerika": (200, 200, 30),
-            "Südamerika": (350, 500, 25),
-            "Europa": (630, 180, 25),
-            "Afrika": (700, 450, 25),
-            "Asien": (950, 350, 30),
-            "Australien": (1050, 650, 20),
-        }
+        self.map_canvas.create_rectangle(0, 0, *self.map_size, fill=self.theme["bg_tertiary"], outline="")
         
-        for cont, (cx, cy, font_size) in continents_pos.items():
-            if cont in CONTINENTS:
-                color = CONTINENTS[cont]["color"]
+        # Kontinenten-Regionen Labels (große Schrift, Position aus der Kartendatei)
+        for cont, data in CONTINENTS.items():
+            if data["label"]:
+                cx, cy, font_size = data["label"]
+                color = data["color"]
                 # Kontinenten-Label mit halbtransparentem Hintergrund-Effekt
                 self.map_canvas.create_text(cx, cy, text=cont, 
                                            fill=color, font=("Segoe UI", font_size, "bold"),
@@ -583,6 +622,20 @@ class RisikoGUI(tk.Tk):
             self.territory_widgets[t_name] = {
                 "circle": circle, "text": text, "troops": troops, "shadow": shadow
             }
+            self._territory_state[t_name] = ("white", "0")
+            self._outline_state[t_name] = (self.theme["text"], 2)
+        
+        self._apply_zoom()
+    
+    def _apply_zoom(self):
+        """Bestehende Items per canvas.scale auf CONFIG['map_scale'] bringen"""
+        factor = CONFIG["map_scale"] / self.map_scale_drawn
+        if factor != 1.0:
+            self.map_canvas.scale("all", 0, 0, factor, factor)
+            self.map_scale_drawn = CONFIG["map_scale"]
+        self.map_canvas.configure(scrollregion=(0, 0, self.map_size[0] * self.map_scale_drawn,
+                                                self.map_size[1] * self.map_scale_drawn))
+        self.zoom_label.config(text=f"{int(CONFIG['map_scale']*100)}%")
     
     def _setup_tooltips(self):
         """Tooltips für alle Gebiete einrichten"""
@@ -680,7 +733,7 @@ class RisikoGUI(tk.Tk):
     # ───────────────────── MAP INTERACTION ─────────────────────
     def on_territory_click(self, territory: str):
         """Gebiet angeklickt"""
-        if not self.game or not self.game.players:
+        if not self.game or not self.game.players or self._busy():
             return
         
         player = self.game.players[self.game.current_player_idx]
@@ -723,8 +776,9 @@ class RisikoGUI(tk.Tk):
             if self.selected_territory is None:
                 if owner == player.name:
                     self.selected_territory = territory
+                    targets = self._highlight_fortify_targets(territory)
                     self._highlight_territory(territory, self.theme["accent2"])
-                    self.info_label.config(text=f"Verschieben von: {territory}\nWähle ein erreichbares eigenes Zielgebiet.")
+                    self.info_label.config(text=f"Verschieben von: {territory}\n{len(targets)} erreichbare eigene Zielgebiete (grün markiert).")
             else:
                 if owner == player.name and self._is_reachable(player, self.selected_territory, territory):
                     self._show_fortify_dialog(self.selected_territory, territory)
@@ -742,28 +796,36 @@ class RisikoGUI(tk.Tk):
     def on_territory_hover(self, territory: str):
         """Hover-Effekt für Gebiete"""
         if territory in self.territory_widgets:
-            self.map_canvas.itemconfig(self.territory_widgets[territory]["circle"], 
-                                      width=4, outline=self.theme["accent2"])
+            self._set_outline(territory, self.theme["accent2"], 4)
     
     def on_territory_leave(self):
         """Hover verlassen"""
         if self.selected_territory:
             self._highlight_territory(self.selected_territory, self.theme["accent"])
         else:
-            for t, widgets in self.territory_widgets.items():
-                self.map_canvas.itemconfig(widgets["circle"], width=2, outline=self.theme["border"])
+            self._clear_highlights()
     
     def _highlight_territory(self, territory: str, color: str):
         """Gebiet hervorheben"""
         if territory in self.territory_widgets:
-            self.map_canvas.itemconfig(self.territory_widgets[territory]["circle"], 
-                                      outline=color, width=4)
+            self._set_outline(territory, color, 4)
     
     def _clear_highlights(self):
         """Alle Hervorhebungen entfernen"""
-        for t, widgets in self.territory_widgets.items():
-            self.map_canvas.itemconfig(widgets["circle"], 
-                                      outline=self.theme["border"], width=2)
+        for t in list(self._highlighted):
+            self._set_outline(t, self.theme["border"], 2)
+    
+    def _set_outline(self, territory: str, color: str, width: int):
+        """Rand nur per itemconfig ändern, wenn er sich wirklich ändert"""
+        if self._outline_state.get(territory) == (color, width):
+            return
+        self._outline_state[territory] = (color, width)
+        if (color, width) == (self.theme["border"], 2):
+            self._highlighted.discard(territory)
+        else:
+            self._highlighted.add(territory)
+        self.map_canvas.itemconfig(self.territory_widgets[territory]["circle"],
+                                  outline=color, width=width)
     
     def on_mouse_wheel(self, event):
         """Zoom mit Mausrad"""
@@ -775,18 +837,12 @@ class RisikoGUI(tk.Tk):
     def zoom_in(self):
         """Reinzoomen"""
         CONFIG["map_scale"] = min(2.0, CONFIG["map_scale"] + 0.1)
-        self.zoom_label.config(text=f"{int(CONFIG['map_scale']*100)}%")
-        self._draw_map()
-        self._setup_tooltips()
-        self._update_all_territories()
+        self._apply_zoom()
     
     def zoom_out(self):
         """Rauszoomen"""
         CONFIG["map_scale"] = max(0.5, CONFIG["map_scale"] - 0.1)
-        self.zoom_label.config(text=f"{int(CONFIG['map_scale']*100)}%")
-        self._draw_map()
-        self._setup_tooltips()
-        self._update_all_territories()
+        self._apply_zoom()
     
     def on_drag_start(self, event):
         """Drag zum Verschieben der Karte starten"""
@@ -810,6 +866,9 @@ class RisikoGUI(tk.Tk):
     # ───────────────────── SPIEL-LOGIK ─────────────────────
     def new_game(self):
         """Neues Spiel starten"""
+        if self._busy():
+            self.status("⏳ Bitte warten, bis KI-Zug bzw. Wiederholung beendet ist")
+            return
         if self.game and messagebox.askyesno("Neues Spiel", 
                                             "Aktuelles Spiel verwerfen?"):
             pass
@@ -825,8 +884,6 @@ class RisikoGUI(tk.Tk):
     
     def _init_game(self, players_data: List[dict]):
         """Spiel initialisieren"""
-        from copy import deepcopy
-        
         self.game = type('Game', (), {})()  # Simple namespace
         self.game.players = [Player(**p) for p in players_data]
         self.game.board = {t: {"owner": None, "troops": 0} for t in TERRITORIES}
@@ -835,6 +892,7 @@ class RisikoGUI(tk.Tk):
         self.game.card_deck = []
         self.game.exchange_count = 0
         self.game.game_over = False
+        self.game.components = FortifyComponents(TERRITORIES)
         
         # Setup
         self._setup_card_deck()
@@ -843,6 +901,8 @@ class RisikoGUI(tk.Tk):
         
         self.log("🎮 Neues Spiel gestartet!")
         self._update_ui()
+        self.history.clear()
+        self._begin_turn()
     
     def _setup_card_deck(self):
         """Karten-Deck erstellen"""
@@ -860,6 +920,7 @@ class RisikoGUI(tk.Tk):
             player = self.game.players[i % len(self.game.players)]
             self.game.board[t]["owner"] = player.name
             self.game.board[t]["troops"] = 1
+        self.game.components.rebuild(self.game.board)
     
     def _place_initial_troops(self):
         """Starttruppen platzieren (vereinfacht: automatisch)"""
@@ -947,17 +1008,25 @@ class RisikoGUI(tk.Tk):
         
         data = self.game.board[territory]
         owner_name = data["owner"]
+        widgets = self.territory_widgets[territory]
+        old_fill, old_text = self._territory_state[territory]
         
         # Farbe nach Besitzer
+        fill = old_fill
         if owner_name:
             player = next((p for p in self.game.players if p.name == owner_name), None)
-            color = player.color if player else self.theme["border"]
-            self.map_canvas.itemconfig(self.territory_widgets[territory]["circle"], fill=color)
+            fill = player.color if player else self.theme["border"]
         
         # Truppen-Anzeige
         troops = data["troops"]
-        self.map_canvas.itemconfig(self.territory_widgets[territory]["troops"], 
-                                  text=str(troops) if troops > 0 else "")
+        text = str(troops) if troops > 0 else ""
+        
+        # Nur geänderte Items anfassen
+        if fill != old_fill:
+            self.map_canvas.itemconfig(widgets["circle"], fill=fill)
+        if text != old_text:
+            self.map_canvas.itemconfig(widgets["troops"], text=text)
+        self._territory_state[territory] = (fill, text)
     
     def _update_turn_display(self):
         """Runden- und Spieler-Anzeige aktualisieren"""
@@ -1008,7 +1077,7 @@ class RisikoGUI(tk.Tk):
         player = self.game.players[self.game.current_player_idx]
         
         for cont, data in CONTINENTS.items():
-            territories = [t for t, d in TERRITORIES.items() if d["continent"] == cont]
+            territories = data["territories"]
             owned = sum(1 for t in territories if self.game.board[t]["owner"] == player.name)
             total = len(territories)
             percent = owned / total
@@ -1116,43 +1185,7 @@ class RisikoGUI(tk.Tk):
         """Angriffsergebnis verarbeiten"""
         atk_rolls = sorted(rolls["atk"], reverse=True)
         def_rolls = sorted(rolls["def"], reverse=True)
-        
-        atk_wins = sum(1 for a, d in zip(atk_rolls, def_rolls) if a > d)
-        def_wins = len(def_rolls) - atk_wins
-        
-        # Truppen abziehen
-        self.game.board[from_t]["troops"] -= def_wins
-        self.game.board[to_t]["troops"] -= atk_wins
-        
-        # Log
-        self.log(f"🎲 {atk_rolls} vs {def_rolls} → {'Angreifer' if atk_wins > def_wins else 'Verteidiger'} gewinnt {max(atk_wins, def_wins)}x")
-        
-        # Gebiet erobert?
-        if self.game.board[to_t]["troops"] <= 0:
-            # Eroberung!
-            old_owner = self.game.board[to_t]["owner"]
-            move_troops = min(3, self.game.board[from_t]["troops"] - 1)
-            
-            self.game.board[to_t]["owner"] = player.name
-            self.game.board[to_t]["troops"] = move_troops
-            self.game.board[from_t]["troops"] -= move_troops
-            
-            player.territories_conquered_this_turn += 1
-            player.territories_captured += 1
-            
-            self.log(f"🏆 {to_t} erobert! ({move_troops} Truppen)")
-            
-            # Achievement check
-            if player.territories_captured >= 10 and "Eroberer" not in player.achievements:
-                player.achievements.append("Eroberer")
-                self._show_achievement("🏆 Eroberer - 10 Gebiete erobert!")
-            
-            # Karte ziehen
-            if self.game.card_deck:
-                card = self.game.card_deck.pop()
-                player.cards.append(card)
-                self.log(f"🃏 Karte gezogen: {CARD_EMOJIS[card]} {card}")
-                self._update_card_display()
+        self._apply_battle(player, from_t, to_t, atk_rolls, def_rolls)
         
         # UI updaten
         self._update_territory_display(from_t)
@@ -1167,6 +1200,39 @@ class RisikoGUI(tk.Tk):
             self.selected_territory = None
             self._clear_highlights()
     
+    def _apply_battle(self, player: Player, from_t: str, to_t: str,
+                      atk_rolls: List[int], def_rolls: List[int]) -> bool:
+        """Würfelergebnis aufs Spielbrett anwenden (Mensch und KI)"""
+        old_owner = self.game.board[to_t]["owner"]
+        atk_wins, def_wins, conquered = resolve_battle(self.game.board, from_t, to_t,
+                                                       atk_rolls, def_rolls, player.name)
+        
+        # Log
+        self.log(f"🎲 {atk_rolls} vs {def_rolls} → {'Angreifer' if atk_wins > def_wins else 'Verteidiger'} gewinnt {max(atk_wins, def_wins)}x")
+        
+        if not conquered:
+            return False
+        
+        # Eroberung!
+        self.game.components.transfer(to_t, old_owner, player.name)
+        player.territories_conquered_this_turn += 1
+        player.territories_captured += 1
+        
+        self.log(f"🏆 {to_t} erobert! ({self.game.board[to_t]['troops']} Truppen)")
+        
+        # Achievement check
+        if player.territories_captured >= 10 and "Eroberer" not in player.achievements:
+            player.achievements.append("Eroberer")
+            self._show_achievement("🏆 Eroberer - 10 Gebiete erobert!")
+        
+        # Karte ziehen
+        if self.game.card_deck:
+            card = self.game.card_deck.pop()
+            player.cards.append(card)
+            self.log(f"🃏 Karte gezogen: {CARD_EMOJIS[card]} {card}")
+            self._update_card_display()
+        return True
+    
     def _show_fortify_dialog(self, from_t: str, to_t: str):
         """Dialog für Truppenverschiebung"""
         max_move = self.game.board[from_t]["troops"] - 1
@@ -1217,20 +1283,19 @@ class RisikoGUI(tk.Tk):
         self._center_window(dialog)
     
     def _is_reachable(self, player: Player, start: str, end: str) -> bool:
-        """BFS: Prüfen ob Gebiet erreichbar ist"""
+        """Prüfen ob Gebiet erreichbar ist (Label-Vergleich der Komponenten)"""
         if start == end:
             return True
-        visited = {start}
-        queue = [start]
-        while queue:
-            cur = queue.pop(0)
-            for neighbor in TERRITORIES[cur]["neighbors"]:
-                if neighbor == end:
-                    return True
-                if neighbor not in visited and self.game.board[neighbor]["owner"] == player.name:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-        return False
+        return (self.game.board[start]["owner"] == player.name
+                and self.game.components.connected(start, end))
+    
+    def _highlight_fortify_targets(self, source: str):
+        """Alle gültigen Verschiebe-Ziele einer Quelle hervorheben"""
+        targets = self.game.components.component(source)
+        targets.discard(source)
+        for t in targets:
+            self._highlight_territory(t, self.theme["success"])
+        return targets
     
     def trade_cards(self):
         """Karten tauschen Dialog"""
@@ -1312,7 +1377,7 @@ class RisikoGUI(tk.Tk):
     
     def end_turn(self):
         """Zug beenden"""
-        if not self.game:
+        if not self.game or self._busy():
             return
         
         player = self.game.players[self.game.current_player_idx]
@@ -1332,33 +1397,80 @@ class RisikoGUI(tk.Tk):
             if self.game.turn % CONFIG["auto_save_interval"] == 0:
                 self._auto_save()
         
-        # KI-Zug falls nötig
-        if player.is_ai:
-            self._process_ai_turn(player)
-        
         self._update_ui()
         self._check_winner()
         self.status(f"{'✅' if not player.is_ai else '🤖'} Zug beendet. Nächster: {self.game.players[self.game.current_player_idx].name}")
+        self._begin_turn()
+    
+    def _busy(self) -> bool:
+        """Läuft gerade ein KI-Zug oder eine Wiederholung?"""
+        return self.ai_running or self.replay_running
+    
+    def _begin_turn(self):
+        """Zugbeginn: Snapshot für Undo/Wiederholung, ggf. KI-Zug starten"""
+        if not self.game or self.game.game_over:
+            return
+        self.history.push(encode_snapshot(WORLD.names, self._game_state()))
+        self.turn_rng_state = random.getstate()
+        player = self.game.players[self.game.current_player_idx]
+        if player.is_ai:
+            self._process_ai_turn(player)
     
     def _process_ai_turn(self, player: Player):
-        """KI-Zug verarbeiten (vereinfacht)"""
+        """KI-Zug im Hintergrund berechnen, Tk-Thread bleibt bedienbar"""
+        self.ai_running = True
+        player.territories_conquered_this_turn = 0
         self.log(f"🤖 {player.name} denkt nach...")
-        self.update()
-        time.sleep(0.5)
-        
-        # Einfache KI: Zufällige Angriffe wenn Vorteil
-        owned = [t for t, d in self.game.board.items() if d["owner"] == player.name]
-        for from_t in owned:
-            if self.game.board[from_t]["troops"] >= 3:
-                targets = [n for n in TERRITORIES[from_t]["neighbors"] 
-                          if self.game.board[n]["owner"] != player.name]
-                if targets and random.random() < 0.6:  # 60% Angriffs-Chance
-                    to_t = min(targets, key=lambda t: self.game.board[t]["troops"])
-                    if self.game.board[from_t]["troops"] > self.game.board[to_t]["troops"] * 1.3:
-                        self._execute_attack(from_t, to_t)
-                        self.update()
-                        time.sleep(0.3)
+        worker = AITurnWorker(self.game.board, player.name, random.getrandbits(32))
+        worker.start()
+        self.after(50, lambda: self._poll_ai_turn(player, worker))
+    
+    def _poll_ai_turn(self, player: Player, worker: AITurnWorker):
+        """Auf das Ergebnis des KI-Threads warten (ohne zu blockieren)"""
+        try:
+            moves = worker.result.get_nowait()
+        except queue.Empty:
+            self.after(50, lambda: self._poll_ai_turn(player, worker))
+            return
         
+        if CONFIG["skip_ai_animations"]:
+            # Alles auf einmal anwenden, UI nur einmal am Ende aktualisieren
+            for move in moves:
+                self._apply_ai_move(player, move, animate=False)
+            self._finish_ai_turn(player)
+        else:
+            self._play_ai_moves(player, moves)
+    
+    def _play_ai_moves(self, player: Player, moves: List[tuple], idx: int = 0):
+        """KI-Züge nacheinander per after() abspielen"""
+        if idx >= len(moves) or not self.game:
+            self._finish_ai_turn(player)
+            return
+        self._apply_ai_move(player, moves[idx], animate=True)
+        self.after(int(CONFIG["animation_speed"] * 1000),
+                   lambda: self._play_ai_moves(player, moves, idx + 1))
+    
+    def _apply_ai_move(self, player: Player, move: tuple, animate: bool):
+        """Einen vorberechneten KI-Zug anwenden"""
+        kind, from_t, to_t, atk_rolls, def_rolls = move
+        if kind != "attack":
+            return
+        self.log(f"⚔️ Angriff: {from_t} → {to_t}")
+        self._apply_battle(player, from_t, to_t, atk_rolls, def_rolls)
+        if animate:
+            self._clear_highlights()
+            self._highlight_territory(from_t, self.theme["warning"])
+            self._highlight_territory(to_t, self.theme["danger"])
+            self._update_territory_display(from_t)
+            self._update_territory_display(to_t)
+            self._update_player_sidebar()
+    
+    def _finish_ai_turn(self, player: Player):
+        """KI-Zug abschließen"""
+        self.ai_running = False
+        if not self.game:
+            return
+        self._clear_highlights()
         self.end_turn()
     
     def _check_winner(self):
@@ -1452,6 +1564,7 @@ class RisikoGUI(tk.Tk):
             ("🔊 Soundeffekte", "sound_enabled"),
             ("🎓 Tutorial-Modus", "tutorial_mode"),
             ("🔄 Auto-Save alle 5 Runden", "auto_save"),
+            ("⏩ KI-Animationen überspringen", "skip_ai_animations"),
         ]
         
         vars = {}
@@ -1477,77 +1590,142 @@ class RisikoGUI(tk.Tk):
                 CONFIG[key] = var.get()
     
     def _auto_save(self):
-        """Automatisches Speichern"""
+        """Automatisches Speichern (Snapshot hier, Schreiben im Hintergrund)"""
+        if self.save_writer.last_error:
+            self.log(f"⚠️ Auto-Save fehlgeschlagen: {self.save_writer.last_error}")
+            self.save_writer.last_error = None
         try:
-            self.save_game(auto=True)
-            self.log("💾 Auto-Save erfolgreich")
-        except:
+            self.save_writer.submit(AUTOSAVE_FILE, encode_snapshot(WORLD.names, self._game_state()))
+            self.log("💾 Auto-Save gestartet")
+        except Exception:
             pass
     
+    def _game_state(self) -> dict:
+        """Kompletter Spielstand als Dict (Grundlage für Snapshots)"""
+        return {
+            "version": "2.0",
+            "saved_at": datetime.now().isoformat(),
+            "map": map_ref(MAP_PATH),
+            "players": [p.to_dict() for p in self.game.players],
+            # Während der Wiederholung zeigt game.board einen alten Zug
+            "board": self.replay_real_board if self.replay_running else self.game.board,
+            "current_player_idx": self.game.current_player_idx,
+            "turn": self.game.turn,
+            "card_deck": self.game.card_deck,
+            "exchange_count": self.game.exchange_count,
+            "config": CONFIG,
+        }
+    
+    def _restore_state(self, data: dict):
+        """Spielzustand aus einem Dict (Datei oder Snapshot) wiederherstellen"""
+        self.game = type('Game', (), {})()
+        self.game.players = [Player.from_dict(p) for p in data["players"]]
+        self.game.board = data["board"]
+        self.game.current_player_idx = data["current_player_idx"]
+        self.game.turn = data["turn"]
+        self.game.card_deck = data["card_deck"]
+        self.game.exchange_count = data["exchange_count"]
+        self.game.game_over = False
+        self.game.components = FortifyComponents(TERRITORIES)
+        self.game.components.rebuild(self.game.board)
+        self.selected_territory = None
+        self._clear_highlights()
+    
     def save_game(self, auto: bool = False):
         """Spiel speichern"""
         if not self.game:
             return
         
-        if not auto:
-            filename = filedialog.asksaveasfilename(defaultextension=".json",
-                                                   filetypes=[("JSON", "*.json")],
-                                                   title="Spiel speichern")
-            if not filename:
-                return
-        else:
-            filename = os.path.expanduser("~/.risiko_autosave.json")
+        if auto:
+            self._auto_save()
+            return
+        
+        filename = filedialog.asksaveasfilename(defaultextension=SAVE_EXT,
+                                               filetypes=[("Risiko-Spielstand", f"*{SAVE_EXT}")],
+                                               title="Spiel speichern")
+        if not filename:
+            return
         
         try:
-            data = {
-                "version": "2.0",
-                "saved_at": datetime.now().isoformat(),
-                "players": [p.to_dict() for p in self.game.players],
-                "board": self.game.board,
-                "current_player_idx": self.game.current_player_idx,
-                "turn": self.game.turn,
-                "card_deck": self.game.card_deck,
-                "exchange_count": self.game.exchange_count,
-                "config": CONFIG,
-            }
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            if not auto:
-                messagebox.showinfo("Gespeichert", f"✓ Spiel gespeichert:\n{filename}", parent=self)
+            write_atomic(filename, encode_snapshot(WORLD.names, self._game_state()))
+            messagebox.showinfo("Gespeichert", f"✓ Spiel gespeichert:\n{filename}", parent=self)
         except Exception as e:
             messagebox.showerror("Fehler", f"Speichern fehlgeschlagen:\n{e}", parent=self)
     
     def load_game(self):
         """Spiel laden"""
-        filename = filedialog.askopenfilename(filetypes=[("JSON", "*.json")], title="Spiel laden")
+        if self._busy():
+            self.status("⏳ Bitte warten, bis KI-Zug bzw. Wiederholung beendet ist")
+            return
+        filename = filedialog.askopenfilename(filetypes=[("Risiko-Spielstand", f"*{SAVE_EXT} *.json")],
+                                              title="Spiel laden")
         if not filename:
             return
         
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_state(filename, map_names)
+            
+            saved_map = resolve_map(data.get("map"))
+            if saved_map != MAP_PATH:
+                messagebox.showerror("Fehler", f"Spielstand gehört zur Karte:\n{saved_map}\n\nBitte mit --map starten.", parent=self)
+                return
             
             # Game rekonstruieren
-            self.game = type('Game', (), {})()
-            self.game.players = [Player.from_dict(p) for p in data["players"]]
-            self.game.board = data["board"]
-            self.game.current_player_idx = data["current_player_idx"]
-            self.game.turn = data["turn"]
-            self.game.card_deck = data["card_deck"]
-            self.game.exchange_count = data["exchange_count"]
-            self.game.game_over = False
+            self._restore_state(data)
+            self.history.clear()
             
             if "config" in data:
                 CONFIG.update(data["config"])
+                self._apply_zoom()
             
             self._update_ui()
             self.log(f"📂 Spiel geladen: {os.path.basename(filename)}")
             messagebox.showinfo("Geladen", f"✓ Runde {self.game.turn} geladen!", parent=self)
+            self._begin_turn()
             
         except Exception as e:
             messagebox.showerror("Fehler", f"Laden fehlgeschlagen:\n{e}", parent=self)
     
+    def undo_turn(self):
+        """Aktuellen Zug verwerfen und vom Zugbeginn neu starten"""
+        if not self.game or self._busy():
+            return
+        snap = self.history.latest()
+        if snap is None:
+            return
+        self._restore_state(decode_snapshot(snap, map_names))
+        if self.turn_rng_state is not None:
+            random.setstate(self.turn_rng_state)
+        self._update_ui()
+        self.log(f"↩️ Zug zurückgesetzt (Runde {self.game.turn})")
+    
+    def show_replay(self):
+        """Gespeicherte Zug-Snapshots auf der Karte abspielen"""
+        if not self.game or self._busy() or not len(self.history):
+            return
+        self.replay_running = True
+        game = self.game
+        real_board = self.replay_real_board = game.board
+        frames = list(self.history)
+        
+        def play(i):
+            if i >= len(frames) or self.game is not game:
+                if self.game is game:
+                    game.board = real_board
+                    self._update_all_territories()
+                self.replay_running = False
+                self.replay_real_board = None
+                self.status("▶️ Wiederholung beendet")
+                return
+            state = decode_snapshot(frames[i], map_names)
+            self.game.board = state["board"]
+            self._update_all_territories()
+            current = state["players"][state["current_player_idx"]]["name"]
+            self.status(f"▶️ Wiederholung {i+1}/{len(frames)} – Runde {state['turn']}, {current} am Zug")
+            self.after(600, lambda: play(i + 1))
+        
+        play(0)
+    
     def show_rules(self):
         """Regeln anzeigen"""
         rules = """
@@ -1701,6 +1879,8 @@ Viel Spaß bei der Welteroberung! 🌍⚔️
         if self.game and messagebox.askyesno("Beenden", 
                                             "Spiel vor dem Beenden speichern?"):
             self.save_game()
+        # Ausstehenden Autosave noch auf die Platte bringen
+        self.save_writer.flush()
         self.destroy()
 
 
@@ -1826,6 +2006,13 @@ class SetupDialog(tk.Toplevel):
 
 # ───────────────────── MAIN ─────────────────────
 def main():
+    if "--map" in sys.argv:
+        try:
+            use_map(sys.argv[sys.argv.index("--map") + 1])
+        except (IndexError, OSError, MapError) as e:
+            print(f"Karte konnte nicht geladen werden: {e}")
+            sys.exit(1)
+    
     app = RisikoGUI()
     
     # Demo-Modus für schnelles Testen
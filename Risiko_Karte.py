@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════╗
+║     R I S I K O  -  Kartenformat & Graph-Cache               ║
+╚══════════════════════════════════════════════════════════════╝
+Gemeinsamer Kartenlader für Risiko_Terminal.py und Risiko_GUI.py, dazu die
+Verbindungs-Komponenten für Truppenverschiebungen.
+
+Kartenformat (JSON, siehe maps/welt.json):
+  {
+    "name": "Welt",
+    "continents":  {"Europa": {"bonus": 5, "color": "#ffe66d", "label": [630, 180, 25]}, ...},
+    "territories": {"Island": {"continent": "Europa", "neighbors": [...], "pos": [520, 140]}, ...}
+  }
+
+Beim ersten Laden wird die Karte geprüft (Nachbarschaften müssen symmetrisch
+sein) und zu einem Binär-Graphen kompiliert: CSR-Arrays für die Nachbarn und
+ein Bitset pro Kontinent. Der Graph liegt in ~/.risiko_cache und wird bei
+unveränderter Kartendatei direkt wiederverwendet.
+
+Aufruf:
+  python Risiko_Karte.py pruefen maps/welt.json
+  python Risiko_Karte.py generieren 40 25 maps/gross.json
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+MAP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps")
+DEFAULT_MAP = os.path.join(MAP_DIR, "welt.json")
+CACHE_DIR = os.path.expanduser("~/.risiko_cache")
+
+CACHE_MAGIC = b"RSKG"
+CACHE_VERSION = 1
+_HEADER = struct.Struct("<4sHIII")  # magic, version, Gebiete, Kontinente, Kanten
+
+
+class MapError(ValueError):
+    """Ungültige Kartendatei."""
+
+
+# ───────────────────────────── GRAPH ──────────────────────────────
+class RisikoMap:
+    """Kompilierte Karte: Gebiete als Indizes, Nachbarn als CSR-Arrays.
+
+    ``offsets[i]:offsets[i+1]`` ist der Bereich von Gebiet ``i`` in ``targets``.
+    ``continent_masks[c]`` hat Bit ``i`` gesetzt, wenn Gebiet ``i`` zu
+    Kontinent ``c`` gehört.
+    """
+
+    def __init__(self, name: str, names: List[str], continent_names: List[str],
+                 bonus: array, colors: List[str], labels: List[Optional[list]],
+                 offsets: array, targets: array, continent_of: array,
+                 continent_masks: List[int], pos: array):
+        self.name = name
+        self.names = names
+        self.index = {t: i for i, t in enumerate(names)}
+        self.continent_names = continent_names
+        self.bonus = bonus
+        self.colors = colors
+        self.labels = labels
+        self.offsets = offsets
+        self.targets = targets
+        self.continent_of = continent_of
+        self.continent_masks = continent_masks
+        self.pos = pos
+
+    def __len__(self):
+        return len(self.names)
+
+    def neighbors(self, i: int) -> array:
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def extent(self) -> Tuple[int, int]:
+        """Größte x/y-Koordinate aller Gebiete."""
+        return max(self.pos[0::2], default=0), max(self.pos[1::2], default=0)
+
+    # ── Bitsets ──
+    def owned_mask(self, board: Dict[str, dict], owner: str) -> int:
+        bits = bytearray((len(self.names) + 7) // 8)
+        for i, t in enumerate(self.names):
+            if board[t]["owner"] == owner:
+                bits[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(bits, "little")
+
+    def owned_continents(self, mask: int) -> List[int]:
+        return [c for c, cm in enumerate(self.continent_masks) if mask & cm == cm]
+
+    # ── Kompatibilität mit den bisherigen Dict-Strukturen ──
+    def territories_dict(self) -> Dict[str, dict]:
+        return {
+            t: {
+                "continent": self.continent_names[self.continent_of[i]],
+                "neighbors": [self.names[n] for n in self.neighbors(i)],
+                "pos": (self.pos[2 * i], self.pos[2 * i + 1]),
+            }
+            for i, t in enumerate(self.names)
+        }
+
+    def continents_dict(self) -> Dict[str, dict]:
+        members: List[List[str]] = [[] for _ in self.continent_names]
+        for i, t in enumerate(self.names):
+            members[self.continent_of[i]].append(t)
+        return {
+            c: {"bonus": self.bonus[ci], "color": self.colors[ci],
+                "label": self.labels[ci], "territories": members[ci]}
+            for ci, c in enumerate(self.continent_names)
+        }
+
+
+# ─────────────────────────── VERBINDUNGEN ─────────────────────────
+class FortifyComponents:
+    """Zusammenhangskomponenten der eigenen Gebiete je Spieler.
+
+    Jedes Gebiet trägt ein Komponenten-Label. Zwei Gebiete sind genau dann
+    per Verschiebung verbunden, wenn sie dasselbe Label haben (O(1)).
+    Bei einer Eroberung wird nur der Verlierer per Union-Find neu berechnet,
+    beim Eroberer werden die angrenzenden Komponenten verschmolzen.
+    """
+
+    def __init__(self, territories: Dict[str, dict]):
+        # Karten sind beim Laden auf symmetrische Nachbarschaften geprüft
+        self.adjacency: Dict[str, set] = {t: set(d["neighbors"]) for t, d in territories.items()}
+        self.board: Dict[str, dict] = {}
+        self.label: Dict[str, int] = {}
+        self.members: Dict[int, set] = {}
+        self.player_labels: Dict[str, set] = defaultdict(set)
+        self._next_label = 0
+
+    def rebuild(self, board: Dict[str, dict]):
+        """Alle Komponenten aus dem Spielbrett neu aufbauen."""
+        self.board = board
+        self.label.clear()
+        self.members.clear()
+        self.player_labels.clear()
+        for owner in {d["owner"] for d in board.values() if d["owner"] is not None}:
+            self._rebuild_player(owner)
+
+    def transfer(self, territory: str, old_owner: Optional[str], new_owner: str):
+        """Besitzerwechsel eines Gebiets einarbeiten (Board ist bereits aktualisiert)."""
+        if old_owner is not None:
+            self._rebuild_player(old_owner)
+        self._attach(territory, new_owner)
+
+    def connected(self, a: str, b: str) -> bool:
+        label = self.label.get(a)
+        return label is not None and label == self.label.get(b)
+
+    def component(self, territory: str) -> set:
+        label = self.label.get(territory)
+        return set(self.members[label]) if label is not None else {territory}
+
+    def _new_component(self, owner: str, territories: set):
+        label = self._next_label
+        self._next_label += 1
+        self.members[label] = territories
+        self.player_labels[owner].add(label)
+        for t in territories:
+            self.label[t] = label
+
+    def _rebuild_player(self, owner: str):
+        for label in self.player_labels.pop(owner, set()):
+            for t in self.members.pop(label):
+                if self.label.get(t) == label:
+                    del self.label[t]
+
+        owned = [t for t, d in self.board.items() if d["owner"] == owner]
+        parent = {t: t for t in owned}
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for t in owned:
+            for n in self.adjacency[t]:
+                if n in parent:
+                    ra, rb = find(t), find(n)
+                    if ra != rb:
+                        parent[ra] = rb
+
+        groups = defaultdict(set)
+        for t in owned:
+            groups[find(t)].add(t)
+        for group in groups.values():
+            self._new_component(owner, group)
+
+    def _attach(self, territory: str, owner: str):
+        labels = {self.label[n] for n in self.adjacency[territory]
+                  if self.board[n]["owner"] == owner and n in self.label}
+        if not labels:
+            self._new_component(owner, {territory})
+            return
+        # Kleinere Komponenten in die größte umhängen
+        target = max(labels, key=lambda l: len(self.members[l]))
+        for label in labels - {target}:
+            for t in self.members.pop(label):
+                self.label[t] = target
+                self.members[target].add(t)
+            self.player_labels[owner].discard(label)
+        self.label[territory] = target
+        self.members[target].add(territory)
+
+
+# ──────────────────────────── KOMPILIEREN ─────────────────────────
+def compile_map(data: dict) -> RisikoMap:
+    """Kartendaten prüfen und in einen RisikoMap-Graphen übersetzen."""
+    continents = data.get("continents") or {}
+    territories = data.get("territories") or {}
+    if not territories:
+        raise MapError("Karte enthält keine Gebiete")
+
+    continent_names = list(continents)
+    cont_index = {c: i for i, c in enumerate(continent_names)}
+    names = list(territories)
+    index = {t: i for i, t in enumerate(names)}
+
+    errors = []
+    neighbor_sets: List[set] = []
+    continent_of = array("i")
+    for t in names:
+        d = territories[t]
+        if d.get("continent") not in cont_index:
+            errors.append(f"{t}: unbekannter Kontinent {d.get('continent')!r}")
+            continent_of.append(0)
+        else:
+            continent_of.append(cont_index[d["continent"]])
+        nbs = set()
+        for n in d.get("neighbors", []):
+            if n not in index:
+                errors.append(f"{t}: unbekannter Nachbar {n!r}")
+            elif n == t:
+                errors.append(f"{t}: ist sein eigener Nachbar")
+            else:
+                nbs.add(index[n])
+        neighbor_sets.append(nbs)
+
+    for i, nbs in enumerate(neighbor_sets):
+        for n in nbs:
+            if i not in neighbor_sets[n]:
+                errors.append(f"{names[i]} → {names[n]}: Rückverbindung fehlt")
+    if errors:
+        raise MapError("Ungültige Karte:\n  " + "\n  ".join(errors[:20]))
+
+    offsets = array("i", [0])
+    targets = array("i")
+    for nbs in neighbor_sets:
+        targets.extend(sorted(nbs))
+        offsets.append(len(targets))
+
+    masks = [bytearray((len(names) + 7) // 8) for _ in continent_names]
+    for i, c in enumerate(continent_of):
+        masks[c][i >> 3] |= 1 << (i & 7)
+
+    # Gebiete ohne Position landen in einem einfachen Raster
+    cols = max(1, int(len(names) ** 0.5))
+    pos = array("i")
+    for i, t in enumerate(names):
+        p = territories[t].get("pos")
+        if p is None:
+            p = (60 + (i % cols) * 70, 60 + (i // cols) * 70)
+        pos.extend((int(p[0]), int(p[1])))
+
+    return RisikoMap(
+        name=data.get("name", "Karte"),
+        names=names,
+        continent_names=continent_names,
+        bonus=array("i", (int(continents[c].get("bonus", 0)) for c in continent_names)),
+        colors=[continents[c].get("color", "#888888") for c in continent_names],
+        labels=[continents[c].get("label") for c in continent_names],
+        offsets=offsets,
+        targets=targets,
+        continent_of=continent_of,
+        continent_masks=[int.from_bytes(m, "little") for m in masks],
+        pos=pos,
+    )
+
+
+# ─────────────────────────── BINÄR-CACHE ──────────────────────────
+def _write_cache(path: str, m: RisikoMap):
+    meta = json.dumps({
+        "name": m.name, "names": m.names, "continents": m.continent_names,
+        "colors": m.colors, "labels": m.labels,
+    }, ensure_ascii=False).encode("utf-8")
+    mask_len = (len(m.names) + 7) // 8
+    parts = [
+        _HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(m.names), len(m.continent_names), len(m.targets)),
+        struct.pack("<I", len(meta)), meta,
+        m.offsets.tobytes(), m.targets.tobytes(), m.continent_of.tobytes(),
+        m.bonus.tobytes(), m.pos.tobytes(),
+    ]
+    parts += [cm.to_bytes(mask_len, "little") for cm in m.continent_masks]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(b"".join(parts))
+    os.replace(tmp, path)
+
+
+def _read_cache(path: str) -> RisikoMap:
+    with open(path, "rb") as f:
+        raw = f.read()
+    magic, version, n, n_cont, n_edges = _HEADER.unpack_from(raw, 0)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        raise MapError("veralteter Cache")
+    pos = _HEADER.size
+    (meta_len,) = struct.unpack_from("<I", raw, pos)
+    pos += 4
+    meta = json.loads(raw[pos:pos + meta_len].decode("utf-8"))
+    pos += meta_len
+
+    def take(count):
+        nonlocal pos
+        a = array("i")
+        a.frombytes(raw[pos:pos + count * a.itemsize])
+        pos += count * a.itemsize
+        return a
+
+    offsets = take(n + 1)
+    targets = take(n_edges)
+    continent_of = take(n)
+    bonus = take(n_cont)
+    coords = take(2 * n)
+    mask_len = (n + 7) // 8
+    masks = []
+    for _ in range(n_cont):
+        masks.append(int.from_bytes(raw[pos:pos + mask_len], "little"))
+        pos += mask_len
+
+    return RisikoMap(meta["name"], meta["names"], meta["continents"], bonus,
+                     meta["colors"], meta["labels"], offsets, targets,
+                     continent_of, masks, coords)
+
+
+def load_map(path: str = DEFAULT_MAP, use_cache: bool = True) -> RisikoMap:
+    """Karte laden – aus dem Binär-Cache, falls die Datei unverändert ist."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha1(raw).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cache_path = os.path.join(CACHE_DIR, f"{stem}-{digest}.rgraph")
+
+    if use_cache and os.path.exists(cache_path):
+        try:
+            return _read_cache(cache_path)
+        except (OSError, ValueError, struct.error):
+            pass  # Cache defekt → neu kompilieren
+
+    m = compile_map(json.loads(raw.decode("utf-8")))
+    if use_cache:
+        try:
+            _write_cache(cache_path, m)
+        except OSError:
+            pass
+    return m
+
+
+# ─────────────────────────── SPIELSTÄNDE ──────────────────────────
+def map_ref(path: str) -> str:
+    """Kartenverweis für Spielstände: relativ zu MAP_DIR, sonst absolut.
+
+    So bleiben Spielstände gültig, wenn das Spiel verschoben wird.
+    """
+    path = os.path.abspath(path)
+    try:
+        rel = os.path.relpath(path, MAP_DIR)
+    except ValueError:  # anderes Laufwerk (Windows)
+        return path
+    return path if rel.startswith(os.pardir) else rel.replace(os.sep, "/")
+
+
+def resolve_map(ref: Optional[str]) -> str:
+    """Kartenverweis aus einem Spielstand in einen absoluten Pfad auflösen.
+
+    Ältere Spielstände enthalten absolute Pfade; existiert die Datei dort
+    nicht mehr, wird eine gleichnamige Karte in MAP_DIR gesucht.
+    """
+    if not ref:
+        return DEFAULT_MAP
+    path = os.path.abspath(os.path.join(MAP_DIR, ref))  # absolute Pfade bleiben erhalten
+    if os.path.exists(path):
+        return path
+    fallback = os.path.join(MAP_DIR, os.path.basename(ref))
+    if os.path.exists(fallback):
+        return fallback
+    raise MapError(f"Karte des Spielstands nicht gefunden: {ref}")
+
+
+# ──────────────────────────── GENERATOR ───────────────────────────
+def generate_grid_map(width: int, height: int, block: int = 5) -> dict:
+    """Große Testkarte: Raster aus width×height Gebieten, Kontinente als Blöcke."""
+    palette = ["#ff6b6b", "#4ecdc4", "#ffe66d", "#95e1d3", "#f38181", "#aa96da"]
+    continents = {}
+    territories = {}
+    for y in range(height):
+        for x in range(width):
+            cont = f"K{x // block}-{y // block}"
+            if cont not in continents:
+                continents[cont] = {"bonus": 2 + (x // block + y // block) % 5,
+                                    "color": palette[len(continents) % len(palette)]}
+            neighbors = [f"G{nx}-{ny}" for nx, ny in ((x-1, y), (x+1, y), (x, y-1), (x, y+1))
+                         if 0 <= nx < width and 0 <= ny < height]
+            territories[f"G{x}-{y}"] = {"continent": cont, "neighbors": neighbors,
+                                        "pos": [40 + x * 60, 40 + y * 60]}
+    return {"name": f"Raster {width}x{height}", "continents": continents, "territories": territories}
+
+
+def _main(argv: List[str]):
+    if len(argv) >= 2 and argv[0] == "pruefen":
+        m = load_map(argv[1])
+        print(f"✓ {m.name}: {len(m)} Gebiete, {len(m.continent_names)} Kontinente, "
+              f"{len(m.targets) // 2} Verbindungen")
+    elif len(argv) >= 4 and argv[0] == "generieren":
+        data = generate_grid_map(int(argv[1]), int(argv[2]))
+        with open(argv[3], "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        print(f"✓ {len(data['territories'])} Gebiete nach {argv[3]} geschrieben")
+    else:
+        print(__doc__)
+
+
+if __name__ == "__main__":
+    try:
+        _main(sys.argv[1:])
+    except MapError as e:
+        print(e)
+        sys.exit(1)
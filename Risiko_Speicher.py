@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════╗
+║     R I S I K O  -  Spielstände & Zug-Historie               ║
+╚══════════════════════════════════════════════════════════════╝
+Gemeinsames Speicherformat für Risiko_Terminal.py und Risiko_GUI.py.
+
+Snapshot-Format (.rsave):
+  b"RSKS" | u16 Version | zlib( u32 Kopf-Länge | Kopf-JSON | Besitzer | Truppen )
+
+Der Kopf enthält Spieler, Runde, Kartenstapel usw. Das Brett selbst wird
+nicht als Dict mit Gebietsnamen gespeichert, sondern als zwei Arrays in der
+Gebietsreihenfolge der Karte: Besitzer (Spieler-Index, -1 = niemand) und
+Truppen. Alte JSON-Spielstände lassen sich weiterhin laden.
+"""
+
+import json
+import os
+import queue
+import struct
+import threading
+import zlib
+from array import array
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Optional
+
+SNAPSHOT_MAGIC = b"RSKS"
+SNAPSHOT_VERSION = 1
+SAVE_EXT = ".rsave"
+REPLAY_MAGIC = b"RSKR"
+
+
+# ───────────────────────────── SNAPSHOTS ──────────────────────────
+def encode_snapshot(names: List[str], state: dict) -> bytes:
+    """Spielstand (Format von to_dict) in einen kompakten Snapshot packen.
+
+    ``names`` ist die Gebietsreihenfolge der Karte (RisikoMap.names).
+    """
+    board = state["board"]
+    player_index = {p["name"]: i for i, p in enumerate(state["players"])}
+    owners = array("h", (player_index.get(board[t]["owner"], -1) for t in names))
+    troops = array("i", (board[t]["troops"] for t in names))
+
+    header = {k: v for k, v in state.items() if k != "board"}
+    header["territories"] = len(names)
+    head = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    payload = b"".join((struct.pack("<I", len(head)), head, owners.tobytes(), troops.tobytes()))
+    return SNAPSHOT_MAGIC + struct.pack("<H", SNAPSHOT_VERSION) + zlib.compress(payload, 1)
+
+
+def decode_snapshot(raw: bytes, names_for: Callable[[Optional[str]], List[str]]) -> dict:
+    """Snapshot wieder in das to_dict-Format (mit Brett-Dict) auspacken.
+
+    ``names_for(map_path)`` liefert die Gebietsreihenfolge der Karte, mit der
+    der Snapshot gespeichert wurde.
+    """
+    if raw[:4] != SNAPSHOT_MAGIC:
+        raise ValueError("kein Risiko-Snapshot")
+    (version,) = struct.unpack_from("<H", raw, 4)
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"unbekannte Snapshot-Version {version}")
+    payload = zlib.decompress(raw[6:])
+    (head_len,) = struct.unpack_from("<I", payload, 0)
+    state = json.loads(payload[4:4 + head_len].decode("utf-8"))
+    n = state.pop("territories")
+    names = names_for(state.get("map"))
+    if n != len(names):
+        raise ValueError("Spielstand passt nicht zur geladenen Karte")
+
+    pos = 4 + head_len
+    owners = array("h")
+    owners.frombytes(payload[pos:pos + n * owners.itemsize])
+    pos += n * owners.itemsize
+    troops = array("i")
+    troops.frombytes(payload[pos:pos + n * troops.itemsize])
+
+    player_names = [p["name"] for p in state["players"]]
+    state["board"] = {
+        t: {"owner": player_names[o] if o >= 0 else None, "troops": tr}
+        for t, o, tr in zip(names, owners, troops)
+    }
+    return state
+
+
+def read_state(path: str, names_for: Callable[[Optional[str]], List[str]]) -> dict:
+    """Spielstand lesen – Snapshot oder alter JSON-Spielstand."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:4] == SNAPSHOT_MAGIC:
+        return decode_snapshot(raw, names_for)
+    return json.loads(raw.decode("utf-8"))
+
+
+# ───────────────────────────── SCHREIBEN ──────────────────────────
+def write_atomic(path: str, data: bytes):
+    """Datei über Temp-Datei + fsync + rename schreiben (nie halb geschrieben)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class SaveWriter(threading.Thread):
+    """Hintergrund-Thread, der fertige Snapshots atomar auf die Platte schreibt.
+
+    Der Aufrufer erzeugt die Bytes (schnell, im UI-Thread) und übergibt sie
+    mit ``submit``; liegen für eine Datei mehrere Aufträge an, gewinnt der
+    neueste.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self._jobs: "queue.Queue[str]" = queue.Queue()
+        self._pending: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self.last_error: Optional[Exception] = None
+        self.start()
+
+    def submit(self, path: str, data: bytes):
+        with self._lock:
+            is_new = path not in self._pending
+            self._pending[path] = data
+        if is_new:
+            self._jobs.put(path)
+
+    def flush(self):
+        """Warten, bis alle Aufträge geschrieben sind."""
+        self._jobs.join()
+
+    def run(self):
+        while True:
+            path = self._jobs.get()
+            with self._lock:
+                data = self._pending.pop(path, None)
+            try:
+                if data is not None:
+                    write_atomic(path, data)
+            except OSError as e:
+                self.last_error = e
+            finally:
+                self._jobs.task_done()
+
+
+# ───────────────────────────── HISTORIE ───────────────────────────
+class SnapshotRing:
+    """Begrenzter Ring aus Snapshots (einer pro Zugbeginn) für Undo & Wiederholung."""
+
+    def __init__(self, size: int = 200):
+        self._items: deque = deque(maxlen=size)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._items)
+
+    def push(self, snapshot: bytes):
+        self._items.append(snapshot)
+
+    def latest(self) -> Optional[bytes]:
+        return self._items[-1] if self._items else None
+
+    def undo(self) -> Optional[bytes]:
+        """Snapshot vom Beginn des aktuellen Zugs entnehmen (None wenn leer)."""
+        return self._items.pop() if self._items else None
+
+    def clear(self):
+        self._items.clear()
+
+    def to_bytes(self) -> bytes:
+        parts = [REPLAY_MAGIC, struct.pack("<I", len(self._items))]
+        for snap in self._items:
+            parts += [struct.pack("<I", len(snap)), snap]
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes, size: int = 200) -> "SnapshotRing":
+        if raw[:4] != REPLAY_MAGIC:
+            raise ValueError("keine Risiko-Wiederholung")
+        ring = cls(size)
+        (count,) = struct.unpack_from("<I", raw, 4)
+        pos = 8
+        for _ in range(count):
+            (length,) = struct.unpack_from("<I", raw, pos)
+            pos += 4
+            ring.push(raw[pos:pos + length])
+            pos += length
+        return ring
@@ -14,8 +14,8 @@ Extras:
   • Statistiken am Spielende
 """
 
-import json
 import os
+import heapq
 import random
 import sys
 import time
@@ -24,6 +24,11 @@ from copy import deepcopy
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+from Risiko_Karte import (DEFAULT_MAP, FortifyComponents, MapError, load_map, map_ref,
+                          resolve_map)
+from Risiko_Speicher import (SAVE_EXT, SnapshotRing, decode_snapshot,
+                             encode_snapshot, read_state, write_atomic)
+
 # ───────────────────────────── FARBEN ─────────────────────────────
 class C:
     RESET  = "\033[0m"
@@ -49,66 +54,20 @@ def bold(text):
     return f"{C.BOLD}{text}{C.RESET}"
 
 # ───────────────────────────── KARTE ──────────────────────────────
-TERRITORIES = {
-    # Nordamerika
-    "Alaska":             {"continent": "Nordamerika", "neighbors": ["Nordwest-Territorium", "Alberta", "Kamtschatka"]},
-    "Nordwest-Territorium":{"continent": "Nordamerika", "neighbors": ["Alaska", "Alberta", "Ontario", "Grönland"]},
-    "Grönland":           {"continent": "Nordamerika", "neighbors": ["Nordwest-Territorium", "Ontario", "Quebec", "Island"]},
-    "Alberta":            {"continent": "Nordamerika", "neighbors": ["Alaska", "Nordwest-Territorium", "Ontario", "Weststaaten"]},
-    "Ontario":            {"continent": "Nordamerika", "neighbors": ["Nordwest-Territorium", "Grönland", "Alberta", "Weststaaten", "Quebec", "Oststaaten"]},
-    "Quebec":             {"continent": "Nordamerika", "neighbors": ["Ontario", "Grönland", "Oststaaten"]},
-    "Weststaaten":        {"continent": "Nordamerika", "neighbors": ["Alberta", "Ontario", "Oststaaten", "Mittelamerika"]},
-    "Oststaaten":         {"continent": "Nordamerika", "neighbors": ["Weststaaten", "Ontario", "Quebec", "Mittelamerika"]},
-    "Mittelamerika":      {"continent": "Nordamerika", "neighbors": ["Weststaaten", "Oststaaten", "Venezuela"]},
-    # Südamerika
-    "Venezuela":          {"continent": "Südamerika", "neighbors": ["Mittelamerika", "Peru", "Brasilien"]},
-    "Peru":               {"continent": "Südamerika", "neighbors": ["Venezuela", "Brasilien", "Argentinien"]},
-    "Brasilien":          {"continent": "Südamerika", "neighbors": ["Venezuela", "Peru", "Argentinien", "Nordafrika"]},
-    "Argentinien":        {"continent": "Südamerika", "neighbors": ["Peru", "Brasilien"]},
-    # Europa
-    "Island":             {"continent": "Europa", "neighbors": ["Grönland", "Großbritannien", "Skandinavien"]},
-    "Großbritannien":     {"continent": "Europa", "neighbors": ["Island", "Skandinavien", "Nordeuropa", "Westeuropa"]},
-    "Skandinavien":       {"continent": "Europa", "neighbors": ["Island", "Großbritannien", "Nordeuropa", "Ukraine"]},
-    "Nordeuropa":         {"continent": "Europa", "neighbors": ["Großbritannien", "Skandinavien", "Westeuropa", "Mitteleuropa", "Ukraine"]},
-    "Westeuropa":         {"continent": "Europa", "neighbors": ["Großbritannien", "Nordeuropa", "Mitteleuropa", "Nordafrika"]},
-    "Mitteleuropa":       {"continent": "Europa", "neighbors": ["Nordeuropa", "Westeuropa", "Ukraine", "Südeuropa"]},
-    "Ukraine":            {"continent": "Europa", "neighbors": ["Skandinavien", "Nordeuropa", "Mitteleuropa", "Südeuropa", "Ural", "Afghanistan", "Mittlerer Osten"]},
-    "Südeuropa":          {"continent": "Europa", "neighbors": ["Westeuropa", "Mitteleuropa", "Ukraine", "Nordafrika", "Ägypten", "Mittlerer Osten"]},
-    # Afrika
-    "Nordafrika":         {"continent": "Afrika", "neighbors": ["Brasilien", "Westeuropa", "Südeuropa", "Ägypten", "Ostafrika", "Zentralafrika"]},
-    "Ägypten":            {"continent": "Afrika", "neighbors": ["Nordafrika", "Südeuropa", "Mittlerer Osten", "Ostafrika"]},
-    "Zentralafrika":      {"continent": "Afrika", "neighbors": ["Nordafrika", "Ostafrika", "Südafrika"]},
-    "Ostafrika":          {"continent": "Afrika", "neighbors": ["Nordafrika", "Ägypten", "Zentralafrika", "Südafrika", "Madagaskar", "Mittlerer Osten"]},
-    "Südafrika":          {"continent": "Afrika", "neighbors": ["Zentralafrika", "Ostafrika", "Madagaskar"]},
-    "Madagaskar":         {"continent": "Afrika", "neighbors": ["Ostafrika", "Südafrika"]},
-    # Asien
-    "Ural":               {"continent": "Asien", "neighbors": ["Ukraine", "Sibirien", "Afghanistan", "China"]},
-    "Sibirien":           {"continent": "Asien", "neighbors": ["Ural", "Jakutien", "Irkutsk", "Mongolei", "China"]},
-    "Jakutien":           {"continent": "Asien", "neighbors": ["Sibirien", "Kamtschatka", "Irkutsk"]},
-    "Kamtschatka":        {"continent": "Asien", "neighbors": ["Jakutien", "Irkutsk", "Mongolei", "Japan", "Alaska"]},
-    "Irkutsk":            {"continent": "Asien", "neighbors": ["Sibirien", "Jakutien", "Kamtschatka", "Mongolei"]},
-    "Mongolei":           {"continent": "Asien", "neighbors": ["Sibirien", "Kamtschatka", "Irkutsk", "China", "Japan"]},
-    "Japan":              {"continent": "Asien", "neighbors": ["Kamtschatka", "Mongolei"]},
-    "Afghanistan":        {"continent": "Asien", "neighbors": ["Ukraine", "Ural", "China", "Indien", "Mittlerer Osten"]},
-    "China":              {"continent": "Asien", "neighbors": ["Ural", "Sibirien", "Mongolei", "Afghanistan", "Indien", "Siam"]},
-    "Mittlerer Osten":    {"continent": "Asien", "neighbors": ["Ukraine", "Südeuropa", "Ägypten", "Ostafrika", "Afghanistan", "Indien"]},
-    "Indien":             {"continent": "Asien", "neighbors": ["Mittlerer Osten", "Afghanistan", "China", "Siam"]},
-    "Siam":               {"continent": "Asien", "neighbors": ["China", "Indien", "Indonesien"]},
-    # Australien/Ozeanien
-    "Indonesien":         {"continent": "Australien", "neighbors": ["Siam", "Neuguinea", "Westaustralien"]},
-    "Neuguinea":          {"continent": "Australien", "neighbors": ["Indonesien", "Westaustralien", "Ostaustralien"]},
-    "Westaustralien":     {"continent": "Australien", "neighbors": ["Indonesien", "Neuguinea", "Ostaustralien"]},
-    "Ostaustralien":      {"continent": "Australien", "neighbors": ["Neuguinea", "Westaustralien"]},
-}
-
-CONTINENTS = {
-    "Nordamerika": {"bonus": 5, "territories": [t for t, d in TERRITORIES.items() if d["continent"] == "Nordamerika"]},
-    "Südamerika":  {"bonus": 2, "territories": [t for t, d in TERRITORIES.items() if d["continent"] == "Südamerika"]},
-    "Europa":      {"bonus": 5, "territories": [t for t, d in TERRITORIES.items() if d["continent"] == "Europa"]},
-    "Afrika":      {"bonus": 3, "territories": [t for t, d in TERRITORIES.items() if d["continent"] == "Afrika"]},
-    "Asien":       {"bonus": 7, "territories": [t for t, d in TERRITORIES.items() if d["continent"] == "Asien"]},
-    "Australien":  {"bonus": 2, "territories": [t for t, d in TERRITORIES.items() if d["continent"] == "Australien"]},
-}
+# Das Spielbrett kommt aus maps/*.json (siehe Risiko_Karte.py).
+# Mit --map <datei> lässt sich eine eigene Karte laden.
+MAP_PATH = DEFAULT_MAP
+WORLD = load_map(MAP_PATH)
+TERRITORIES = WORLD.territories_dict()
+CONTINENTS = WORLD.continents_dict()
+
+def use_map(path: str):
+    """Andere Karte aktivieren (vor Spielbeginn)."""
+    global MAP_PATH, WORLD, TERRITORIES, CONTINENTS
+    MAP_PATH = os.path.abspath(path)
+    WORLD = load_map(path)
+    TERRITORIES = WORLD.territories_dict()
+    CONTINENTS = WORLD.continents_dict()
 
 CARD_TYPES = ["Infanterie", "Kavallerie", "Artillerie"]
 CARD_VALUES = {"Infanterie": 1, "Kavallerie": 5, "Artillerie": 10}
@@ -210,28 +169,33 @@ class Player:
 
 # ──────────────────────────── SPIELSTAND ──────────────────────────
 SAVE_DIR = os.path.expanduser("~/.risiko_saves")
+REPLAY_FILE = os.path.join(SAVE_DIR, "letzte_partie.rreplay")
 
 def ensure_save_dir():
     os.makedirs(SAVE_DIR, exist_ok=True)
 
 def list_saves() -> List[str]:
     ensure_save_dir()
-    return [f for f in os.listdir(SAVE_DIR) if f.endswith(".json")]
+    return [f for f in os.listdir(SAVE_DIR) if f.endswith((SAVE_EXT, ".json"))]
+
+def map_names(map_path: Optional[str]) -> List[str]:
+    """Gebietsreihenfolge der Karte, mit der ein Snapshot gespeichert wurde."""
+    path = resolve_map(map_path)
+    return WORLD.names if path == MAP_PATH else load_map(path).names
 
 def save_game(game_state: dict, slot: str):
-    ensure_save_dir()
-    path = os.path.join(SAVE_DIR, f"{slot}.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(game_state, f, ensure_ascii=False, indent=2)
+    path = os.path.join(SAVE_DIR, f"{slot}{SAVE_EXT}")
+    write_atomic(path, encode_snapshot(WORLD.names, game_state))
     print(colored(f"✓ Gespeichert in: {path}", C.GREEN))
 
 def load_game(slot: str) -> Optional[dict]:
-    path = os.path.join(SAVE_DIR, f"{slot}.json")
-    if not os.path.exists(path):
-        print(colored(f"Datei nicht gefunden: {path}", C.RED))
-        return None
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Kompakter Snapshot bevorzugt, alte JSON-Spielstände als Fallback
+    for ext in (SAVE_EXT, ".json"):
+        path = os.path.join(SAVE_DIR, f"{slot}{ext}")
+        if os.path.exists(path):
+            return read_state(path, map_names)
+    print(colored(f"Datei nicht gefunden: {os.path.join(SAVE_DIR, slot + SAVE_EXT)}", C.RED))
+    return None
 
 # ───────────────────────────── SPIEL ──────────────────────────────
 class RisikoGame:
@@ -244,6 +208,8 @@ class RisikoGame:
         self.exchange_count = 0  # wie oft wurden Karten getauscht
         self.game_over = False
         self.winner: Optional[Player] = None
+        self.components = FortifyComponents(TERRITORIES)
+        self.history = SnapshotRing()  # ein Snapshot pro Zugbeginn
 
     # ── Initialisierung ──
     def setup_board(self):
@@ -271,6 +237,7 @@ class RisikoGame:
             player = self.players[i % len(self.players)]
             self.board[t]["owner"] = player.name
             self.board[t]["troops"] = 1
+        self.components.rebuild(self.board)
 
     def place_initial_troops(self):
         """Spieler platzieren ihre verbleibenden Starttruppen."""
@@ -339,15 +306,23 @@ class RisikoGame:
             print(f"  Runde {colored(str(self.turn), C.YELLOW)} │ {player.colored_name()}'s Zug")
             print(f"{'─'*60}")
 
+            self.history.push(self._snapshot())
+            # Würfelzustand zum Zugbeginn – sonst ließe sich per Rücksetzen neu würfeln
+            rng_state = random.getstate()
             if player.is_ai:
                 time.sleep(0.5)
                 self._ai_turn(player)
-            else:
-                self._human_turn(player)
+            elif self._human_turn(player) == "undo":
+                # Zurück zum Zugbeginn, der Zug startet neu
+                self.from_dict(decode_snapshot(self.history.undo(), map_names))
+                random.setstate(rng_state)
+                continue
 
             self._check_winner()
             self._next_player()
 
+        self.history.push(self._snapshot())
+        self._save_replay()
         self._show_end_screen()
 
     def _player_alive(self, player: Player) -> bool:
@@ -373,7 +348,7 @@ class RisikoGame:
         print(f"\n{colored('═'*40, C.RED)}")
         print(colored("  ANGRIFFPHASE", C.RED + C.BOLD))
         while True:
-            cmd = input("\n  [a]ngreifen  [w]eiter  [k]arte anzeigen  [s]peichern  [q]uit: ").strip().lower()
+            cmd = input("\n  [a]ngreifen  [w]eiter  [k]arte anzeigen  [z]ug neu beginnen  [s]peichern  [q]uit: ").strip().lower()
             if cmd == "a":
                 self._attack_human(player)
             elif cmd in ("w", ""):
@@ -382,6 +357,8 @@ class RisikoGame:
                 self._show_cards(player)
             elif cmd == "s":
                 self._save_prompt()
+            elif cmd == "z":
+                return "undo"
             elif cmd == "q":
                 self._quit_prompt()
 
@@ -400,12 +377,11 @@ class RisikoGame:
 
     # ── Truppenverstärkung ──
     def _calculate_reinforcements(self, player: Player) -> int:
-        owned = [t for t, d in self.board.items() if d["owner"] == player.name]
-        troops = max(3, len(owned) // 3)
-        # Kontinent-Boni
-        for cont, data in CONTINENTS.items():
-            if all(self.board[t]["owner"] == player.name for t in data["territories"]):
-                troops += data["bonus"]
+        mask = WORLD.owned_mask(self.board, player.name)
+        troops = max(3, bin(mask).count("1") // 3)
+        # Kontinent-Boni (Bitset-Vergleich statt Gebiets-Scan)
+        for c in WORLD.owned_continents(mask):
+            troops += WORLD.bonus[c]
         return troops
 
     def _place_troops_human(self, player: Player, n: int):
@@ -589,6 +565,7 @@ class RisikoGame:
                 self.board[to_t]["owner"] = player.name
                 self.board[to_t]["troops"] = move
                 self.board[from_t]["troops"] -= move
+                self.components.transfer(to_t, def_owner, player.name)
                 player.territories_conquered_this_turn += 1
                 player.attacks_won += 1
                 player.territories_captured += 1
@@ -613,7 +590,7 @@ class RisikoGame:
             [t for t in own if self.board[t]["troops"] >= 2], "  Von: ")
         if not from_t:
             return
-        # Erreichbare eigene Gebiete (BFS)
+        # Erreichbare eigene Gebiete (gleiche Komponente)
         reachable = self._reachable(player, from_t)
         reachable.discard(from_t)
         if not reachable:
@@ -632,17 +609,9 @@ class RisikoGame:
             print(colored(f"  {n} Truppen von {from_t} → {to_t}", C.CYAN))
 
     def _reachable(self, player: Player, start: str) -> set:
-        visited = set()
-        queue = [start]
-        while queue:
-            cur = queue.pop()
-            if cur in visited:
-                continue
-            visited.add(cur)
-            for n in TERRITORIES[cur]["neighbors"]:
-                if self.board[n]["owner"] == player.name and n not in visited:
-                    queue.append(n)
-        return visited
+        if self.board[start]["owner"] != player.name:
+            return set()
+        return self.components.component(start)
 
     def _input_territory(self, valid: List[str], prompt: str) -> Optional[str]:
         if not valid:
@@ -701,14 +670,19 @@ class RisikoGame:
     def _ai_place_troops(self, player: Player, n: int):
         own = [t for t, d in self.board.items() if d["owner"] == player.name]
         # Starke KI: Grenzgebiete mit wenig Truppen bevorzugen
+        border = [t for t in own if any(self.board[nb]["owner"] != player.name
+                                        for nb in TERRITORIES[t]["neighbors"])]
+        if not border:
+            for _ in range(n):
+                self.board[random.choice(own)]["troops"] += 1
+            return
+        # Heap statt Neusortieren pro Truppe
+        heap = [(self.board[t]["troops"], i, t) for i, t in enumerate(border)]
+        heapq.heapify(heap)
         for _ in range(n):
-            border = sorted(
-                [t for t in own if any(self.board[nb]["owner"] != player.name
-                                       for nb in TERRITORIES[t]["neighbors"])],
-                key=lambda t: self.board[t]["troops"]
-            )
-            target = border[0] if border else random.choice(own)
+            troops, i, target = heapq.heappop(heap)
             self.board[target]["troops"] += 1
+            heapq.heappush(heap, (troops + 1, i, target))
 
     def _ai_attack(self, player: Player) -> bool:
         own = [t for t, d in self.board.items()
@@ -742,8 +716,7 @@ class RisikoGame:
         if interior and border:
             from_t = interior[0]
             to_t = border[0]
-            reachable = self._reachable(player, from_t)
-            if to_t in reachable:
+            if self.components.connected(from_t, to_t):
                 n = self.board[from_t]["troops"] - 1
                 self.board[from_t]["troops"] = 1
                 self.board[to_t]["troops"] += n
@@ -809,6 +782,7 @@ class RisikoGame:
         return {
             "version": 2,
             "saved_at": datetime.now().isoformat(),
+            "map": map_ref(MAP_PATH),
             "players": [p.to_dict() for p in self.players],
             "board": self.board,
             "current_player_idx": self.current_player_idx,
@@ -818,12 +792,46 @@ class RisikoGame:
         }
 
     def from_dict(self, d: dict):
+        map_path = resolve_map(d.get("map"))
+        if map_path != MAP_PATH:
+            use_map(map_path)
+            self.components = FortifyComponents(TERRITORIES)
         self.players = [Player.from_dict(p) for p in d["players"]]
         self.board = d["board"]
         self.current_player_idx = d["current_player_idx"]
         self.turn = d["turn"]
         self.card_deck = d["card_deck"]
         self.exchange_count = d["exchange_count"]
+        self.components.rebuild(self.board)
+
+    def _snapshot(self) -> bytes:
+        return encode_snapshot(WORLD.names, self.to_dict())
+
+    def _save_replay(self):
+        try:
+            write_atomic(REPLAY_FILE, self.history.to_bytes())
+        except OSError:
+            pass
+
+    def show_replay(self):
+        """Gespeicherte Zug-Snapshots nacheinander anzeigen."""
+        total = len(self.history)
+        previous_map = MAP_PATH  # from_dict schaltet ggf. die Karte um
+        try:
+            for i, snap in enumerate(self.history):
+                frame = RisikoGame()
+                frame.from_dict(decode_snapshot(snap, map_names))
+                clear()
+                print_banner()
+                current = frame.players[frame.current_player_idx]
+                print(f"  Wiederholung {i+1}/{total} │ Runde {frame.turn} │ {current.colored_name()} am Zug")
+                frame.print_status_bar()
+                frame.print_world_map()
+                if input(colored("\n  ENTER = weiter, q = beenden: ", C.GRAY)).strip().lower() == "q":
+                    break
+        finally:
+            if MAP_PATH != previous_map:
+                use_map(previous_map)
 
     def _save_prompt(self):
         slot = input("  Spielstand-Name (Enter = 'autosave'): ").strip() or "autosave"
@@ -850,6 +858,9 @@ class RisikoGame:
             terr = len([t for t in self.board if self.board[t]["owner"] == p.name])
             win_rate = f"{100*p.attacks_won//p.attacks_total}%" if p.attacks_total > 0 else "–"
             print(f"  {p.colored_name():<35} {terr:>3}  {p.attacks_total:>5}   {win_rate:>6} {p.troops_killed:>5}  {p.troops_lost:>6}")
+        if input("\n  Wiederholung ansehen? [j/N]: ").strip().lower() == "j":
+            self.show_replay()
+            return
         pause("\nDrücke ENTER zum Beenden.")
 
 # ──────────────────────────── HAUPTMENÜ ───────────────────────────
@@ -860,6 +871,7 @@ def main_menu():
         print(f"  {bold('[1]')} Neues Spiel")
         print(f"  {bold('[2]')} Spiel laden")
         print(f"  {bold('[3]')} Regeln")
+        print(f"  {bold('[4]')} Letzte Partie ansehen")
         print(f"  {bold('[0]')} Beenden")
         choice = input("\n  Wahl: ").strip()
         if choice == "1":
@@ -872,6 +884,8 @@ def main_menu():
                 game.play()
         elif choice == "3":
             show_rules()
+        elif choice == "4":
+            show_last_replay()
         elif choice == "0":
             print(colored("\nAuf Wiedersehen!\n", C.CYAN))
             sys.exit(0)
@@ -944,22 +958,38 @@ def load_existing_game() -> Optional[RisikoGame]:
         return None
     print(colored("\n  ═══ GESPEICHERTE SPIELE ═══", C.YELLOW))
     for i, s in enumerate(saves):
-        print(f"    [{i+1}] {s.replace('.json','')}")
+        print(f"    [{i+1}] {os.path.splitext(s)[0]}")
     raw = input("\n  Wahl (Nr. oder Name): ").strip()
     if raw.isdigit() and 1 <= int(raw) <= len(saves):
-        slot = saves[int(raw)-1].replace(".json","")
+        slot = os.path.splitext(saves[int(raw)-1])[0]
     else:
         slot = raw
-    data = load_game(slot)
-    if not data:
+    try:
+        data = load_game(slot)
+        if not data:
+            pause()
+            return None
+        game = RisikoGame()
+        game.from_dict(data)
+    except (OSError, ValueError) as e:  # MapError ist ein ValueError
+        print(colored(f"\n  Laden fehlgeschlagen: {e}", C.RED))
         pause()
         return None
-    game = RisikoGame()
-    game.from_dict(data)
     print(colored(f"\n  Spiel geladen! Runde {game.turn}", C.GREEN))
     pause()
     return game
 
+def show_last_replay():
+    if not os.path.exists(REPLAY_FILE):
+        print(colored("\n  Noch keine Partie aufgezeichnet.", C.RED))
+        pause()
+        return
+    with open(REPLAY_FILE, "rb") as f:
+        raw = f.read()
+    game = RisikoGame()
+    game.history = SnapshotRing.from_bytes(raw)
+    game.show_replay()
+
 def show_rules():
     clear()
     print_banner()
@@ -1000,6 +1030,12 @@ def show_rules():
 
 # ───────────────────────────── MAIN ───────────────────────────────
 if __name__ == "__main__":
+    if "--map" in sys.argv:
+        try:
+            use_map(sys.argv[sys.argv.index("--map") + 1])
+        except (IndexError, OSError, MapError) as e:
+            print(colored(f"Karte konnte nicht geladen werden: {e}", C.RED))
+            sys.exit(1)
     try:
         main_menu()
     except KeyboardInterrupt:
@@ -28,6 +28,13 @@ Steuerung:
 - S = Speichern
 - L = Laden
 - P = Prestige (wenn verfügbar)
+- F8 = Bildrate umschalten (60 / 30 / unbegrenzt)
+- F9 = 1 Stunde vorspulen (Debug)
+
+Inhalte (Eras, Gebäude, Upgrades, Achievements) stehen in
+content/evolution_clicker.json und werden beim ersten Start in einen
+Binär-Katalog (~/.evolution_clicker_cache) übersetzt. Eigene Inhalte:
+  python cookie_clicker.py --content meine_inhalte.json
 """
 
 import pygame
@@ -36,6 +43,12 @@ import math
 import json
 import os
 import time
+import hashlib
+import queue
+import threading
+import struct
+import sys
+from array import array
 from datetime import datetime, timedelta
 
 # Pygame initialisieren
@@ -44,7 +57,34 @@ pygame.init()
 # Konstanten
 SCREEN_WIDTH = 1400
 SCREEN_HEIGHT = 800
-FPS = 60
+FPS = 60  # Simulationsschritte pro Sekunde (ein update() = 1/FPS s)
+SIM_DT = 1 / FPS
+MAX_CATCHUP_TICKS = 10  # mehr Rückstand wird analytisch nachgerechnet
+RENDER_MODES = [60, 30, 0]  # Bildrate: normal, Akku-Modus, unbegrenzt (0)
+
+# Gebäudepreise steigen pro Einheit um 15 %
+COST_GROWTH = 1.15
+LOG_COST_GROWTH = math.log10(COST_GROWTH)
+
+# Mengen-Auswahl im Gebäude-Shop
+BUY_AMOUNTS = [1, 10, 100, 'max']
+
+# Partikel: Obergrenze und Anzahl der Transparenz-Stufen für Texte
+MAX_PARTICLES = 600
+ALPHA_BUCKETS = 16
+
+# Spielinhalte (Gebäude, Upgrades, Achievements, Eras) und ihr Binär-Cache
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'content')
+DEFAULT_CONTENT = os.path.join(CONTENT_DIR, 'evolution_clicker.json')
+CONTENT_PATH = DEFAULT_CONTENT
+CATALOG_CACHE_DIR = os.path.expanduser('~/.evolution_clicker_cache')
+CATALOG_MAGIC = b'ECAT'
+CATALOG_VERSION = 1
+CATALOG_HEADER = struct.Struct('<4sHIII')  # magic, version, Gebäude, Upgrades, Achievements
+
+# Spielstand (+ rotierende Backups .1, .2, .3)
+SAVE_FILE = 'evolution_clicker_save.json'
+SAVE_BACKUPS = 3
 
 # Farben
 BLACK = (0, 0, 0)
@@ -65,66 +105,516 @@ BROWN = (139, 69, 19)
 DARK_GREEN = (0, 100, 0)
 DARK_BLUE = (0, 0, 139)
 
+class BigNum:
+    """Große Zahl als Mantisse * 10^Exponent (Mantisse in [1, 10) bzw. 0).
+    
+    Läuft nicht wie float bei 1e308 über und verliert bei späten Prestige-Runden
+    keine Größenordnung. Unveränderlich - Rechenoperationen liefern neue Objekte.
+    """
+    __slots__ = ('m', 'e')
+    
+    def __init__(self, m=0.0, e=0):
+        if m == 0:
+            self.m, self.e = 0.0, 0
+            return
+        if math.isinf(m):  # übergelaufener float → größter endlicher Wert
+            m = math.copysign(sys.float_info.max, m)
+        shift = math.floor(math.log10(abs(m)))
+        m = m / 10.0 ** shift
+        if abs(m) >= 10:  # Rundung von log10
+            m /= 10
+            shift += 1
+        self.m = m
+        self.e = e + shift
+    
+    @staticmethod
+    def of(value):
+        """Zahl, BigNum oder gespeichertes [m, e] in BigNum umwandeln"""
+        if isinstance(value, BigNum):
+            return value
+        if isinstance(value, (list, tuple)):
+            return BigNum(value[0], value[1])
+        if isinstance(value, int) and abs(value) >= 10 ** 300:
+            digits = str(abs(value))
+            sign = -1 if value < 0 else 1
+            return BigNum(sign * int(digits[:17]) / 1e16, len(digits) - 1)
+        return BigNum(float(value))
+    
+    @staticmethod
+    def from_log10(x):
+        e = math.floor(x)
+        return BigNum(10.0 ** (x - e), e)
+    
+    def log10(self):
+        return math.log10(self.m) + self.e
+    
+    def floor(self):
+        """Abrunden; ab 1e15 hat die Mantisse keine Nachkommastellen mehr"""
+        if self.e >= 15:
+            return self
+        return BigNum(math.floor(float(self)))
+    
+    def sqrt(self):
+        if self.e % 2:
+            return BigNum(math.sqrt(self.m * 10), (self.e - 1) // 2)
+        return BigNum(math.sqrt(self.m), self.e // 2)
+    
+    def to_json(self):
+        return [self.m, self.e]
+    
+    # ── Arithmetik ──
+    def __add__(self, other):
+        other = BigNum.of(other)
+        if other.m == 0:
+            return self
+        if self.m == 0:
+            return other
+        if self.e >= other.e:
+            big, small = self, other
+        else:
+            big, small = other, self
+        diff = big.e - small.e
+        if diff > 17:  # jenseits der float-Genauigkeit
+            return big
+        return BigNum(big.m + small.m / 10.0 ** diff, big.e)
+    
+    __radd__ = __add__
+    
+    def __neg__(self):
+        result = BigNum()
+        result.m, result.e = -self.m, self.e
+        return result
+    
+    def __sub__(self, other):
+        return self + -BigNum.of(other)
+    
+    def __rsub__(self, other):
+        return BigNum.of(other) + -self
+    
+    def __mul__(self, other):
+        other = BigNum.of(other)
+        return BigNum(self.m * other.m, self.e + other.e)
+    
+    __rmul__ = __mul__
+    
+    def __truediv__(self, other):
+        other = BigNum.of(other)
+        return BigNum(self.m / other.m, self.e - other.e)
+    
+    def __rtruediv__(self, other):
+        return BigNum.of(other) / self
+    
+    # ── Vergleiche ──
+    def _sign_of_diff(self, other):
+        diff = (self - other).m
+        return (diff > 0) - (diff < 0)
+    
+    def __lt__(self, other):
+        return self._sign_of_diff(other) < 0
+    
+    def __le__(self, other):
+        return self._sign_of_diff(other) <= 0
+    
+    def __gt__(self, other):
+        return self._sign_of_diff(other) > 0
+    
+    def __ge__(self, other):
+        return self._sign_of_diff(other) >= 0
+    
+    def __eq__(self, other):
+        if not isinstance(other, (BigNum, int, float)):
+            return NotImplemented
+        return self._sign_of_diff(other) == 0
+    
+    def __hash__(self):
+        return hash((self.m, self.e))
+    
+    # ── Umwandlung ──
+    def __bool__(self):
+        return self.m != 0
+    
+    def __float__(self):
+        if self.e > 308:
+            return math.copysign(math.inf, self.m)
+        return self.m * 10.0 ** self.e
+    
+    def __int__(self):
+        if self.e < 15:
+            return int(float(self))
+        return int(self.m * 1e15) * 10 ** (self.e - 15)
+    
+    def __format__(self, spec):
+        if self.e >= 18:
+            return f"{self.m:.2f}e{self.e}"
+        return format(float(self), spec)
+    
+    def __repr__(self):
+        return f"BigNum({self.m!r}e{self.e})"
 
-class Particle:
-    """Partikel für visuelle Effekte"""
-    def __init__(self, x, y, color, text=None):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx = random.uniform(-2, 2)
-        self.vy = random.uniform(-5, -2)
-        self.lifetime = random.randint(30, 60)
-        self.age = 0
-        self.text = text
-        self.size = random.randint(3, 6)
-        
+
+class ParticleSystem:
+    """Partikel für visuelle Effekte (Struct-of-Arrays mit fester Obergrenze).
+    
+    Lebende Partikel liegen in den Indizes 0..count-1; tote werden durch den
+    letzten ersetzt. Texte werden einmal pro (Text, Farbe) gerendert und pro
+    Alpha-Stufe als fertige Surface zwischengespeichert.
+    """
+    def __init__(self, font, capacity=MAX_PARTICLES):
+        self.font = font
+        self.capacity = capacity
+        self.count = 0
+        self.x = array('d', bytes(8 * capacity))
+        self.y = array('d', bytes(8 * capacity))
+        self.vx = array('d', bytes(8 * capacity))
+        self.vy = array('d', bytes(8 * capacity))
+        self.age = array('i', bytes(4 * capacity))
+        self.lifetime = array('i', bytes(4 * capacity))
+        self.size = array('i', bytes(4 * capacity))
+        self.color = [None] * capacity
+        self.text = [None] * capacity
+        self.sprites = {}
+    
+    def __len__(self):
+        return self.count
+    
+    def emit(self, x, y, color, text=None):
+        """Partikel hinzufügen (wird bei voller Obergrenze verworfen)"""
+        i = self.count
+        if i >= self.capacity:
+            return
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = random.uniform(-2, 2)
+        self.vy[i] = random.uniform(-5, -2)
+        self.lifetime[i] = random.randint(30, 60)
+        self.age[i] = 0
+        self.size[i] = random.randint(3, 6)
+        self.color[i] = color
+        self.text[i] = text
+        self.count = i + 1
+    
     def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.3  # Schwerkraft
-        self.age += 1
-        
-    def draw(self, screen, font):
-        if self.age < self.lifetime:
-            alpha_factor = 1 - (self.age / self.lifetime)
-            if self.text:
-                text_surf = font.render(self.text, True, self.color)
-                text_surf.set_alpha(int(255 * alpha_factor))
-                screen.blit(text_surf, (int(self.x), int(self.y)))
+        x, y, vx, vy, age, lifetime = self.x, self.y, self.vx, self.vy, self.age, self.lifetime
+        i = 0
+        while i < self.count:
+            age[i] += 1
+            if age[i] >= lifetime[i]:
+                self.remove(i)
+                continue
+            x[i] += vx[i]
+            y[i] += vy[i]
+            vy[i] += 0.3  # Schwerkraft
+            i += 1
+    
+    def remove(self, i):
+        """Partikel i durch den letzten lebenden ersetzen"""
+        last = self.count - 1
+        if i != last:
+            for arr in (self.x, self.y, self.vx, self.vy, self.age, self.lifetime,
+                        self.size, self.color, self.text):
+                arr[i] = arr[last]
+        self.text[last] = None
+        self.count = last
+    
+    def get_sprite(self, text, color, bucket):
+        """Gerenderter Text mit Alpha-Stufe aus dem Cache"""
+        key = (text, color, bucket)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            base = self.sprites.get((text, color, ALPHA_BUCKETS))
+            if base is None:
+                if len(self.sprites) > 512:  # z.B. viele verschiedene "+123"-Texte
+                    self.sprites.clear()
+                base = self.font.render(text, True, color)
+                self.sprites[(text, color, ALPHA_BUCKETS)] = base
+            if bucket == ALPHA_BUCKETS:
+                return base
+            sprite = base.copy()
+            sprite.set_alpha(255 * bucket // ALPHA_BUCKETS)
+            self.sprites[key] = sprite
+        return sprite
+    
+    def draw(self, screen):
+        for i in range(self.count):
+            alpha_factor = 1 - (self.age[i] / self.lifetime[i])
+            text = self.text[i]
+            if text:
+                bucket = max(1, math.ceil(alpha_factor * ALPHA_BUCKETS))
+                screen.blit(self.get_sprite(text, self.color[i], bucket),
+                            (int(self.x[i]), int(self.y[i])))
             else:
-                size = max(1, int(self.size * alpha_factor))
-                pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), size)
-                
-    def is_alive(self):
-        return self.age < self.lifetime
+                size = max(1, int(self.size[i] * alpha_factor))
+                pygame.draw.circle(screen, self.color[i], (int(self.x[i]), int(self.y[i])), size)
+
+
+class ContentError(ValueError):
+    """Ungültige Inhaltsdatei"""
+
+
+class Catalog:
+    """Kompilierte Spielinhalte: Zahlen als kompakte Arrays, Texte als Listen.
+    
+    Gebäude, Upgrades und Achievements sind nur Sichten (Index) auf diese
+    Arrays; ihr veränderlicher Zustand (Anzahl, gekauft, ...) liegt im Objekt.
+    """
+    def __init__(self, meta, arrays):
+        self.name = meta['name']
+        self.eras = [dict(era, color=tuple(era['color'])) for era in meta['eras']]
+        self.building_names = meta['building_names']
+        self.building_icons = meta['building_icons']
+        self.building_descriptions = meta['building_descriptions']
+        self.upgrade_names = meta['upgrade_names']
+        self.upgrade_icons = meta['upgrade_icons']
+        self.upgrade_descriptions = meta['upgrade_descriptions']
+        self.upgrade_types = meta['upgrade_types']
+        self.achievement_names = meta['achievement_names']
+        self.achievement_descriptions = meta['achievement_descriptions']
+        self.achievement_types = meta['achievement_types']
+        for name, _, _ in CATALOG_ARRAYS:
+            setattr(self, name, arrays[name])
+        self.building_log_cost = array('d', (math.log10(c) for c in self.building_cost))
+    
+    def meta(self):
+        return {name: getattr(self, name) for name in (
+            'name', 'eras', 'building_names', 'building_icons', 'building_descriptions',
+            'upgrade_names', 'upgrade_icons', 'upgrade_descriptions', 'upgrade_types',
+            'achievement_names', 'achievement_descriptions', 'achievement_types')}
+
+
+# (Array-Name, Typecode, Länge: 'b' Gebäude / 'u' Upgrades / 'a' Achievements)
+CATALOG_ARRAYS = [
+    ('building_cost', 'd', 'b'),
+    ('building_production', 'd', 'b'),
+    ('building_era', 'i', 'b'),
+    ('upgrade_cost', 'd', 'u'),
+    ('upgrade_multiplier', 'd', 'u'),
+    ('upgrade_era', 'i', 'u'),
+    ('upgrade_all_eras', 'b', 'u'),
+    ('achievement_value', 'd', 'a'),
+    ('achievement_reward', 'i', 'a'),
+]
+
+
+def compile_catalog(data):
+    """Inhaltsdaten prüfen und in einen Catalog übersetzen"""
+    eras = data.get('eras') or []
+    buildings = data.get('buildings') or []
+    upgrades = data.get('upgrades') or []
+    achievements = data.get('achievements') or []
+    errors = []
+    if not eras or eras[0].get('threshold') != 0:
+        errors.append("erste Era braucht threshold 0")
+    thresholds = [era.get('threshold', 0) for era in eras]
+    if thresholds != sorted(thresholds):
+        errors.append("Era-Schwellen müssen aufsteigend sein")
+    for b in buildings:
+        if not 0 <= b.get('era', -1) < len(eras):
+            errors.append(f"{b.get('name')}: unbekannte Era {b.get('era')!r}")
+        if not b.get('base_cost', 0) > 0:
+            errors.append(f"{b.get('name')}: base_cost muss > 0 sein")
+    for u in upgrades:
+        if u.get('type') not in ('click', 'production'):
+            errors.append(f"{u.get('name')}: unbekannter Typ {u.get('type')!r}")
+        if not 0 <= u.get('era', -1) < len(eras):
+            errors.append(f"{u.get('name')}: unbekannte Era {u.get('era')!r}")
+    for a in achievements:
+        if a.get('type') not in ('resources', 'clicks', 'buildings', 'era'):
+            errors.append(f"{a.get('name')}: unbekannter Typ {a.get('type')!r}")
+    if errors:
+        raise ContentError("Ungültige Inhalte:\n  " + "\n  ".join(errors[:20]))
+    
+    meta = {
+        'name': data.get('name', 'Inhalte'),
+        'eras': eras,
+        'building_names': [b['name'] for b in buildings],
+        'building_icons': [b.get('icon', '') for b in buildings],
+        'building_descriptions': [b.get('description', '') for b in buildings],
+        'upgrade_names': [u['name'] for u in upgrades],
+        'upgrade_icons': [u.get('icon', '⬆') for u in upgrades],
+        'upgrade_descriptions': [u.get('description', '') for u in upgrades],
+        'upgrade_types': [u['type'] for u in upgrades],
+        'achievement_names': [a['name'] for a in achievements],
+        'achievement_descriptions': [a.get('description', '') for a in achievements],
+        'achievement_types': [a['type'] for a in achievements],
+    }
+    arrays = {
+        'building_cost': array('d', (b['base_cost'] for b in buildings)),
+        'building_production': array('d', (b.get('base_production', 0) for b in buildings)),
+        'building_era': array('i', (b['era'] for b in buildings)),
+        'upgrade_cost': array('d', (u['cost'] for u in upgrades)),
+        'upgrade_multiplier': array('d', (u['multiplier'] for u in upgrades)),
+        'upgrade_era': array('i', (u['era'] for u in upgrades)),
+        'upgrade_all_eras': array('b', (bool(u.get('all_eras')) for u in upgrades)),
+        'achievement_value': array('d', (a['value'] for a in achievements)),
+        'achievement_reward': array('i', (a.get('reward', 0) for a in achievements)),
+    }
+    return Catalog(meta, arrays)
+
+
+def write_catalog_cache(path, catalog):
+    meta = json.dumps(catalog.meta(), ensure_ascii=False).encode('utf-8')
+    counts = {'b': len(catalog.building_names), 'u': len(catalog.upgrade_names),
+              'a': len(catalog.achievement_names)}
+    parts = [CATALOG_HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, counts['b'], counts['u'], counts['a']),
+             struct.pack('<I', len(meta)), meta]
+    parts += [getattr(catalog, name).tobytes() for name, _, _ in CATALOG_ARRAYS]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(b''.join(parts))
+    os.replace(tmp, path)
+
+
+def read_catalog_cache(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    magic, version, n_b, n_u, n_a = CATALOG_HEADER.unpack_from(raw, 0)
+    if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+        raise ContentError("veralteter Katalog-Cache")
+    pos = CATALOG_HEADER.size
+    (meta_len,) = struct.unpack_from('<I', raw, pos)
+    pos += 4
+    meta = json.loads(raw[pos:pos + meta_len].decode('utf-8'))
+    pos += meta_len
+    
+    counts = {'b': n_b, 'u': n_u, 'a': n_a}
+    arrays = {}
+    for name, typecode, kind in CATALOG_ARRAYS:
+        arr = array(typecode)
+        size = counts[kind] * arr.itemsize
+        arr.frombytes(raw[pos:pos + size])
+        pos += size
+        arrays[name] = arr
+    return Catalog(meta, arrays)
+
+
+def load_catalog(path=DEFAULT_CONTENT, use_cache=True):
+    """Inhalte laden - aus dem Binär-Cache, falls die Datei unverändert ist"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha1(raw).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cache_path = os.path.join(CATALOG_CACHE_DIR, f"{stem}-{digest}.ecat")
+    
+    if use_cache and os.path.exists(cache_path):
+        try:
+            return read_catalog_cache(cache_path)
+        except (OSError, ValueError, struct.error):
+            pass  # Cache defekt → neu kompilieren
+    
+    catalog = compile_catalog(json.loads(raw.decode('utf-8')))
+    if use_cache:
+        try:
+            write_catalog_cache(cache_path, catalog)
+        except OSError:
+            pass
+    return catalog
 
 
 class Building:
-    """Gebäude-Klasse für passive Ressourcenproduktion"""
-    def __init__(self, name, base_cost, base_production, icon, era, description):
-        self.name = name
-        self.base_cost = base_cost
-        self.base_production = base_production
+    """Gebäude-Klasse für passive Ressourcenproduktion (Sicht auf den Katalog)"""
+    __slots__ = ('catalog', 'index', 'count', 'unlocked', 'cached_cost_count', 'cached_cost',
+                 'cost_prefix')
+    
+    def __init__(self, catalog, index):
+        self.catalog = catalog
+        self.index = index
         self.count = 0
-        self.icon = icon
-        self.era = era
-        self.description = description
-        self.unlocked = (era == 0)  # Steinzeit-Gebäude sind freigeschaltet
+        self.unlocked = (self.era == 0)  # Steinzeit-Gebäude sind freigeschaltet
+        self.cached_cost_count = -1
+        self.cached_cost = None
+        self.cost_prefix = [0]  # cost_prefix[k] = Summe der Einzelpreise 0..k-1
+    
+    @property
+    def name(self):
+        return self.catalog.building_names[self.index]
+    
+    @property
+    def base_cost(self):
+        return self.catalog.building_cost[self.index]
+    
+    @property
+    def base_production(self):
+        return self.catalog.building_production[self.index]
+    
+    @property
+    def icon(self):
+        return self.catalog.building_icons[self.index]
+    
+    @property
+    def era(self):
+        return self.catalog.building_era[self.index]
+    
+    @property
+    def description(self):
+        return self.catalog.building_descriptions[self.index]
         
     def get_cost(self):
         """Berechne aktuellen Preis basierend auf Anzahl (steigt exponentiell)"""
-        return int(self.base_cost * (1.15 ** self.count))
+        if self.cached_cost_count != self.count:
+            log_cost = self.catalog.building_log_cost[self.index] + self.count * LOG_COST_GROWTH
+            if log_cost < 300:
+                self.cached_cost = BigNum.of(int(self.base_cost * (COST_GROWTH ** self.count)))
+            else:
+                self.cached_cost = BigNum.from_log10(log_cost)
+            self.cached_cost_count = self.count
+        return self.cached_cost
+    
+    def exact_costs(self, upto):
+        """Präfixsummen der abgerundeten Einzelpreise (wie get_cost) bis Einheit `upto`.
+        
+        Endet vorher, sobald get_cost auf ungerundete Logarithmen umsteigt.
+        """
+        prefix = self.cost_prefix
+        log_cost = self.catalog.building_log_cost[self.index]
+        while len(prefix) <= upto:
+            k = len(prefix) - 1
+            if log_cost + k * LOG_COST_GROWTH >= 300:
+                break
+            prefix.append(prefix[-1] + int(self.base_cost * (COST_GROWTH ** k)))
+        return prefix
+    
+    def cost_of(self, n):
+        """Gesamtpreis der nächsten n Einheiten - gleich der Summe der Einzelkäufe"""
+        if n <= 1:
+            return self.get_cost() if n == 1 else BigNum()
+        end = self.count + n
+        prefix = self.exact_costs(end)
+        exact = len(prefix) - 1
+        if end <= exact:
+            return BigNum.of(prefix[end] - prefix[self.count])
+        # Ab 1e300 sind die Einzelpreise ungerundet → Rest als geometrische Reihe
+        start = max(self.count, exact)
+        total = BigNum.of(prefix[start] - prefix[self.count]) if start > self.count else BigNum()
+        first = BigNum.from_log10(self.catalog.building_log_cost[self.index] + start * LOG_COST_GROWTH)
+        growth = BigNum.from_log10((end - start) * LOG_COST_GROWTH) - 1
+        return total + first * growth / (COST_GROWTH - 1)
+    
+    def max_affordable(self, resources):
+        """Wie viele Einheiten sind mit `resources` bezahlbar? (geschlossene Form)"""
+        if resources < self.get_cost():
+            return 0
+        # cost * (r^n - 1) / (r - 1) <= resources  =>  n = log_r(resources * (r - 1) / cost + 1)
+        ratio = BigNum.of(resources) * (COST_GROWTH - 1) / self.get_cost() + 1
+        n = max(1, int(ratio.log10() / LOG_COST_GROWTH))
+        # Rundungsfehler der Logarithmen ausgleichen
+        while n > 1 and self.cost_of(n) > resources:
+            n -= 1
+        while self.cost_of(n + 1) <= resources:
+            n += 1
+        return n
     
     def get_production(self):
         """Berechne aktuelle Produktion pro Sekunde"""
         return self.base_production * self.count
     
-    def purchase(self, resources):
-        """Kaufe ein Gebäude"""
-        cost = self.get_cost()
+    def purchase(self, resources, n=1):
+        """Kaufe n Gebäude auf einmal (alle oder keins)"""
+        if n < 1:
+            return 0
+        cost = self.cost_of(n)
         if resources >= cost:
-            self.count += 1
+            self.count += n
             return cost
         return 0
     
@@ -139,17 +629,46 @@ class Building:
 
 
 class Upgrade:
-    """Upgrade-Klasse für Multiplikatoren und Boni"""
-    def __init__(self, name, cost, multiplier, upgrade_type, era, description, icon="⬆"):
-        self.name = name
-        self.cost = cost
-        self.multiplier = multiplier
-        self.upgrade_type = upgrade_type  # 'click', 'production', 'building'
-        self.era = era
-        self.description = description
-        self.icon = icon
+    """Upgrade-Klasse für Multiplikatoren und Boni (Sicht auf den Katalog)"""
+    __slots__ = ('catalog', 'index', 'purchased', 'unlocked')
+    
+    def __init__(self, catalog, index):
+        self.catalog = catalog
+        self.index = index
         self.purchased = False
-        self.unlocked = (era == 0)
+        self.unlocked = (self.era == 0)
+    
+    @property
+    def name(self):
+        return self.catalog.upgrade_names[self.index]
+    
+    @property
+    def cost(self):
+        return self.catalog.upgrade_cost[self.index]
+    
+    @property
+    def multiplier(self):
+        return self.catalog.upgrade_multiplier[self.index]
+    
+    @property
+    def upgrade_type(self):
+        return self.catalog.upgrade_types[self.index]  # 'click', 'production'
+    
+    @property
+    def all_eras(self):
+        return bool(self.catalog.upgrade_all_eras[self.index])
+    
+    @property
+    def era(self):
+        return self.catalog.upgrade_era[self.index]
+    
+    @property
+    def description(self):
+        return self.catalog.upgrade_descriptions[self.index]
+    
+    @property
+    def icon(self):
+        return self.catalog.upgrade_icons[self.index]
         
     def purchase(self):
         """Kaufe Upgrade"""
@@ -159,19 +678,38 @@ class Upgrade:
         """Informationstext"""
         return (f"{self.name}\n"
                 f"Kosten: {format_number(self.cost)}\n"
-                f"Effekt: x{self.multiplier}\n"
+                f"Effekt: x{self.multiplier:g}\n"
                 f"{self.description}")
 
 
 class Achievement:
-    """Achievement-System"""
-    def __init__(self, name, description, requirement_type, requirement_value, reward):
-        self.name = name
-        self.description = description
-        self.requirement_type = requirement_type  # 'resources', 'clicks', 'buildings', etc.
-        self.requirement_value = requirement_value
-        self.reward = reward  # Prestige-Punkte
+    """Achievement-System (Sicht auf den Katalog)"""
+    __slots__ = ('catalog', 'index', 'unlocked')
+    
+    def __init__(self, catalog, index):
+        self.catalog = catalog
+        self.index = index
         self.unlocked = False
+    
+    @property
+    def name(self):
+        return self.catalog.achievement_names[self.index]
+    
+    @property
+    def description(self):
+        return self.catalog.achievement_descriptions[self.index]
+    
+    @property
+    def requirement_type(self):
+        return self.catalog.achievement_types[self.index]  # 'resources', 'clicks', 'buildings', 'era'
+    
+    @property
+    def requirement_value(self):
+        return self.catalog.achievement_value[self.index]
+    
+    @property
+    def reward(self):
+        return self.catalog.achievement_reward[self.index]  # Prestige-Punkte
         
     def check(self, game_state):
         """Prüfe ob Achievement erfüllt ist"""
@@ -189,8 +727,52 @@ class Achievement:
         return False
 
 
+class AchievementIndex:
+    """Achievements je Kennzahl nach Schwelle sortiert.
+    
+    Pro Kennzahl ('resources', 'clicks', 'buildings', 'era') zeigt ein Zeiger auf
+    das erste noch offene Achievement; alles davor ist freigeschaltet. Pro Frame
+    reicht so ein Vergleich mit `next_threshold[kennzahl]`.
+    """
+    def __init__(self, achievements):
+        self.by_metric = {}
+        for achievement in achievements:
+            self.by_metric.setdefault(achievement.requirement_type, []).append(achievement)
+        for entries in self.by_metric.values():
+            entries.sort(key=lambda a: a.requirement_value)
+        self.position = {metric: 0 for metric in self.by_metric}
+        self.next_threshold = {}
+        for metric in self.by_metric:
+            self.advance(metric, None)
+    
+    def advance(self, metric, value):
+        """Zeiger bis zur ersten nicht erreichten Schwelle vorrücken.
+        
+        Gibt die dabei neu erreichten Achievements zurück.
+        """
+        entries = self.by_metric.get(metric)
+        if not entries:
+            return []
+        reached = []
+        pos = self.position[metric]
+        while pos < len(entries):
+            achievement = entries[pos]
+            if not achievement.unlocked:
+                if value is None or value < achievement.requirement_value:
+                    break
+                reached.append(achievement)
+            pos += 1
+        self.position[metric] = pos
+        self.next_threshold[metric] = entries[pos].requirement_value if pos < len(entries) else None
+        return reached
+
+
 def format_number(num):
     """Formatiere große Zahlen lesbar"""
+    if isinstance(num, BigNum):
+        if num.e >= 18:
+            return f"{num.m:.2f}e{num.e}"
+        num = float(num)
     if num < 1000:
         return str(int(num))
     elif num < 1000000:
@@ -205,6 +787,85 @@ def format_number(num):
         return f"{num/1000000000000000:.1f}Q"
 
 
+def prestige_multiplier_for(points):
+    """Multiplikator für Prestige-Punkte (+10 % je Punkt) - als BigNum, da die
+    Punkte bei späten Runden weit über 1e308 liegen"""
+    return BigNum.of(points) * 0.1 + 1
+
+
+def save_checksum(data):
+    """Prüfsumme über die kanonische JSON-Form des Spielstands"""
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def write_save_file(data, path=SAVE_FILE, backups=SAVE_BACKUPS):
+    """Spielstand atomar schreiben: Temp-Datei + fsync, Backups rotieren, rename"""
+    content = json.dumps({'checksum': save_checksum(data), 'data': data})
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    
+    # Ältere Stände weiterschieben: save → save.1 → save.2 → ...
+    for i in range(backups - 1, 0, -1):
+        if os.path.exists(f"{path}.{i}"):
+            os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+    if backups and os.path.exists(path):
+        os.replace(path, f"{path}.1")
+    os.replace(tmp, path)
+
+
+def read_save_file(path):
+    """Spielstand lesen und Prüfsumme kontrollieren (ValueError bei Defekt)"""
+    with open(path, 'r') as f:
+        content = json.load(f)
+    if 'checksum' not in content:
+        return content  # alter Spielstand ohne Prüfsumme
+    if save_checksum(content['data']) != content['checksum']:
+        raise ValueError(f"Prüfsumme stimmt nicht: {path}")
+    return content['data']
+
+
+class SaveWriter(threading.Thread):
+    """Schreibt Spielstände im Hintergrund, damit das Spiel nicht ruckelt.
+    
+    Liegt beim Schreiben schon ein neuerer Stand an, wird nur dieser geschrieben.
+    """
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.jobs = queue.Queue()
+        self.pending = None
+        self.lock = threading.Lock()
+        self.last_error = None
+        self.start()
+    
+    def submit(self, data):
+        with self.lock:
+            is_new = self.pending is None
+            self.pending = data
+        if is_new:
+            self.jobs.put(True)
+    
+    def flush(self):
+        """Warten, bis alle Stände geschrieben sind"""
+        self.jobs.join()
+    
+    def run(self):
+        while True:
+            self.jobs.get()
+            with self.lock:
+                data, self.pending = self.pending, None
+            try:
+                if data is not None:
+                    write_save_file(data)
+            except (OSError, TypeError, ValueError) as e:
+                self.last_error = e
+            finally:
+                self.jobs.task_done()
+
+
 class Button:
     """UI Button Klasse"""
     def __init__(self, x, y, width, height, text, color, text_color=WHITE):
@@ -240,6 +901,8 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Evolution Clicker - Von der Steinzeit zur Zukunft!")
         self.clock = pygame.time.Clock()
+        self.render_fps = RENDER_MODES[0]
+        self.sim_accumulator = 0.0
         self.running = True
         self.state = 'menu'  # menu, playing, achievements, stats, prestige
         
@@ -251,28 +914,26 @@ class Game:
         self.font_tiny = pygame.font.Font(None, 18)
         
         # Spielstand
-        self.resources = 0
-        self.total_earned = 0
+        self.resources = BigNum()
+        self.total_earned = BigNum()
         self.total_clicks = 0
         self.click_power = 1
         self.production_per_second = 0
         self.current_era = 0
-        self.prestige_points = 0
-        self.prestige_multiplier = 1.0
+        self.prestige_points = BigNum()
+        self.prestige_multiplier = BigNum(1.0)
         
         # Zeit-Tracking
         self.last_save_time = time.time()
+        self.save_writer = SaveWriter()
         self.session_start = time.time()
         
         # Eras
-        self.eras = [
-            {"name": "STEINZEIT", "color": BROWN, "threshold": 0, "icon": "🪨"},
-            {"name": "ANTIKE", "color": GOLD, "threshold": 1000, "icon": "🏛️"},
-            {"name": "MITTELALTER", "color": DARK_BLUE, "threshold": 50000, "icon": "🏰"},
-            {"name": "INDUSTRIAL", "color": GRAY, "threshold": 1000000, "icon": "🏭"},
-            {"name": "MODERN", "color": BLUE, "threshold": 50000000, "icon": "💻"},
-            {"name": "ZUKUNFT", "color": PURPLE, "threshold": 1000000000, "icon": "🚀"}
-        ]
+        # Spielinhalte (siehe content/evolution_clicker.json)
+        self.catalog = load_catalog(CONTENT_PATH)
+        
+        # Eras
+        self.eras = self.catalog.eras
         
         # Gebäude initialisieren
         self.buildings = self.initialize_buildings()
@@ -282,11 +943,18 @@ class Game:
         
         # Achievements initialisieren
         self.achievements = self.initialize_achievements()
+        self.achievement_index = AchievementIndex(self.achievements)
+        
+        # Gebäude insgesamt (laufend mitgezählt statt pro Frame summiert)
+        self.total_buildings = 0
         
         # UI-Elemente
-        self.particles = []
+        self.particles = ParticleSystem(self.font_medium)
+        self.text_cache = {}
+        self.layer_cache = {}
         self.scroll_offset = 0
         self.max_scroll = 0
+        self.buy_amount = 1
         
         # Klickbarer Bereich für Hauptressource
         self.click_area = pygame.Rect(100, 150, 300, 300)
@@ -303,195 +971,38 @@ class Game:
         self.boost_duration = 600  # 10 Sekunden bei 60 FPS
         self.boost_multiplier = 5
         
+        # Multiplikator-Cache (wird nur bei Käufen, Prestige und Laden neu berechnet)
+        self.era_multipliers = None
+        self.base_production = None
+        self.base_click_power = None
+        
         # Statistiken
         self.stats = {
             'total_time_played': 0,
             'total_buildings_purchased': 0,
             'total_upgrades_purchased': 0,
-            'highest_resources': 0,
+            'highest_resources': BigNum(),
             'prestiges': 0
         }
         
     def initialize_buildings(self):
         """Erstelle alle Gebäude für jede Era"""
-        buildings = []
-        
-        # STEINZEIT (Era 0)
-        buildings.append(Building("Steinsammler", 10, 0.1, "🪨", 0, 
-                                 "Sammelt automatisch Steine"))
-        buildings.append(Building("Holzfäller", 50, 0.5, "🪵", 0, 
-                                 "Fällt Bäume für Ressourcen"))
-        buildings.append(Building("Jäger", 200, 2, "🏹", 0, 
-                                 "Jagt wilde Tiere"))
-        buildings.append(Building("Lagerfeuer", 800, 8, "🔥", 0, 
-                                 "Wärmt und motiviert"))
-        buildings.append(Building("Höhle", 3000, 30, "⛰️", 0, 
-                                 "Sichere Unterkunft"))
-        
-        # ANTIKE (Era 1)
-        buildings.append(Building("Farm", 10000, 100, "🌾", 1, 
-                                 "Produziert Nahrung"))
-        buildings.append(Building("Dorf", 40000, 400, "🏘️", 1, 
-                                 "Bringt neue Arbeiter"))
-        buildings.append(Building("Tempel", 150000, 1500, "⛩️", 1, 
-                                 "Göttlicher Segen"))
-        buildings.append(Building("Marktplatz", 500000, 5000, "🏪", 1, 
-                                 "Handelt mit anderen"))
-        buildings.append(Building("Bibliothek", 2000000, 20000, "📚", 1, 
-                                 "Sammelt Wissen"))
-        
-        # MITTELALTER (Era 2)
-        buildings.append(Building("Burg", 10000000, 100000, "🏰", 2, 
-                                 "Verteidigt dein Reich"))
-        buildings.append(Building("Gilde", 40000000, 400000, "⚔️", 2, 
-                                 "Organisiert Handwerker"))
-        buildings.append(Building("Kathedrale", 150000000, 1500000, "⛪", 2, 
-                                 "Monumentales Bauwerk"))
-        buildings.append(Building("Hafen", 600000000, 6000000, "⚓", 2, 
-                                 "Ermöglicht Seehandel"))
-        buildings.append(Building("Universität", 2500000000, 25000000, "🎓", 2, 
-                                 "Bildet Gelehrte aus"))
-        
-        # INDUSTRIAL (Era 3)
-        buildings.append(Building("Fabrik", 10000000000, 100000000, "🏭", 3, 
-                                 "Massenproduktion"))
-        buildings.append(Building("Kraftwerk", 50000000000, 500000000, "⚡", 3, 
-                                 "Erzeugt Energie"))
-        buildings.append(Building("Eisenbahn", 200000000000, 2000000000, "🚂", 3, 
-                                 "Transportiert Güter"))
-        buildings.append(Building("Bank", 1000000000000, 10000000000, "🏦", 3, 
-                                 "Verwaltet Reichtum"))
-        buildings.append(Building("Labor", 5000000000000, 50000000000, "🔬", 3, 
-                                 "Forscht neue Technologien"))
-        
-        # MODERN (Era 4)
-        buildings.append(Building("Rechenzentrum", 25000000000000, 250000000000, "💻", 4, 
-                                 "Verarbeitet Daten"))
-        buildings.append(Building("Startup", 100000000000000, 1000000000000, "📱", 4, 
-                                 "Innovative Technologie"))
-        buildings.append(Building("Forschungsinstitut", 500000000000000, 5000000000000, "🧬", 4, 
-                                 "Fortgeschrittene Wissenschaft"))
-        buildings.append(Building("Wolkenkratzer", 2000000000000000, 20000000000000, "🏢", 4, 
-                                 "Symbol des Fortschritts"))
-        buildings.append(Building("Kernreaktor", 10000000000000000, 100000000000000, "☢️", 4, 
-                                 "Unbegrenzte Energie"))
-        
-        # ZUKUNFT (Era 5)
-        buildings.append(Building("KI-System", 50000000000000000, 500000000000000, "🤖", 5, 
-                                 "Künstliche Intelligenz"))
-        buildings.append(Building("Raumstation", 250000000000000000, 2500000000000000, "🛸", 5, 
-                                 "Orbitale Plattform"))
-        buildings.append(Building("Terraformer", 1000000000000000000, 10000000000000000, "🌍", 5, 
-                                 "Formt Planeten um"))
-        buildings.append(Building("Zeitmaschine", 5000000000000000000, 50000000000000000, "⏰", 5, 
-                                 "Manipuliert Zeit"))
-        buildings.append(Building("Universumsportal", 25000000000000000000, 250000000000000000, "🌌", 5, 
-                                 "Zugang zu neuen Dimensionen"))
-        
-        return buildings
+        return [Building(self.catalog, i) for i in range(len(self.catalog.building_names))]
     
     def initialize_upgrades(self):
         """Erstelle alle Upgrades"""
-        upgrades = []
-        
-        # STEINZEIT Upgrades
-        upgrades.append(Upgrade("Steinwerkzeuge", 100, 2, 'click', 0, 
-                               "Verdoppelt Click-Power", "🔨"))
-        upgrades.append(Upgrade("Feuerstein", 500, 2, 'production', 0, 
-                               "Verdoppelt Steinzeit-Produktion", "✨"))
-        upgrades.append(Upgrade("Stammesführer", 2000, 3, 'click', 0, 
-                               "Verdreifacht Click-Power", "👑"))
-        
-        # ANTIKE Upgrades
-        upgrades.append(Upgrade("Bronze-Werkzeuge", 50000, 2, 'production', 1, 
-                               "Verdoppelt Antike-Produktion", "🔧"))
-        upgrades.append(Upgrade("Schrift", 200000, 2, 'click', 1, 
-                               "Verdoppelt Click-Power", "📜"))
-        upgrades.append(Upgrade("Bewässerung", 800000, 3, 'production', 1, 
-                               "Verdreifacht Farm-Produktion", "💧"))
-        
-        # MITTELALTER Upgrades
-        upgrades.append(Upgrade("Stahl", 50000000, 2, 'production', 2, 
-                               "Verdoppelt Mittelalter-Produktion", "⚔️"))
-        upgrades.append(Upgrade("Gotische Architektur", 200000000, 3, 'click', 2, 
-                               "Verdreifacht Click-Power", "🏰"))
-        upgrades.append(Upgrade("Handelswege", 1000000000, 2, 'production', 2, 
-                               "Verdoppelt Hafen-Produktion", "🗺️"))
-        
-        # INDUSTRIAL Upgrades
-        upgrades.append(Upgrade("Dampfmaschine", 50000000000, 2, 'production', 3, 
-                               "Verdoppelt Industrial-Produktion", "⚙️"))
-        upgrades.append(Upgrade("Elektrizität", 500000000000, 3, 'click', 3, 
-                               "Verdreifacht Click-Power", "⚡"))
-        upgrades.append(Upgrade("Fließband", 2500000000000, 4, 'production', 3, 
-                               "Vervierfacht Fabrik-Produktion", "🏭"))
-        
-        # MODERN Upgrades
-        upgrades.append(Upgrade("Internet", 100000000000000, 2, 'production', 4, 
-                               "Verdoppelt Modern-Produktion", "🌐"))
-        upgrades.append(Upgrade("Quantencomputer", 1000000000000000, 5, 'click', 4, 
-                               "Verfünffacht Click-Power", "💻"))
-        upgrades.append(Upgrade("Cloud Computing", 10000000000000000, 3, 'production', 4, 
-                               "Verdreifacht Rechenzentrum-Produktion", "☁️"))
-        
-        # ZUKUNFT Upgrades
-        upgrades.append(Upgrade("Künstliche Intelligenz", 500000000000000000, 10, 'click', 5, 
-                               "Verzehnfacht Click-Power", "🤖"))
-        upgrades.append(Upgrade("Nanobots", 5000000000000000000, 5, 'production', 5, 
-                               "Verfünffacht Zukunft-Produktion", "🔬"))
-        upgrades.append(Upgrade("Antimaterie", 50000000000000000000, 10, 'production', 5, 
-                               "Verzehnfacht alle Produktion", "💫"))
-        
-        return upgrades
+        return [Upgrade(self.catalog, i) for i in range(len(self.catalog.upgrade_names))]
     
     def initialize_achievements(self):
         """Erstelle Achievements"""
-        achievements = []
-        
-        achievements.append(Achievement("Erster Klick", "Klicke zum ersten Mal", 
-                                       'clicks', 1, 1))
-        achievements.append(Achievement("Fleißiger Klicker", "Klicke 100 Mal", 
-                                       'clicks', 100, 5))
-        achievements.append(Achievement("Klick-Meister", "Klicke 1000 Mal", 
-                                       'clicks', 1000, 10))
-        achievements.append(Achievement("Klick-Legende", "Klicke 10000 Mal", 
-                                       'clicks', 10000, 25))
-        
-        achievements.append(Achievement("Erste Ressourcen", "Sammle 100 Ressourcen", 
-                                       'resources', 100, 1))
-        achievements.append(Achievement("Wohlhabend", "Sammle 100K Ressourcen", 
-                                       'resources', 100000, 10))
-        achievements.append(Achievement("Reich", "Sammle 100M Ressourcen", 
-                                       'resources', 100000000, 25))
-        achievements.append(Achievement("Unbegrenzt Reich", "Sammle 100B Ressourcen", 
-                                       'resources', 100000000000, 50))
-        
-        achievements.append(Achievement("Erste Immobilie", "Kaufe 10 Gebäude", 
-                                       'buildings', 10, 5))
-        achievements.append(Achievement("Immobilien-Mogul", "Kaufe 100 Gebäude", 
-                                       'buildings', 100, 15))
-        achievements.append(Achievement("Baumeister", "Kaufe 500 Gebäude", 
-                                       'buildings', 500, 30))
-        
-        achievements.append(Achievement("Zeitreisender", "Erreiche die Antike", 
-                                       'era', 1, 10))
-        achievements.append(Achievement("Mittelalterlicher Herrscher", "Erreiche das Mittelalter", 
-                                       'era', 2, 20))
-        achievements.append(Achievement("Industrieller Titan", "Erreiche die Industrielle Revolution", 
-                                       'era', 3, 30))
-        achievements.append(Achievement("Moderner Visionär", "Erreiche die Moderne", 
-                                       'era', 4, 40))
-        achievements.append(Achievement("Zukunfts-Pionier", "Erreiche die Zukunft", 
-                                       'era', 5, 50))
-        
-        return achievements
+        return [Achievement(self.catalog, i) for i in range(len(self.catalog.achievement_names))]
     
     def update_era(self):
         """Prüfe und aktualisiere die aktuelle Era"""
         old_era = self.current_era
-        for i, era in enumerate(self.eras):
-            if self.total_earned >= era['threshold']:
-                self.current_era = i
+        while (self.current_era + 1 < len(self.eras) and
+               self.total_earned >= self.eras[self.current_era + 1]['threshold']):
+            self.current_era += 1
         
         # Schalte Gebäude und Upgrades für neue Era frei
         if self.current_era > old_era:
@@ -507,36 +1018,52 @@ class Game:
                                  self.eras[self.current_era]['color'], 
                                  f"Neue Era: {self.eras[self.current_era]['name']}!", 50)
     
+    def invalidate_multipliers(self):
+        """Multiplikator-Cache verwerfen (nach Käufen, Prestige, Laden)"""
+        self.era_multipliers = None
+        self.base_production = None
+        self.base_click_power = None
+    
+    def get_era_multipliers(self):
+        """Produktions-Multiplikator je Era aus den gekauften Upgrades"""
+        if self.era_multipliers is None:
+            multipliers = [1] * len(self.eras)
+            for upgrade in self.upgrades:
+                if upgrade.purchased and upgrade.upgrade_type == 'production':
+                    # Upgrade gilt für Gebäude derselben Era oder alle
+                    for era in range(len(self.eras)):
+                        if upgrade.era == era or upgrade.all_eras:
+                            multipliers[era] *= upgrade.multiplier
+            self.era_multipliers = multipliers
+        return self.era_multipliers
+    
     def calculate_click_power(self):
         """Berechne aktuelle Click-Power mit Upgrades"""
-        power = 1
-        for upgrade in self.upgrades:
-            if upgrade.purchased and upgrade.upgrade_type == 'click':
-                power *= upgrade.multiplier
-        power *= self.prestige_multiplier
+        if self.base_click_power is None:
+            power = 1
+            for upgrade in self.upgrades:
+                if upgrade.purchased and upgrade.upgrade_type == 'click':
+                    power *= upgrade.multiplier
+            self.base_click_power = power * self.prestige_multiplier
+        power = self.base_click_power
         if self.boost_active:
             power *= self.boost_multiplier
-        return int(power)
+        return power.floor()
     
     def calculate_production(self):
         """Berechne Produktion pro Sekunde"""
-        production = 0
-        for building in self.buildings:
-            base_prod = building.get_production()
-            
-            # Wende Gebäude-spezifische Upgrades an
-            for upgrade in self.upgrades:
-                if upgrade.purchased and upgrade.upgrade_type == 'production':
-                    # Upgrade gilt für Gebäude derselben Era oder alle
-                    if upgrade.era == building.era or upgrade.name == "Antimaterie":
-                        base_prod *= upgrade.multiplier
-            
-            production += base_prod
+        if self.base_production is None:
+            multipliers = self.get_era_multipliers()
+            production = 0
+            for building in self.buildings:
+                if building.count:
+                    production += building.get_production() * multipliers[building.era]
+            self.base_production = production * self.prestige_multiplier
         
-        production *= self.prestige_multiplier
+        # Boost wirkt erst hier, damit Ein-/Ausschalten den Cache nicht verwirft
         if self.boost_active:
-            production *= self.boost_multiplier
-        return production
+            return self.base_production * self.boost_multiplier
+        return self.base_production
     
     def click_resource(self):
         """Hauptressource klicken"""
@@ -555,21 +1082,89 @@ class Game:
         if self.resources > self.stats['highest_resources']:
             self.stats['highest_resources'] = self.resources
     
+    def advance_time(self, ticks, count_playtime=True):
+        """Spiele `ticks` Update-Schritte analytisch vor statt Frame für Frame.
+        
+        Produktion und Click-Power sind zwischen zwei Boost-Wechseln konstant,
+        daher wird nur am Boost-Ende ein neues Segment begonnen. Era-Wechsel und
+        Achievements ändern keine Raten und werden am Ende einmal geprüft -
+        das Ergebnis entspricht dem von `ticks` Aufrufen von update().
+        """
+        gained = 0
+        remaining = ticks
+        last_click = None
+        while remaining > 0:
+            segment = remaining
+            if self.boost_active:
+                segment = max(1, min(remaining, self.boost_timer))
+            earned = self.calculate_production() / FPS * segment
+            
+            # Auto-Clicks: erster nach (Intervall - Timer) Schritten, dann regelmäßig
+            if self.auto_clicker_active:
+                first = max(1, self.auto_click_interval - self.auto_click_timer)
+                if segment >= first:
+                    clicks = 1 + (segment - first) // self.auto_click_interval
+                    self.auto_click_timer = segment - first - (clicks - 1) * self.auto_click_interval
+                    earned += clicks * self.calculate_click_power()
+                    self.total_clicks += clicks
+                    last_click = ticks - remaining + first + (clicks - 1) * self.auto_click_interval
+                else:
+                    self.auto_click_timer += segment
+            
+            self.resources += earned
+            self.total_earned += earned
+            gained += earned
+            
+            if self.boost_active:
+                self.boost_timer -= segment
+                if self.boost_timer <= 0:
+                    self.boost_active = False
+            remaining -= segment
+        
+        if last_click is not None:
+            self.click_animation = max(0, 10 - (ticks - last_click))
+        else:
+            self.click_animation = max(0, self.click_animation - ticks)
+        if count_playtime:
+            self.stats['total_time_played'] += ticks / FPS
+        if self.resources > self.stats['highest_resources']:
+            self.stats['highest_resources'] = self.resources
+        self.update_era()
+        self.check_achievements()
+        return gained
+    
+    def simulate_hours(self, hours):
+        """Debug: Spielzeit vorspulen"""
+        gained = self.advance_time(int(hours * 3600 * FPS))
+        self.create_particles(SCREEN_WIDTH//2, SCREEN_HEIGHT//2, CYAN, 
+                             f"+{format_number(gained)} in {hours}h", 10)
+    
     def create_particles(self, x, y, color, text=None, count=10):
         """Erstelle Partikel-Effekte"""
         for _ in range(count):
             if text and _ == 0:
-                self.particles.append(Particle(x, y, color, text))
+                self.particles.emit(x, y, color, text)
             else:
-                self.particles.append(Particle(x, y, color))
+                self.particles.emit(x, y, color)
+    
+    def get_buy_amount(self, building, amount=None):
+        """Kaufmenge für ein Gebäude ('max' = so viele wie bezahlbar)"""
+        if amount is None:
+            amount = self.buy_amount
+        if amount == 'max':
+            return building.max_affordable(self.resources)
+        return amount
     
-    def buy_building(self, building):
-        """Kaufe ein Gebäude"""
-        cost = building.purchase(self.resources)
+    def buy_building(self, building, n=1):
+        """Kaufe n Gebäude (oder 'max') zum Preis der geometrischen Reihe"""
+        n = self.get_buy_amount(building, n)
+        cost = building.purchase(self.resources, n)
         if cost > 0:
             self.resources -= cost
-            self.stats['total_buildings_purchased'] += 1
-            self.create_particles(600, 300, GREEN, f"{building.icon} +1", 5)
+            self.total_buildings += n
+            self.stats['total_buildings_purchased'] += n
+            self.invalidate_multipliers()
+            self.create_particles(600, 300, GREEN, f"{building.icon} +{n}", 5)
     
     def buy_upgrade(self, upgrade):
         """Kaufe ein Upgrade"""
@@ -577,6 +1172,7 @@ class Game:
             self.resources -= upgrade.cost
             upgrade.purchase()
             self.stats['total_upgrades_purchased'] += 1
+            self.invalidate_multipliers()
             self.create_particles(600, 300, GOLD, f"{upgrade.icon} Upgrade!", 10)
     
     def activate_boost(self):
@@ -593,21 +1189,22 @@ class Game:
             return
         
         # Berechne Prestige-Punkte basierend auf gesamt verdienten Ressourcen
-        new_points = int(math.sqrt(self.total_earned / 1000000))
+        new_points = self.calculate_prestige_points()
         
         if new_points > 0:
             # Speichere Statistiken
             self.stats['prestiges'] += 1
             
             # Reset
-            self.resources = 0
-            self.total_earned = 0
+            self.resources = BigNum()
+            self.total_earned = BigNum()
             self.current_era = 0
             
             # Reset Gebäude
             for building in self.buildings:
                 building.count = 0
                 building.unlocked = (building.era == 0)
+            self.total_buildings = 0
             
             # Reset Upgrades
             for upgrade in self.upgrades:
@@ -616,64 +1213,86 @@ class Game:
             
             # Füge Prestige-Punkte hinzu
             self.prestige_points += new_points
-            self.prestige_multiplier = 1.0 + (self.prestige_points * 0.1)
+            self.prestige_multiplier = prestige_multiplier_for(self.prestige_points)
+            self.invalidate_multipliers()
             
             self.create_particles(SCREEN_WIDTH//2, SCREEN_HEIGHT//2, PURPLE, 
-                                 f"+{new_points} Prestige!", 30)
+                                 f"+{format_number(new_points)} Prestige!", 30)
             self.state = 'playing'
     
+    def calculate_prestige_points(self):
+        """Prestige-Punkte für die aktuelle Runde (Wurzel aus Millionen)"""
+        return (BigNum.of(self.total_earned) / 1000000).sqrt().floor()
+    
     def check_achievements(self):
-        """Prüfe alle Achievements"""
-        game_state = {
-            'total_earned': self.total_earned,
-            'total_clicks': self.total_clicks,
-            'total_buildings': sum(b.count for b in self.buildings),
-            'current_era': self.current_era
-        }
-        
-        for achievement in self.achievements:
-            if achievement.check(game_state) and not achievement.unlocked:
-                achievement.unlocked = True
-                self.prestige_points += achievement.reward
-                self.create_particles(SCREEN_WIDTH//2, 200, GOLD, 
-                                     f"Achievement: {achievement.name}!", 20)
+        """Prüfe Achievements (nur die jeweils nächste Schwelle)"""
+        index = self.achievement_index
+        next_threshold = index.next_threshold
+        reached = []
+        for metric, value in (('resources', self.total_earned),
+                              ('clicks', self.total_clicks),
+                              ('buildings', self.total_buildings),
+                              ('era', self.current_era)):
+            threshold = next_threshold.get(metric)
+            if threshold is not None and value >= threshold:
+                reached += index.advance(metric, value)
+        
+        for achievement in reached:
+            achievement.unlocked = True
+            self.prestige_points += achievement.reward
+            self.create_particles(SCREEN_WIDTH//2, 200, GOLD, 
+                                 f"Achievement: {achievement.name}!", 20)
     
     def save_game(self):
-        """Speichere Spielstand"""
-        save_data = {
-            'resources': self.resources,
-            'total_earned': self.total_earned,
+        """Speichere Spielstand (Schreiben erledigt der Hintergrund-Thread)"""
+        if self.save_writer.last_error:
+            print(f"Fehler beim Speichern: {self.save_writer.last_error}")
+            self.save_writer.last_error = None
+        self.save_writer.submit(self.create_save_data())
+        self.create_particles(SCREEN_WIDTH//2, 50, GREEN, "Spiel gespeichert!", 10)
+    
+    def create_save_data(self):
+        """Momentaufnahme des Spielstands (nur Kopien, schnell im Spiel-Thread)"""
+        return {
+            'resources': self.resources.to_json(),
+            'total_earned': self.total_earned.to_json(),
             'total_clicks': self.total_clicks,
             'current_era': self.current_era,
-            'prestige_points': self.prestige_points,
-            'prestige_multiplier': self.prestige_multiplier,
+            'prestige_points': self.prestige_points.to_json(),
+            'prestige_multiplier': self.prestige_multiplier.to_json(),
             'buildings': [(b.count, b.unlocked) for b in self.buildings],
             'upgrades': [(u.purchased, u.unlocked) for u in self.upgrades],
             'achievements': [a.unlocked for a in self.achievements],
-            'stats': self.stats,
+            'stats': dict(self.stats, highest_resources=self.stats['highest_resources'].to_json()),
             'last_save_time': time.time()
         }
-        
-        with open('evolution_clicker_save.json', 'w') as f:
-            json.dump(save_data, f)
-        
-        self.create_particles(SCREEN_WIDTH//2, 50, GREEN, "Spiel gespeichert!", 10)
+    
+    def read_latest_save(self):
+        """Neuesten lesbaren Spielstand suchen (Hauptdatei, dann Backups)"""
+        self.save_writer.flush()
+        candidates = [SAVE_FILE] + [f"{SAVE_FILE}.{i}" for i in range(1, SAVE_BACKUPS + 1)]
+        for path in candidates:
+            if not os.path.exists(path):
+                continue
+            try:
+                return read_save_file(path)
+            except (OSError, ValueError) as e:
+                print(f"Spielstand defekt, versuche Backup: {e}")
+        return None
     
     def load_game(self):
         """Lade Spielstand"""
         try:
-            if not os.path.exists('evolution_clicker_save.json'):
+            save_data = self.read_latest_save()
+            if save_data is None:
                 return False
-                
-            with open('evolution_clicker_save.json', 'r') as f:
-                save_data = json.load(f)
             
-            self.resources = save_data['resources']
-            self.total_earned = save_data['total_earned']
+            self.resources = BigNum.of(save_data['resources'])
+            self.total_earned = BigNum.of(save_data['total_earned'])
             self.total_clicks = save_data['total_clicks']
             self.current_era = save_data['current_era']
-            self.prestige_points = save_data['prestige_points']
-            self.prestige_multiplier = save_data['prestige_multiplier']
+            self.prestige_points = BigNum.of(save_data['prestige_points'])
+            self.prestige_multiplier = BigNum.of(save_data['prestige_multiplier'])
             
             for i, (count, unlocked) in enumerate(save_data['buildings']):
                 self.buildings[i].count = count
@@ -685,15 +1304,17 @@ class Game:
             
             for i, unlocked in enumerate(save_data['achievements']):
                 self.achievements[i].unlocked = unlocked
+            self.achievement_index = AchievementIndex(self.achievements)
+            self.total_buildings = sum(b.count for b in self.buildings)
             
             self.stats = save_data['stats']
+            self.stats['highest_resources'] = BigNum.of(self.stats['highest_resources'])
+            self.invalidate_multipliers()
             
             # Berechne Offline-Fortschritt
-            time_passed = time.time() - save_data['last_save_time']
-            offline_production = self.calculate_production() * time_passed
+            time_passed = max(0, time.time() - save_data['last_save_time'])
+            offline_production = self.advance_time(int(time_passed * FPS), count_playtime=False)
             if offline_production > 0:
-                self.resources += offline_production
-                self.total_earned += offline_production
                 self.create_particles(SCREEN_WIDTH//2, SCREEN_HEIGHT//2, GREEN, 
                                      f"Offline-Produktion: {format_number(offline_production)}", 20)
             
@@ -728,6 +1349,13 @@ class Game:
                 elif event.key == pygame.K_p:
                     if self.total_earned >= 1000000:
                         self.state = 'prestige'
+                
+                elif event.key == pygame.K_F8:
+                    self.toggle_render_mode()
+                
+                elif event.key == pygame.K_F9:
+                    if self.state == 'playing':
+                        self.simulate_hours(1)
             
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Linksklick
@@ -765,6 +1393,12 @@ class Game:
         if self.click_area.collidepoint(pos):
             self.click_resource()
         
+        # Kaufmenge wählen (x1/x10/x100/max)
+        for i, amount in enumerate(BUY_AMOUNTS):
+            if self.buy_amount_rect(i).collidepoint(pos):
+                self.buy_amount = amount
+                return
+        
         # Gebäude kaufen (Rechte Seite)
         building_start_y = 150 - self.scroll_offset
         for i, building in enumerate(self.buildings):
@@ -773,7 +1407,7 @@ class Game:
             
             building_rect = pygame.Rect(900, building_start_y + i * 70, 450, 60)
             if building_rect.collidepoint(pos):
-                self.buy_building(building)
+                self.buy_building(building, self.buy_amount)
         
         # Upgrades kaufen (Unten)
         upgrade_x = 50
@@ -797,6 +1431,10 @@ class Game:
         if pygame.Rect(270, 10, 120, 40).collidepoint(pos):
             self.activate_boost()
     
+    def buy_amount_rect(self, index):
+        """Position der Kaufmengen-Buttons in der Gebäude-Kopfzeile"""
+        return pygame.Rect(1000 + index * 85, 88, 75, 30)
+    
     def handle_prestige_click(self, pos):
         """Behandle Prestige-Klicks"""
         # Prestige bestätigen
@@ -810,9 +1448,7 @@ class Game:
         """Update-Logik"""
         if self.state != 'playing':
             # Partikel auch in anderen States updaten
-            self.particles = [p for p in self.particles if p.is_alive()]
-            for p in self.particles:
-                p.update()
+            self.particles.update()
             return
         
         # Produktion pro Frame (60 FPS = 1 Sekunde)
@@ -836,9 +1472,7 @@ class Game:
         self.check_achievements()
         
         # Partikel updaten
-        self.particles = [p for p in self.particles if p.is_alive()]
-        for p in self.particles:
-            p.update()
+        self.particles.update()
         
         # Click-Animation
         if self.click_animation > 0:
@@ -878,8 +1512,7 @@ class Game:
             self.draw_prestige()
         
         # Partikel immer zeichnen
-        for p in self.particles:
-            p.draw(self.screen, self.font_medium)
+        self.particles.draw(self.screen)
         
         pygame.display.flip()
     
@@ -931,59 +1564,192 @@ class Game:
             self.screen.blit(text, text_rect)
             y += 25
     
-    def draw_game(self):
-        """Zeichne Spielbildschirm"""
-        era_color = self.eras[self.current_era]['color']
+    def render_text(self, font, text, color):
+        """Text rendern - gleiche Texte kommen aus dem Cache"""
+        key = (id(font), text, color)
+        surf = self.text_cache.get(key)
+        if surf is None:
+            if len(self.text_cache) > 256:
+                self.text_cache.clear()
+            surf = font.render(text, True, color)
+            self.text_cache[key] = surf
+        return surf
+    
+    def cached_layer(self, name, key, size, render, alpha=True):
+        """Vorgerenderte Ebene; wird nur neu gezeichnet, wenn sich `key` ändert"""
+        cached = self.layer_cache.get(name)
+        if cached and cached[0] == key:
+            return cached[1]
+        surface = pygame.Surface(size, pygame.SRCALPHA) if alpha else pygame.Surface(size)
+        render(surface)
+        self.layer_cache[name] = (key, surface)
+        return surface
+    
+    def render_game_background(self, surface):
+        """Statischer Hintergrund: Leisten, Panels, Titel (ändert sich nur mit der Era)"""
+        era = self.eras[self.current_era]
+        era_color = era['color']
+        surface.fill(BLACK)
         
         # Obere Leiste
-        pygame.draw.rect(self.screen, DARK_GRAY, (0, 0, SCREEN_WIDTH, 60))
+        pygame.draw.rect(surface, DARK_GRAY, (0, 0, SCREEN_WIDTH, 60))
         
         # Buttons
         btn_y = 10
-        pygame.draw.rect(self.screen, BLUE, (10, btn_y, 120, 40), border_radius=5)
-        pygame.draw.rect(self.screen, WHITE, (10, btn_y, 120, 40), 2, border_radius=5)
+        pygame.draw.rect(surface, BLUE, (10, btn_y, 120, 40), border_radius=5)
+        pygame.draw.rect(surface, WHITE, (10, btn_y, 120, 40), 2, border_radius=5)
         text = self.font_small.render("Achievements", True, WHITE)
-        self.screen.blit(text, (20, btn_y + 10))
+        surface.blit(text, (20, btn_y + 10))
         
-        pygame.draw.rect(self.screen, GREEN, (140, btn_y, 120, 40), border_radius=5)
-        pygame.draw.rect(self.screen, WHITE, (140, btn_y, 120, 40), 2, border_radius=5)
+        pygame.draw.rect(surface, GREEN, (140, btn_y, 120, 40), border_radius=5)
+        pygame.draw.rect(surface, WHITE, (140, btn_y, 120, 40), 2, border_radius=5)
         text = self.font_small.render("Statistiken", True, WHITE)
-        self.screen.blit(text, (150, btn_y + 10))
+        surface.blit(text, (150, btn_y + 10))
+        
+        # Era-Anzeige
+        era_text = self.font_medium.render(f"{era['icon']} {era['name']}", True, era_color)
+        era_rect = era_text.get_rect(topright=(SCREEN_WIDTH - 20, 15))
+        surface.blit(era_text, era_rect)
+        
+        # Linke Seite - Klickbereich
+        pygame.draw.rect(surface, DARK_GRAY, (50, 80, 400, 600), border_radius=10)
+        pygame.draw.rect(surface, era_color, (50, 80, 400, 600), 3, border_radius=10)
+        
+        # Era-Name groß
+        era_name = self.font_large.render(era['name'], True, era_color)
+        era_name_rect = era_name.get_rect(center=(250, 120))
+        surface.blit(era_name, era_name_rect)
+        
+        # Rechte Seite - Gebäude
+        pygame.draw.rect(surface, DARK_GRAY, (480, 80, 880, 470), border_radius=10)
+        pygame.draw.rect(surface, era_color, (480, 80, 880, 470), 3, border_radius=10)
+        buildings_title = self.font_medium.render("GEBÄUDE", True, GOLD)
+        surface.blit(buildings_title, (700, 90))
+        
+        # Upgrade-Bereich
+        pygame.draw.rect(surface, DARK_GRAY, (50, SCREEN_HEIGHT - 140, 
+                                              SCREEN_WIDTH - 100, 130), border_radius=10)
+        pygame.draw.rect(surface, PURPLE, (50, SCREEN_HEIGHT - 140, 
+                                           SCREEN_WIDTH - 100, 130), 3, border_radius=10)
+        upgrades_title = self.font_medium.render("UPGRADES", True, PURPLE)
+        surface.blit(upgrades_title, (60, SCREEN_HEIGHT - 135))
+    
+    def render_shop(self, surface, rows):
+        """Gebäude-Liste und Kaufmengen-Buttons (Ebene beginnt bei 480/80)"""
+        ox, oy = 480, 80
+        for building, y, amount, cost, can_afford, hover in rows:
+            rect = pygame.Rect(500 - ox, y - oy, 820, 60)
+            y -= oy
+            
+            # Hintergrund
+            bg_color = DARK_GREEN if can_afford else DARK_BLUE
+            if hover:
+                bg_color = tuple(min(255, c + 30) for c in bg_color)
+            
+            pygame.draw.rect(surface, bg_color, rect, border_radius=5)
+            pygame.draw.rect(surface, WHITE if can_afford else GRAY, rect, 2, border_radius=5)
+            
+            # Icon
+            icon_text = self.font_large.render(building.icon, True, WHITE)
+            surface.blit(icon_text, (510 - ox, y + 10))
+            
+            # Name und Anzahl
+            name_text = self.font_medium.render(f"{building.name} ({building.count})", True, WHITE)
+            surface.blit(name_text, (560 - ox, y + 5))
+            
+            # Kosten und Produktion
+            cost_label = f"Kosten: {format_number(cost)}"
+            if amount > 1:
+                cost_label += f" (x{amount})"
+            cost_text = self.font_small.render(cost_label, True, GOLD if can_afford else GRAY)
+            prod_text = self.font_small.render(f"+{format_number(building.base_production)}/s", 
+                                              True, GREEN)
+            surface.blit(cost_text, (560 - ox, y + 35))
+            surface.blit(prod_text, (750 - ox, y + 35))
+            
+            # Gesamt-Produktion
+            if building.count > 0:
+                total_text = self.font_small.render(
+                    f"Gesamt: {format_number(building.get_production())}/s", 
+                    True, CYAN)
+                total_rect = total_text.get_rect(right=1310 - ox, centery=y + 30)
+                surface.blit(total_text, total_rect)
+        
+        # Kaufmengen-Buttons
+        for i, amount in enumerate(BUY_AMOUNTS):
+            rect = self.buy_amount_rect(i).move(-ox, -oy)
+            selected = amount == self.buy_amount
+            pygame.draw.rect(surface, GOLD if selected else DARK_BLUE, rect, border_radius=5)
+            pygame.draw.rect(surface, WHITE, rect, 2, border_radius=5)
+            label = "MAX" if amount == 'max' else f"x{amount}"
+            text = self.font_small.render(label, True, BLACK if selected else WHITE)
+            surface.blit(text, text.get_rect(center=rect.center))
+    
+    def render_upgrades(self, surface, items):
+        """Upgrade-Leiste (Ebene beginnt bei 50/SCREEN_HEIGHT-140)"""
+        ox, oy = 50, SCREEN_HEIGHT - 140
+        upgrade_y = SCREEN_HEIGHT - 120 - oy
+        for x, upgrade, can_afford, hover in items:
+            x -= ox
+            rect = pygame.Rect(x, upgrade_y, 110, 90)
+            
+            # Hintergrund
+            bg_color = DARK_GREEN if can_afford else DARK_BLUE
+            if hover:
+                bg_color = tuple(min(255, c + 30) for c in bg_color)
+            
+            pygame.draw.rect(surface, bg_color, rect, border_radius=5)
+            pygame.draw.rect(surface, GOLD if can_afford else GRAY, rect, 3, border_radius=5)
+            
+            # Icon
+            icon_text = self.font_large.render(upgrade.icon, True, WHITE)
+            icon_rect = icon_text.get_rect(center=(x + 55, upgrade_y + 25))
+            surface.blit(icon_text, icon_rect)
+            
+            # Multiplikator
+            mult_text = self.font_small.render(f"x{upgrade.multiplier:g}", True, YELLOW)
+            mult_rect = mult_text.get_rect(center=(x + 55, upgrade_y + 55))
+            surface.blit(mult_text, mult_rect)
+            
+            # Kosten
+            cost_text = self.font_tiny.render(format_number(upgrade.cost), True, GOLD if can_afford else GRAY)
+            cost_rect = cost_text.get_rect(center=(x + 55, upgrade_y + 75))
+            surface.blit(cost_text, cost_rect)
+    
+    def draw_game(self):
+        """Zeichne Spielbildschirm
+        
+        Hintergrund, Gebäude-Liste und Upgrade-Leiste sind zwischengespeicherte
+        Ebenen; sie werden nur neu gezeichnet, wenn sich Era, Anzahlen,
+        Bezahlbarkeit, Scroll-Position oder Hover ändern.
+        """
+        era_color = self.eras[self.current_era]['color']
+        mouse_pos = pygame.mouse.get_pos()
         
+        background = self.cached_layer('background', self.current_era,
+                                       (SCREEN_WIDTH, SCREEN_HEIGHT),
+                                       self.render_game_background, alpha=False)
+        self.screen.blit(background, (0, 0))
+        
+        # Boost-Button
+        btn_y = 10
         boost_color = GOLD if self.boost_active else GRAY
         pygame.draw.rect(self.screen, boost_color, (270, btn_y, 120, 40), border_radius=5)
         pygame.draw.rect(self.screen, WHITE, (270, btn_y, 120, 40), 2, border_radius=5)
-        boost_text = f"Boost ({self.prestige_points}P)"
+        boost_text = f"Boost ({format_number(self.prestige_points)}P)"
         if self.boost_active:
             boost_text = f"AKTIV {self.boost_timer//60}s"
-        text = self.font_small.render(boost_text, True, WHITE)
-        self.screen.blit(text, (280, btn_y + 10))
+        self.screen.blit(self.render_text(self.font_small, boost_text, WHITE), (280, btn_y + 10))
         
         # Ressourcen-Anzeige
         res_text = self.font_large.render(format_number(self.resources), True, GOLD)
         res_rect = res_text.get_rect(center=(SCREEN_WIDTH//2, 30))
         self.screen.blit(res_text, res_rect)
         
-        # Era-Anzeige
-        era_text = self.font_medium.render(
-            f"{self.eras[self.current_era]['icon']} {self.eras[self.current_era]['name']}", 
-            True, era_color)
-        era_rect = era_text.get_rect(topright=(SCREEN_WIDTH - 20, 15))
-        self.screen.blit(era_text, era_rect)
-        
-        # Linke Seite - Klickbereich
-        pygame.draw.rect(self.screen, DARK_GRAY, (50, 80, 400, 600), border_radius=10)
-        pygame.draw.rect(self.screen, era_color, (50, 80, 400, 600), 3, border_radius=10)
-        
-        # Era-Name groß
-        era_name = self.font_large.render(self.eras[self.current_era]['name'], True, era_color)
-        era_name_rect = era_name.get_rect(center=(250, 120))
-        self.screen.blit(era_name, era_name_rect)
-        
         # Klickbarer Bereich
         scale = 1.0 + (self.click_animation / 100)
         icon_size = int(150 * scale)
-        icon_text = self.font_huge.render(self.eras[self.current_era]['icon'], True, era_color)
+        icon_text = self.render_text(self.font_huge, self.eras[self.current_era]['icon'], era_color)
         icon_rect = icon_text.get_rect(center=self.click_area.center)
         
         # Glow-Effekt bei Klick
@@ -1005,140 +1771,71 @@ class Game:
             f"Pro Sekunde: {format_number(self.production_per_second)}",
             f"Gesamt verdient: {format_number(self.total_earned)}",
             f"Prestige: x{self.prestige_multiplier:.1f}",
-            f"Prestige-Punkte: {self.prestige_points}"
+            f"Prestige-Punkte: {format_number(self.prestige_points)}"
         ]
         
         for i, stat in enumerate(stats):
-            text = self.font_small.render(stat, True, WHITE)
+            text = self.render_text(self.font_small, stat, WHITE)
             text_rect = text.get_rect(center=(250, stats_y + i * 30))
             self.screen.blit(text, text_rect)
         
-        # Rechte Seite - Gebäude
-        pygame.draw.rect(self.screen, DARK_GRAY, (480, 80, 880, 470), border_radius=10)
-        pygame.draw.rect(self.screen, era_color, (480, 80, 880, 470), 3, border_radius=10)
-        
-        # Gebäude-Titel
-        buildings_title = self.font_medium.render("GEBÄUDE", True, GOLD)
-        self.screen.blit(buildings_title, (700, 90))
-        
-        # Scrollbare Gebäude-Liste
+        # Scrollbare Gebäude-Liste (nur sichtbare Zeilen kommen in die Ebene)
         building_start_y = 150
         visible_buildings = 0
-        mouse_pos = pygame.mouse.get_pos()
-        
-        for i, building in enumerate(self.buildings):
+        rows = []
+        for building in self.buildings:
             if not building.unlocked:
                 continue
             
             y = building_start_y + visible_buildings * 70 - self.scroll_offset
+            visible_buildings += 1
             
             # Nur zeichnen wenn sichtbar
             if y < 80 or y > 520:
-                visible_buildings += 1
                 continue
             
-            rect = pygame.Rect(500, y, 820, 60)
-            can_afford = self.resources >= building.get_cost()
-            
-            # Hover-Effekt
-            hover = rect.collidepoint(mouse_pos)
-            
-            # Hintergrund
-            bg_color = DARK_GREEN if can_afford else DARK_BLUE
-            if hover:
-                bg_color = tuple(min(255, c + 30) for c in bg_color)
-            
-            pygame.draw.rect(self.screen, bg_color, rect, border_radius=5)
-            pygame.draw.rect(self.screen, WHITE if can_afford else GRAY, rect, 2, border_radius=5)
-            
-            # Icon
-            icon_text = self.font_large.render(building.icon, True, WHITE)
-            self.screen.blit(icon_text, (510, y + 10))
-            
-            # Name und Anzahl
-            name_text = self.font_medium.render(f"{building.name} ({building.count})", True, WHITE)
-            self.screen.blit(name_text, (560, y + 5))
-            
-            # Kosten und Produktion
-            cost_text = self.font_small.render(f"Kosten: {format_number(building.get_cost())}", 
-                                              True, GOLD if can_afford else GRAY)
-            prod_text = self.font_small.render(f"+{format_number(building.base_production)}/s", 
-                                              True, GREEN)
-            self.screen.blit(cost_text, (560, y + 35))
-            self.screen.blit(prod_text, (750, y + 35))
-            
-            # Gesamt-Produktion
-            if building.count > 0:
-                total_text = self.font_small.render(
-                    f"Gesamt: {format_number(building.get_production())}/s", 
-                    True, CYAN)
-                total_rect = total_text.get_rect(right=1310, centery=y + 30)
-                self.screen.blit(total_text, total_rect)
-            
-            visible_buildings += 1
+            amount = max(1, self.get_buy_amount(building))
+            cost = building.cost_of(amount)
+            hover = pygame.Rect(500, y, 820, 60).collidepoint(mouse_pos)
+            rows.append((building, y, amount, cost, self.resources >= cost, hover))
         
         # Berechne max scroll
         self.max_scroll = max(0, visible_buildings * 70 - 370)
         
-        # Upgrade-Bereich
-        pygame.draw.rect(self.screen, DARK_GRAY, (50, SCREEN_HEIGHT - 140, 
-                                                   SCREEN_WIDTH - 100, 130), border_radius=10)
-        pygame.draw.rect(self.screen, PURPLE, (50, SCREEN_HEIGHT - 140, 
-                                                SCREEN_WIDTH - 100, 130), 3, border_radius=10)
+        shop_key = (self.buy_amount, self.scroll_offset,
+                    tuple((id(b), b.count, amount, can_afford, hover)
+                          for b, _, amount, _, can_afford, hover in rows))
+        shop = self.cached_layer('shop', shop_key, (880, 520),
+                                 lambda surface: self.render_shop(surface, rows))
+        self.screen.blit(shop, (480, 80))
         
-        # Upgrades-Titel
-        upgrades_title = self.font_medium.render("UPGRADES", True, PURPLE)
-        self.screen.blit(upgrades_title, (60, SCREEN_HEIGHT - 135))
-        
-        # Upgrades zeichnen
+        # Upgrades (max. 10 sichtbar)
         upgrade_x = 60
         upgrade_y = SCREEN_HEIGHT - 120
-        drawn_upgrades = 0
-        
+        items = []
         for upgrade in self.upgrades:
             if not upgrade.unlocked or upgrade.purchased:
                 continue
             
-            if drawn_upgrades >= 10:  # Max 10 Upgrades anzeigen
+            if len(items) >= 10:  # Max 10 Upgrades anzeigen
                 break
             
-            x = upgrade_x + drawn_upgrades * 120
-            rect = pygame.Rect(x, upgrade_y, 110, 90)
-            can_afford = self.resources >= upgrade.cost
-            
-            hover = rect.collidepoint(mouse_pos)
-            
-            # Hintergrund
-            bg_color = DARK_GREEN if can_afford else DARK_BLUE
-            if hover:
-                bg_color = tuple(min(255, c + 30) for c in bg_color)
-            
-            pygame.draw.rect(self.screen, bg_color, rect, border_radius=5)
-            pygame.draw.rect(self.screen, GOLD if can_afford else GRAY, rect, 3, border_radius=5)
-            
-            # Icon
-            icon_text = self.font_large.render(upgrade.icon, True, WHITE)
-            icon_rect = icon_text.get_rect(center=(x + 55, upgrade_y + 25))
-            self.screen.blit(icon_text, icon_rect)
-            
-            # Multiplikator
-            mult_text = self.font_small.render(f"x{upgrade.multiplier}", True, YELLOW)
-            mult_rect = mult_text.get_rect(center=(x + 55, upgrade_y + 55))
-            self.screen.blit(mult_text, mult_rect)
-            
-            # Kosten
-            cost_text = self.font_tiny.render(format_number(upgrade.cost), True, GOLD if can_afford else GRAY)
-            cost_rect = cost_text.get_rect(center=(x + 55, upgrade_y + 75))
-            self.screen.blit(cost_text, cost_rect)
-            
-            drawn_upgrades += 1
+            x = upgrade_x + len(items) * 120
+            hover = pygame.Rect(x, upgrade_y, 110, 90).collidepoint(mouse_pos)
+            items.append((x, upgrade, self.resources >= upgrade.cost, hover))
+        
+        upgrades_key = tuple((id(u), can_afford, hover) for _, u, can_afford, hover in items)
+        upgrades = self.cached_layer('upgrades', upgrades_key, (SCREEN_WIDTH - 100, 130),
+                                     lambda surface: self.render_upgrades(surface, items))
+        self.screen.blit(upgrades, (50, SCREEN_HEIGHT - 140))
         
         # Prestige-Hinweis
         if self.total_earned >= 1000000:
-            prestige_available = int(math.sqrt(self.total_earned / 1000000))
-            prestige_text = self.font_medium.render(
-                f"Prestige verfügbar! Drücke P (+{prestige_available} Punkte)", 
-                True, PURPLE)
+            prestige_available = self.calculate_prestige_points()
+            prestige_text = self.render_text(
+                self.font_medium,
+                f"Prestige verfügbar! Drücke P (+{format_number(prestige_available)} Punkte)", 
+                PURPLE)
             prestige_rect = prestige_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 160))
             
             # Pulsierender Hintergrund
@@ -1238,7 +1935,7 @@ class Game:
             ("Spielzeit", f"{hours}h {minutes}m"),
             ("Aktuelle Era", self.eras[self.current_era]['name']),
             ("Prestige-Multiplikator", f"x{self.prestige_multiplier:.1f}"),
-            ("Prestige-Punkte", str(self.prestige_points))
+            ("Prestige-Punkte", format_number(self.prestige_points))
         ]
         
         y = 230
@@ -1278,12 +1975,12 @@ class Game:
         self.screen.blit(title, title_rect)
         
         # Info
-        new_points = int(math.sqrt(self.total_earned / 1000000))
+        new_points = self.calculate_prestige_points()
         
         info_lines = [
             "Prestige startet das Spiel neu, aber du erhältst:",
-            f"+{new_points} Prestige-Punkte",
-            f"Neuer Multiplikator: x{1.0 + ((self.prestige_points + new_points) * 0.1):.1f}",
+            f"+{format_number(new_points)} Prestige-Punkte",
+            f"Neuer Multiplikator: x{prestige_multiplier_for(self.prestige_points + new_points):.1f}",
             "",
             "Alle Gebäude und Upgrades werden zurückgesetzt!",
             "Achievements und Statistiken bleiben erhalten."
@@ -1324,22 +2021,59 @@ class Game:
         cancel_text_rect = cancel_text.get_rect(center=cancel_rect.center)
         self.screen.blit(cancel_text, cancel_text_rect)
     
+    def step_simulation(self, elapsed):
+        """Vergangene Echtzeit in feste Simulationsschritte umsetzen.
+        
+        Die Simulation läuft immer mit FPS Schritten pro Sekunde, egal wie
+        oft gezeichnet wird. Größere Rückstände (z.B. Fenster verschoben)
+        werden über advance_time nachgerechnet statt verworfen.
+        """
+        self.sim_accumulator += elapsed
+        ticks = int(self.sim_accumulator / SIM_DT)
+        self.sim_accumulator -= ticks * SIM_DT
+        
+        if ticks > MAX_CATCHUP_TICKS:
+            if self.state == 'playing':
+                self.advance_time(ticks - MAX_CATCHUP_TICKS)
+            ticks = MAX_CATCHUP_TICKS
+        for _ in range(ticks):
+            self.update()
+    
+    def toggle_render_mode(self):
+        """Bildrate wechseln (ändert nichts an der Simulation)"""
+        index = (RENDER_MODES.index(self.render_fps) + 1) % len(RENDER_MODES)
+        self.render_fps = RENDER_MODES[index]
+        label = f"{self.render_fps} FPS" if self.render_fps else "unbegrenzt"
+        self.create_particles(SCREEN_WIDTH//2, 50, CYAN, f"Bildrate: {label}", 5)
+    
     def run(self):
         """Haupt-Spielschleife"""
+        previous = time.perf_counter()
         while self.running:
+            now = time.perf_counter()
+            elapsed, previous = now - previous, now
+            
             self.handle_events()
-            self.update()
+            self.step_simulation(elapsed)
             self.draw()
-            self.clock.tick(FPS)
+            self.clock.tick(self.render_fps)
         
         # Auto-Save beim Beenden
         if self.state == 'playing':
             self.save_game()
+        self.save_writer.flush()
         
         pygame.quit()
 
 
 # Spiel starten
 if __name__ == "__main__":
+    if "--content" in sys.argv:
+        try:
+            CONTENT_PATH = sys.argv[sys.argv.index("--content") + 1]
+            load_catalog(CONTENT_PATH)
+        except (IndexError, OSError, ValueError, KeyError) as e:
+            print(f"Inhalte konnten nicht geladen werden: {e}")
+            sys.exit(1)
     game = Game()
     game.run()
\ No newline at end of file